@@ -84,6 +84,8 @@ class Settings(BaseSettings):
     bibbi_allowed_extensions_str: str = ".xlsx,.xls"  # Only Excel for reseller data
     bibbi_upload_dir: str = "/tmp/bibbi_uploads"
     bibbi_concurrent_uploads: int = 4  # Max simultaneous file processing
+    # SQLite file that keeps product code → EAN matches across runs (unset = off)
+    bibbi_mapping_cache_path: Optional[str] = None
 
     # BIBBI Database Credentials (edckqdrbgtnnjfnshjfq.supabase.co)
     # Separate Supabase project for BIBBI Parfum SAS B2B reseller data
@@ -3,7 +3,7 @@ Sales data aggregator with filtering and pagination
 """
 
 from typing import Dict, List, Any, Optional
-from datetime import date, datetime
+from datetime import date
 from decimal import Decimal
 from supabase import Client
 
@@ -277,88 +277,33 @@ class SalesAggregator:
         start_date: Optional[date],
         end_date: Optional[date]
     ) -> List[Dict[str, Any]]:
-        """Get sales summary grouped by month"""
-
-        results = []
-
-        if channel in ('offline', 'all'):
-            # Offline monthly summary
-            query = self.supabase.table("sellout_entries2").select("*")
-            result = query.execute()
-
-            if result.data:
-                records = result.data
-
-                # Filter by date if provided
-                if start_date and end_date:
-                    filtered = []
-                    for r in records:
-                        if r.get('year') and r.get('month'):
-                            try:
-                                record_date = date(r['year'], r['month'], 1)
-                                if start_date <= record_date <= end_date:
-                                    filtered.append(r)
-                            except (ValueError, TypeError):
-                                continue
-                    records = filtered
-
-                # Group by month in Python
-                monthly = {}
-                for r in records:
-                    if r.get('year') and r.get('month'):
-                        key = (r['year'], r['month'])
-                        if key not in monthly:
-                            monthly[key] = {
-                                'period': date(r['year'], r['month'], 1).isoformat(),
-                                'revenue': 0.0,
-                                'units': 0,
-                                'transactions': 0,
-                                'channel': 'offline'
-                            }
-                        monthly[key]['revenue'] += float(r.get('sales_eur', 0) or 0)
-                        monthly[key]['units'] += int(r.get('quantity', 0) or 0)
-                        monthly[key]['transactions'] += 1
-
-                results.extend(sorted(monthly.values(), key=lambda x: x['period'], reverse=True))
-
-        if channel in ('online', 'all'):
-            # Online monthly summary
-            query = self.supabase.table("ecommerce_orders").select("*")
-
-            if start_date:
-                query = query.gte("order_date", start_date.isoformat())
-            if end_date:
-                query = query.lte("order_date", end_date.isoformat())
-
-            result = query.execute()
+        """
+        Get sales summary grouped by month
 
-            if result.data:
-                # Group by month in Python
-                monthly = {}
-                for r in result.data:
-                    order_date = r.get('order_date')
-                    if order_date:
-                        try:
-                            dt = datetime.fromisoformat(order_date.replace('Z', '+00:00'))
-                            period = date(dt.year, dt.month, 1).isoformat()
-
-                            if period not in monthly:
-                                monthly[period] = {
-                                    'period': period,
-                                    'revenue': 0.0,
-                                    'units': 0,
-                                    'transactions': 0,
-                                    'channel': 'online'
-                                }
-                            monthly[period]['revenue'] += float(r.get('sales_eur', 0) or 0)
-                            monthly[period]['units'] += int(r.get('quantity', 0) or 0)
-                            monthly[period]['transactions'] += 1
-                        except (ValueError, TypeError):
-                            continue
+        Both channels are aggregated server-side by the
+        get_monthly_sales_summary RPC (UNION ALL of the offline and online
+        GROUP BYs), so channel='all' costs a single round-trip.
+        """
 
-                results.extend(sorted(monthly.values(), key=lambda x: x['period'], reverse=True))
+        result = self.supabase.rpc(
+            'get_monthly_sales_summary',
+            {
+                'p_channel': channel,
+                'p_start_date': start_date.isoformat() if start_date else None,
+                'p_end_date': end_date.isoformat() if end_date else None
+            }
+        ).execute()
 
-        return results
+        return [
+            {
+                'period': r['period'],
+                'revenue': float(r.get('revenue', 0) or 0),
+                'units': int(r.get('units', 0) or 0),
+                'transactions': int(r.get('transactions', 0) or 0),
+                'channel': r['channel']
+            }
+            for r in (result.data or [])
+        ]
 
     def _get_product_summary(
         self,
@@ -12,6 +12,7 @@ Features:
 """
 
 import uuid
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, Optional, List
@@ -19,6 +20,11 @@ import openpyxl
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; stdlib json is a drop-in fallback
+    from json import loads as json_loads
+
 from app.core.bibbi import BibbιDB, BIBBI_TENANT_ID
 
 
@@ -188,10 +194,7 @@ class BibbιErrorReportService:
             sheet[f"A{row + 1}"] = "Error Summary by Type"
             sheet[f"A{row + 1}"].font = self.BOLD_FONT
 
-            error_types = {}
-            for error in errors:
-                error_type = error.get("error_type", "unknown")
-                error_types[error_type] = error_types.get(error_type, 0) + 1
+            error_types = Counter(error.get("error_type", "unknown") for error in errors)
 
             row += 2
             sheet[f"A{row}"] = "Error Type"
@@ -202,7 +205,8 @@ class BibbιErrorReportService:
             sheet[f"B{row}"].fill = self.HEADER_FILL
 
             row += 1
-            for error_type, count in sorted(error_types.items()):
+            # Most frequent error types first
+            for error_type, count in error_types.most_common():
                 sheet[f"A{row}"] = error_type
                 sheet[f"B{row}"] = count
                 sheet[f"A{row}"].fill = self.ERROR_FILL
@@ -285,9 +289,10 @@ class BibbιErrorReportService:
             report_path: Path to generated report or None if no errors
         """
         try:
-            # Get validation errors from staging record
+            # Project invalid_rows out of the JSONB blob server-side so the
+            # no-error case never has to look at the full error array
             result = self.db.table("sales_staging")\
-                .select("validation_errors, filename")\
+                .select("invalid_rows:validation_errors->invalid_rows, validation_errors, filename")\
                 .eq("staging_id", staging_id)\
                 .execute()
 
@@ -297,18 +302,24 @@ class BibbιErrorReportService:
 
             record = result.data[0]
             validation_errors = record.get("validation_errors")
+            # NULL when the blob is stored as text or has no invalid_rows key;
+            # the count is then read from the parsed blob as before
+            invalid_rows = record.get("invalid_rows")
 
-            if not validation_errors:
-                print(f"[BibbιErrorReport] No validation errors for: {staging_id}")
-                return None
+            if invalid_rows != 0:
+                if not validation_errors:
+                    print(f"[BibbιErrorReport] No validation errors for: {staging_id}")
+                    return None
+
+                # PostgREST returns JSONB as a dict; only legacy text rows need parsing
+                if isinstance(validation_errors, str):
+                    validation_errors = json_loads(validation_errors)
 
-            # Parse JSONB if needed
-            if isinstance(validation_errors, str):
-                import json
-                validation_errors = json.loads(validation_errors)
+                if invalid_rows is None:
+                    invalid_rows = validation_errors.get("invalid_rows", 0)
 
             # Check if there are actual errors
-            if validation_errors.get("invalid_rows", 0) == 0:
+            if invalid_rows == 0:
                 print(f"[BibbιErrorReport] No errors to report for: {staging_id}")
                 return None
 
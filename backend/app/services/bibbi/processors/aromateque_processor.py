@@ -1,11 +1,20 @@
 """Aromateque Processor - Living document with monthly additions"""
-from typing import List, Dict, Any, Optional
-from datetime import datetime
-from .base import BibbiBseProcessor
+from functools import lru_cache
+from operator import itemgetter
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple
+import pandas as pd
+from app.utils.frames import (
+    RowErrors, column, first_truthy, is_ean13, month_start, normalize_ean,
+    normalize_store, quarter, to_number, truncate_to_int, truthy
+)
+from .base import BibbiBseProcessor, QUARTER_BY_MONTH, normalize_store_identifier, month_fields
 
 class AromatequProcessor(BibbiBseProcessor):
     VENDOR_NAME = "aromateque"
     CURRENCY = "EUR"
+    VECTORIZED = True
+    # (headers, transform) last built by transform_row
+    _compiled_transformer: Optional[Tuple[Tuple[str, ...], Callable]] = None
 
     def get_vendor_name(self) -> str:
         return self.VENDOR_NAME
@@ -14,75 +23,154 @@ class AromatequProcessor(BibbiBseProcessor):
         return self.CURRENCY
 
     def extract_stores(self, file_path: str) -> List[Dict[str, Any]]:
-        stores = []
+        # The row path already collected the stores while streaming this file
+        if self._last_stores is not None and self._last_stores_file == file_path:
+            return self._last_stores or [self._main_store()]
         try:
-            wb = self._load_workbook(file_path)
-            sheet = wb[wb.sheetnames[0]]
-            headers = self._get_sheet_headers(sheet)
-            
-            store_idx = next((i for i, h in enumerate(headers) if "store" in h.lower() or "location" in h.lower()), None)
-            if store_idx:
-                seen = set()
-                for row in sheet.iter_rows(min_row=2, values_only=True):
-                    if not any(row): continue
-                    sv = row[store_idx] if store_idx < len(row) else None
-                    if sv and str(sv).strip() not in seen:
-                        s = str(sv).strip()
-                        seen.add(s)
-                        stores.append({
-                            "store_identifier": s.lower().replace(' ', '_'),
-                            "store_name": f"Aromateque {s}",
-                            "store_type": "online" if "online" in s.lower() else "physical",
-                            "reseller_id": self.reseller_id
-                        })
-            wb.close()
-            
-            if not stores:
-                stores = [{"store_identifier": "main", "store_name": "Aromateque Main", "store_type": "physical", "reseller_id": self.reseller_id}]
+            store = first_truthy(self._open(file_path), "Store", "Location")
+            return self.extract_stores_from_rows({"Store": s} for s in store[truthy(store)].unique()) or [self._main_store()]
         except:
-            stores = [{"store_identifier": "main", "store_name": "Aromateque Main", "store_type": "physical", "reseller_id": self.reseller_id}]
-        return stores
-
-    def extract_rows(self, file_path: str) -> List[Dict[str, Any]]:
-        wb = self._load_workbook(file_path)
-        sheet = wb[wb.sheetnames[0]]
-        headers = self._get_sheet_headers(sheet)
-        rows = [{h: row[i] if i < len(row) else None for i, h in enumerate(headers)} for row in sheet.iter_rows(min_row=2, values_only=True) if any(row)]
-        wb.close()
-        return rows
-
-    def transform_row(self, raw_row: Dict[str, Any], batch_id: str) -> Optional[Dict[str, Any]]:
-        t = self._create_base_row(batch_id)
-        
-        ean = raw_row.get("EAN") or raw_row.get("Brand")
-        if not ean: raise ValueError("Missing EAN/Brand")
-        try:
-            t["product_ean"] = self._validate_ean(ean)
-        except:
-            raise ValueError(f"Invalid EAN: {ean}")
-        
-        qty = raw_row.get("Quantity") or raw_row.get("Qty")
-        if qty is None: raise ValueError("Missing Quantity")
-        t["quantity"] = self._to_int(qty, "Quantity")
-        t["is_return"] = False
-        
-        sales = raw_row.get("Amount") or raw_row.get("Total")
-        if sales is None: raise ValueError("Missing Amount")
-        sales_eur = self._to_float(sales, "Amount")
-        t["sales_local_currency"] = sales_eur
-        t["sales_eur"] = sales_eur
-        
-        month, year = raw_row.get("Month"), raw_row.get("Year")
-        if month and year:
-            m, y = self._to_int(month, "Month"), self._to_int(year, "Year")
-            t["sale_date"], t["year"], t["month"], t["quarter"] = datetime(y, m, 1).date().isoformat(), y, m, self._calculate_quarter(m)
-        else:
-            now = datetime.utcnow()
-            t["sale_date"], t["year"], t["month"], t["quarter"] = now.date().isoformat(), now.year, now.month, self._calculate_quarter(now.month)
-        
-        store = raw_row.get("Store") or raw_row.get("Location")
-        t["store_identifier"] = str(store).strip().lower().replace(' ', '_') if store else "main"
-        return t
+            return [self._main_store()]
+
+    def store_from_row(self, raw_row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        # Same Store/Location lookup as transform_row
+        s = str(raw_row.get("Store") or raw_row.get("Location") or "").strip()
+        if not s: return None
+        identifier = normalize_store_identifier(s)
+        return {
+            "store_identifier": identifier,
+            "store_name": f"Aromateque {s}",
+            "store_type": "online" if "online" in identifier else "physical",
+            "reseller_id": self.reseller_id
+        }
+
+    def _main_store(self) -> Dict[str, Any]:
+        return {"store_identifier": "main", "store_name": "Aromateque Main", "store_type": "physical", "reseller_id": self.reseller_id}
+
+    def extract_rows(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        # Streams via calamine when installed, openpyxl read-only otherwise
+        return self._iter_sheet_dicts(file_path)
+
+    def transform_row(self, raw_row: Dict[str, Any], batch_id: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        # Expected data problems come back as (None, error) rather than raising
+        headers = tuple(raw_row)
+        compiled = self._compiled_transformer
+        if compiled is None or compiled[0] != headers:
+            compiled = self._compiled_transformer = (headers, self.compile_transformer(list(headers)))
+        return compiled[1](raw_row, batch_id)
+
+    def compile_transformer(self, headers: List[str]) -> Callable[[Dict[str, Any], str], Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+        """transform_row with this file's column fallbacks resolved up front"""
+        ean_of, qty_of, amount_of = _getter(headers, "EAN", "Brand"), _getter(headers, "Quantity", "Qty"), _getter(headers, "Amount", "Total")
+        month_of, year_of, store_of = _getter(headers, "Month"), _getter(headers, "Year"), _getter(headers, "Store", "Location")
+        create_base_row, validate_ean, to_int, to_float = self._create_base_row, self._validate_ean, self._to_int, self._to_float
+
+        def transform(raw_row: Dict[str, Any], batch_id: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+            ean = ean_of(raw_row)
+            if not ean: return None, "Missing EAN/Brand"
+            product_ean = validate_ean(ean, strict=False)
+            if not product_ean: return None, f"Invalid EAN: {ean}"
+
+            qty = qty_of(raw_row)
+            if qty is None: return None, "Missing Quantity"
+            quantity = to_int(qty, "Quantity")
+
+            sales = amount_of(raw_row)
+            if sales is None: return None, "Missing Amount"
+
+            t = create_base_row(batch_id)
+            t["product_ean"] = product_ean
+            t["quantity"] = quantity
+            t["is_return"] = False
+            sales_eur = to_float(sales, "Amount")
+            t["sales_local_currency"] = sales_eur
+            t["sales_eur"] = sales_eur
+
+            month, year = month_of(raw_row), year_of(raw_row)
+            if month and year:
+                t["sale_date"], t["year"], t["month"], t["quarter"] = month_fields(to_int(year, "Year"), to_int(month, "Month"))
+            else:
+                # Undated rows fall back to the batch's created_at date (one timestamp per batch)
+                t["sale_date"], t["year"], t["month"], t["quarter"] = _day_fields(t["created_at"][:10])
+
+            store = store_of(raw_row)
+            t["store_identifier"] = normalize_store_identifier(store) if store else "main"
+            return t, None
+
+        return transform
+
+    # ------------------------------------------------------------------
+    # Vectorized path: same rules as transform_row, applied per column
+    # ------------------------------------------------------------------
+
+    def transform_dataframe(self, df, batch_id: str) -> Tuple[Dict[str, List[Any]], List[Dict[str, Any]]]:
+        """Transform a raw frame to sales_unified columns; returns (field -> values, errors)"""
+        errors = RowErrors(df.index)
+
+        ean_raw = first_truthy(df, "EAN", "Brand")
+        ean = normalize_ean(ean_raw)
+        errors.add(~truthy(ean_raw), "Missing EAN/Brand")
+        errors.add(~is_ean13(ean), "Invalid EAN: " + ean_raw.astype(str))
+
+        qty_raw = first_truthy(df, "Quantity", "Qty")
+        qty = to_number(qty_raw)
+        errors.add(qty_raw.isna(), "Missing Quantity")
+        errors.add(qty.isna(), "Invalid integer for Quantity: " + qty_raw.astype(str))
+
+        amount_raw = first_truthy(df, "Amount", "Total")
+        amount = to_number(amount_raw).where(amount_raw != "", 0.0)
+        errors.add(amount_raw.isna(), "Missing Amount")
+        errors.add(amount.isna(), "Invalid float for Amount: " + amount_raw.astype(str))
+
+        # transform_row converts Year before Month, then datetime() checks year before month
+        month_raw, year_raw = column(df, "Month"), column(df, "Year")
+        dated = truthy(month_raw) & truthy(year_raw)
+        month_num, year_num = to_number(month_raw), to_number(year_raw)
+        errors.add(dated & year_num.isna(), "Invalid integer for Year: " + year_raw.astype(str))
+        errors.add(dated & month_num.isna(), "Invalid integer for Month: " + month_raw.astype(str))
+        month, year = truncate_to_int(month_num), truncate_to_int(year_num)
+        errors.add(dated & ~year.between(1, 9999), "year " + year.astype(str) + " is out of range")
+        errors.add(dated & ~month.between(1, 12), "month must be in 1..12")
+
+        ok = errors.ok
+        sales_local = amount[ok].astype("float64")
+        sales_eur = self._convert_eur_column(sales_local)
+        # Undated rows fall back to the batch's created_at date, as in transform_row
+        today, this_year, this_month, _ = _day_fields(self._create_base_row(batch_id)["created_at"][:10])
+        month = month.where(dated, this_month)[ok]
+        year = year.where(dated, this_year)[ok]
+
+        out = pd.DataFrame({
+            "product_ean": ean[ok],
+            "quantity": truncate_to_int(qty)[ok],
+            "is_return": False,
+            "sales_local_currency": sales_local,
+            "sales_eur": sales_eur,
+            "sale_date": month_start(year, month).where(dated[ok], today),
+            "year": year,
+            "month": month,
+            "quarter": quarter(month),
+            "store_identifier": normalize_store(first_truthy(df, "Store", "Location"), "main")[ok],
+        })
+        return self._frame_output(df, out, errors, batch_id)
+
+@lru_cache(maxsize=16)
+def _day_fields(iso_date: str) -> Tuple[str, int, int, int]:
+    y, m = int(iso_date[:4]), int(iso_date[5:7])
+    return iso_date, y, m, QUARTER_BY_MONTH[m]
+
+def _getter(headers: List[str], *names: str) -> Callable[[Dict[str, Any]], Any]:
+    # Row-wise `row.get(a) or row.get(b)`, keeping only the columns this file has
+    present = [n for n in names if n in headers]
+    if not present:
+        return lambda row: None
+    if len(names) == 1:
+        return itemgetter(present[0])
+    if len(present) == 1:
+        name = present[0]
+        return lambda row: row[name] or None
+    a, b = present
+    return lambda row: row[a] or row[b]
 
 def get_aromateque_processor(reseller_id: str) -> AromatequProcessor:
     return AromatequProcessor(reseller_id)
@@ -11,24 +11,89 @@ All processors must:
 5. Handle currency conversion
 """
 
+import re
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import List, Dict, Any, Optional, Tuple
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
+from datetime import date, datetime
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Tuple, Union
 from decimal import Decimal, InvalidOperation
 import openpyxl
 from openpyxl.worksheet.worksheet import Worksheet
 
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # python-calamine is optional; openpyxl read-only is the fallback
+    CalamineWorkbook = None
+
 from app.core.bibbi import BIBBI_TENANT_ID
-from app.utils.validation import validate_ean, to_int, to_float
+from app.utils.validation import validate_ean, to_int, to_float, parse_date, QUARTER_BY_MONTH
 from app.utils.excel import (
     extract_rows_from_sheet,
     get_sheet_headers,
+    match_sheet_name,
     safe_load_workbook
 )
 
+# Value of empty cells in _to_decimal (Decimal is immutable, so one is shared)
+DECIMAL_ZERO = Decimal("0.0")
+
+# Accounting notation for negative numbers: "(123.45)" = -123.45
+_ACCOUNTING_RE = re.compile(r"\((.*)\)", re.DOTALL)
+
+
+def _strip_accounting(text: str) -> str:
+    """Strip whitespace and rewrite accounting notation: "(x)" -> "-x"."""
+    text = text.strip()
+    match = _ACCOUNTING_RE.fullmatch(text)
+    return "-" + match.group(1) if match else text
+
+
+@lru_cache(maxsize=256)
+def month_start_iso(year: int, month: int) -> str:
+    """
+    sale_date for a Month/Year row: ISO date of the month's first day
+
+    Files cover a handful of months, so each (year, month) is formatted
+    once. Out-of-range values raise the same ValueError as
+    datetime(year, month, 1).
+    """
+    return date(year, month, 1).isoformat()
+
+
+@lru_cache(maxsize=256)
+def month_fields(year: int, month: int) -> Tuple[str, int, int, int]:
+    """
+    (sale_date, year, month, quarter) for a Month/Year row
+
+    One cached tuple per (year, month), so row transforms fill all four
+    date fields with a single lookup. Raises like month_start_iso().
+    """
+    return month_start_iso(year, month), year, month, QUARTER_BY_MONTH[month]
+
+
+@lru_cache(maxsize=1024, typed=True)
+def normalize_store_identifier(value: Any) -> str:
+    """
+    store_identifier for a raw store cell: lowercase, underscores for spaces
+
+    Files repeat a handful of store names on every row, so each distinct
+    cell value is normalized once (typed, so 1 and 1.0 stay distinct).
+    """
+    return str(value).strip().lower().replace(" ", "_")
+
 
 class ProcessingResult:
-    """Result of file processing"""
+    """
+    Result of file processing
+
+    Transformed rows can be supplied either as a list of dicts
+    (transformed_data) or column-wise (transformed_columns: field -> list of
+    values, one entry per row). Column-wise results keep one list per field
+    instead of one dict per row; transformed_data is then built on first
+    access for consumers that need row dicts.
+    """
 
     def __init__(
         self,
@@ -36,18 +101,41 @@ class ProcessingResult:
         total_rows: int,
         successful_rows: int,
         failed_rows: int,
-        transformed_data: List[Dict[str, Any]],
+        transformed_data: Optional[List[Dict[str, Any]]],
         stores: List[Dict[str, Any]],
-        errors: List[Dict[str, Any]]
+        errors: List[Dict[str, Any]],
+        transformed_columns: Optional[Dict[str, List[Any]]] = None
     ):
         self.vendor = vendor
         self.total_rows = total_rows
         self.successful_rows = successful_rows
         self.failed_rows = failed_rows
-        self.transformed_data = transformed_data
+        self._transformed_data = transformed_data
+        self.transformed_columns = transformed_columns
         self.stores = stores
         self.errors = errors
 
+    @property
+    def transformed_data(self) -> List[Dict[str, Any]]:
+        """Transformed rows as dicts (materialized from columns if needed)"""
+        if self._transformed_data is None:
+            columns = self.transformed_columns or {}
+            self._transformed_data = [dict(zip(columns, values)) for values in zip(*columns.values())]
+        return self._transformed_data
+
+    @transformed_data.setter
+    def transformed_data(self, value: List[Dict[str, Any]]) -> None:
+        self._transformed_data = value
+        self.transformed_columns = None
+
+    def iter_batches(self, batch_size: int = 50_000) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield transformed rows in chunks of at most batch_size
+        """
+        rows = self.transformed_data
+        for start in range(0, len(rows), batch_size):
+            yield rows[start:start + batch_size]
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
         return {
@@ -72,6 +160,10 @@ class BibbiBseProcessor(ABC):
     - get_vendor_name(): Return vendor identifier
     """
 
+    # Processors implementing transform_dataframe() set this to transform the
+    # whole sheet column-wise instead of row by row (see process)
+    VECTORIZED = False
+
     # Currency conversion rates (approximate - should be configurable)
     CURRENCY_RATES = {
         "EUR": 1.0,  # Base currency
@@ -92,6 +184,15 @@ class BibbiBseProcessor(ABC):
         self.tenant_id = BIBBI_TENANT_ID
         # Cache for reseller details to avoid repeated queries
         self._reseller_cache: Optional[Dict[str, Any]] = None
+        # Per-batch base row template (see _create_base_row)
+        self._base_row_template: Optional[Dict[str, Any]] = None
+        # Stores seen while streaming the last processed file (see process)
+        self._last_stores: Optional[List[Dict[str, Any]]] = None
+        self._last_stores_file: Optional[str] = None
+        # file_path -> parsed file while process() runs (see _open); None otherwise
+        self._file_cache: Optional[Dict[str, Any]] = None
+        # EUR rate for get_currency(), resolved on first _convert_eur call
+        self._rate: Optional[float] = None
 
     @abstractmethod
     def get_vendor_name(self) -> str:
@@ -104,15 +205,18 @@ class BibbiBseProcessor(ABC):
         pass
 
     @abstractmethod
-    def extract_rows(self, file_path: str) -> List[Dict[str, Any]]:
+    def extract_rows(self, file_path: str) -> Iterable[Dict[str, Any]]:
         """
         Extract raw rows from Excel file
 
+        Processors may return a list or a generator; process() consumes the
+        rows once, so a generator keeps memory flat on large files.
+
         Args:
             file_path: Path to Excel file
 
         Returns:
-            List of raw row dictionaries with vendor-specific column names
+            Iterable of raw row dictionaries with vendor-specific column names
         """
         pass
 
@@ -121,7 +225,7 @@ class BibbiBseProcessor(ABC):
         self,
         raw_row: Dict[str, Any],
         batch_id: str
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Union[Optional[Dict[str, Any]], Tuple[Optional[Dict[str, Any]], Optional[str]]]:
         """
         Transform raw row to sales_unified schema
 
@@ -130,7 +234,9 @@ class BibbiBseProcessor(ABC):
             batch_id: Batch identifier for this upload
 
         Returns:
-            Transformed row dict or None if row should be skipped
+            Transformed row dict or None if row should be skipped.
+            Processors may instead return a (row, error) tuple so expected
+            validation failures are reported without raising.
 
         Raises:
             ValueError: If row validation fails
@@ -156,6 +262,116 @@ class BibbiBseProcessor(ABC):
         """
         pass
 
+    def store_from_row(self, raw_row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Derive store information from a single raw row
+
+        Optional hook: processors whose stores live in a data column can
+        override this so process() collects stores while streaming rows
+        instead of reopening the workbook. The default returns None, and
+        process() falls back to extract_stores(file_path) when no row
+        produced a store.
+
+        Args:
+            raw_row: Raw row from extract_rows()
+
+        Returns:
+            Store dictionary (same shape as extract_stores()) or None
+        """
+        return None
+
+    def compile_transformer(
+        self,
+        headers: List[str]
+    ) -> Callable[[Dict[str, Any], str], Union[Optional[Dict[str, Any]], Tuple[Optional[Dict[str, Any]], Optional[str]]]]:
+        """
+        Return the row transform to use for a file with these headers
+
+        Optional hook: processors that look columns up through fallback
+        chains (e.g. "EAN" or "Brand") can resolve them once per file and
+        return a specialized callable with transform_row()'s signature and
+        results. iter_transformed() calls this once, with the keys of the
+        first extracted row. The default is transform_row itself.
+
+        Args:
+            headers: Column names of the rows about to be transformed
+
+        Returns:
+            Callable taking (raw_row, batch_id)
+        """
+        return self.transform_row
+
+    def extract_stores_from_rows(
+        self,
+        raw_rows: Iterable[Dict[str, Any]]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Derive unique stores from raw rows via store_from_row()
+
+        Args:
+            raw_rows: Raw rows from extract_rows()
+
+        Returns:
+            List of store dictionaries in first-seen order, or None if no
+            row produced a store
+        """
+        stores: Dict[str, Dict[str, Any]] = {}
+        for raw_row in raw_rows:
+            store = self.store_from_row(raw_row)
+            if store:
+                stores.setdefault(store["store_identifier"], store)
+        return list(stores.values()) or None
+
+    def iter_transformed(
+        self,
+        file_path: str,
+        batch_id: str
+    ) -> Iterator[Tuple[Dict[str, Any], Optional[Dict[str, Any]], Optional[Dict[str, Any]], Optional[str]]]:
+        """
+        Fused extract → transform loop
+
+        Reads each row once from extract_rows() and immediately derives its
+        store and transformed row, so no intermediate row list is built.
+        Processors that can fuse reading and transforming more tightly may
+        override this; process() only consumes what it yields.
+
+        Args:
+            file_path: Path to Excel file
+            batch_id: Batch identifier
+
+        Yields:
+            (raw_row, store, transformed_row, error) per extracted row.
+            transformed_row is None when the row failed (error set) or was
+            skipped. Errors from extract_rows() itself propagate.
+        """
+        yield from self._transform_rows(self.extract_rows(file_path), batch_id)
+
+    def _transform_rows(
+        self,
+        raw_rows: Iterable[Dict[str, Any]],
+        batch_id: str
+    ) -> Iterator[Tuple[Dict[str, Any], Optional[Dict[str, Any]], Optional[Dict[str, Any]], Optional[str]]]:
+        """Transform raw rows in order; yields what iter_transformed() yields"""
+        transform = None
+        for raw_row in raw_rows:
+            if transform is None:
+                # Rows of one sheet share their headers; specialize once per file
+                transform = self.compile_transformer(list(raw_row))
+            store = None
+            try:
+                store = self.store_from_row(raw_row)
+                transformed = transform(raw_row, batch_id)
+                if type(transformed) is tuple:
+                    transformed, error = transformed
+                    if error:
+                        yield raw_row, store, None, error
+                        continue
+            except Exception as e:
+                yield raw_row, store, None, str(e)
+                continue
+
+            yield raw_row, store, transformed, None
+
     def process(
         self,
         file_path: str,
@@ -164,11 +380,13 @@ class BibbiBseProcessor(ABC):
         """
         Main processing pipeline
 
-        1. Extract stores
-        2. Extract raw rows
-        3. Transform each row
-        4. Collect errors
-        5. Return results
+        Thin driver over iter_transformed():
+        1. Stream transformed rows (single workbook pass; extract_rows()
+           and extract_stores() can share one parse via _open())
+        2. Collect stores and errors as rows arrive
+        3. Fall back to extract_stores() if no row carried a store
+           (the row-derived stores are kept in _last_stores)
+        4. Return results
 
         Args:
             file_path: Path to Excel file
@@ -177,22 +395,70 @@ class BibbiBseProcessor(ABC):
         Returns:
             ProcessingResult with transformed data, stores, and errors
         """
+        # Rows and stores share one parse of the file for the whole run (see _open)
+        with self.parse_once():
+            return self._process(file_path, batch_id)
+
+    @contextmanager
+    def parse_once(self) -> Iterator[None]:
+        """
+        Share one parse per file between the extract_*() calls in the block
+
+        process() runs inside this; callers driving extract_stores() and
+        extract_rows() themselves can wrap them to avoid reading the file
+        twice. Nested blocks (e.g. process() inside one) reuse the outer
+        cache, which is dropped when the outermost block exits.
+        """
+        if self._file_cache is not None:
+            yield
+            return
+        self._file_cache = {}
+        try:
+            yield
+        finally:
+            self._file_cache = None
+
+    def _process(self, file_path: str, batch_id: str) -> ProcessingResult:
+        """process() body, run with the per-file parse cache enabled"""
         vendor = self.get_vendor_name()
         print(f"[{vendor}] Starting processing: {file_path}")
 
-        # Extract stores first (needed for store_id mapping)
-        try:
-            stores = self.extract_stores(file_path)
-            print(f"[{vendor}] Extracted {len(stores)} stores")
-        except Exception as e:
-            print(f"[{vendor}] Error extracting stores: {e}")
-            stores = []
+        # Fresh base row template (and created_at) for this run. Built before
+        # any row so sales_channel is resolved once
+        self._base_row_template = self._build_base_row_template(batch_id)
+        self._last_stores = None
+
+        if self.VECTORIZED:
+            try:
+                df = self._open_frame(file_path)
+            except Exception as e:
+                print(f"[{vendor}] Vectorized read failed, using row path: {e}")
+            else:
+                return self._process_frame(df, file_path, batch_id)
+
+        total_rows = 0
+        row_stores: Dict[str, Dict[str, Any]] = {}
+        transformed_data = []
+        errors = []
 
-        # Extract raw rows
         try:
-            raw_rows = self.extract_rows(file_path)
-            total_rows = len(raw_rows)
-            print(f"[{vendor}] Extracted {total_rows} rows")
+            for row_num, (raw_row, store, transformed, error) in enumerate(
+                self.iter_transformed(file_path, batch_id), start=2  # Start at 2 (Excel row numbers, skip header)
+            ):
+                total_rows += 1
+                if store:
+                    row_stores.setdefault(store["store_identifier"], store)
+
+                if error is not None:
+                    errors.append({
+                        "row_number": row_num,
+                        "error": error,
+                        "raw_data": raw_row
+                    })
+                elif transformed:
+                    # Inject tenant_id
+                    transformed["tenant_id"] = self.tenant_id
+                    transformed_data.append(transformed)
         except Exception as e:
             print(f"[{vendor}] Error extracting rows: {e}")
             return ProcessingResult(
@@ -201,27 +467,24 @@ class BibbiBseProcessor(ABC):
                 successful_rows=0,
                 failed_rows=0,
                 transformed_data=[],
-                stores=stores,
+                stores=[],
                 errors=[{"error": f"Failed to extract rows: {str(e)}"}]
             )
 
-        # Transform rows
-        transformed_data = []
-        errors = []
+        print(f"[{vendor}] Extracted {total_rows} rows")
 
-        for row_num, raw_row in enumerate(raw_rows, start=2):  # Start at 2 (Excel row numbers, skip header)
-            try:
-                transformed = self.transform_row(raw_row, batch_id)
-                if transformed:
-                    # Inject tenant_id
-                    transformed["tenant_id"] = self.tenant_id
-                    transformed_data.append(transformed)
-            except Exception as e:
-                errors.append({
-                    "row_number": row_num,
-                    "error": str(e),
-                    "raw_data": raw_row
-                })
+        # Row-derived stores are recorded before the fallback so extract_stores()
+        # overrides can reuse them instead of reopening the workbook
+        self._last_stores = list(row_stores.values())
+        self._last_stores_file = file_path
+
+        # Extract stores (needed for store_id mapping)
+        try:
+            stores = self._last_stores or self.extract_stores(file_path)
+            print(f"[{vendor}] Extracted {len(stores)} stores")
+        except Exception as e:
+            print(f"[{vendor}] Error extracting stores: {e}")
+            stores = []
 
         successful_rows = len(transformed_data)
         failed_rows = len(errors)
@@ -238,6 +501,79 @@ class BibbiBseProcessor(ABC):
             errors=errors
         )
 
+    def _process_frame(self, df, file_path: str, batch_id: str) -> ProcessingResult:
+        """process() for VECTORIZED processors: one transform_dataframe() call"""
+        vendor = self.get_vendor_name()
+        print(f"[{vendor}] Extracted {len(df)} rows")
+
+        columns, errors = self.transform_dataframe(df, batch_id)
+        successful_rows = len(next(iter(columns.values()), []))
+
+        try:
+            stores = self.extract_stores(file_path)
+            print(f"[{vendor}] Extracted {len(stores)} stores")
+        except Exception as e:
+            print(f"[{vendor}] Error extracting stores: {e}")
+            stores = []
+
+        print(f"[{vendor}] Processing complete: {successful_rows} success, {len(errors)} failed")
+
+        return ProcessingResult(
+            vendor=vendor,
+            total_rows=len(df),
+            successful_rows=successful_rows,
+            failed_rows=len(errors),
+            transformed_data=None,
+            stores=stores,
+            errors=errors,
+            transformed_columns=columns
+        )
+
+    def transform_dataframe(self, df, batch_id: str) -> Tuple[Dict[str, List[Any]], List[Dict[str, Any]]]:
+        """
+        Transform a whole sheet column-wise (VECTORIZED processors only)
+
+        Must apply transform_row()'s rules to every row at once and report
+        the same per-row results and error messages; app.utils.frames has
+        column-wise versions of the shared conversions, and
+        _frame_output() assembles the return value.
+
+        Args:
+            df: Sheet from _open(file_path)
+            batch_id: Batch identifier
+
+        Returns:
+            (columns, errors): field -> values for the rows that passed,
+            and error dicts shaped like process()'s for the rows that failed
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not implement transform_dataframe()")
+
+    def _frame_output(self, df, out, row_errors, batch_id: str) -> Tuple[Dict[str, List[Any]], List[Dict[str, Any]]]:
+        """
+        Build transform_dataframe()'s return value
+
+        Args:
+            df: Raw sheet (for error raw_data)
+            out: DataFrame of vendor-specific fields for the rows that passed
+            row_errors: app.utils.frames.RowErrors for df
+            batch_id: Batch identifier
+
+        Returns:
+            (columns, errors) with the base row fields (and tenant_id) added
+            to every passing row
+        """
+        base = self._create_base_row(batch_id)
+        base["tenant_id"] = self.tenant_id
+        columns = {field: [value] * len(out) for field, value in base.items()}
+        columns.update(out.to_dict("list"))
+
+        messages = row_errors.messages
+        errors = [
+            {"row_number": i + 2, "error": messages[i], "raw_data": df.loc[i].to_dict()}
+            for i in df.index[~row_errors.ok]
+        ]
+        return columns, errors
+
     # Utility methods for common operations
     # NOTE: Common utilities now imported from app.utils.validation and app.utils.excel
 
@@ -249,6 +585,120 @@ class BibbiBseProcessor(ABC):
         """
         return safe_load_workbook(file_path, data_only=True, read_only=read_only)
 
+    def _iter_sheet_dicts(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Stream first-sheet data rows as dictionaries keyed by header
+
+        Uses python-calamine (Rust xlsx parser) when installed, otherwise
+        openpyxl read-only mode. Both backends yield the same shape: headers
+        from row 1 (same rules as _get_sheet_headers), empty rows skipped,
+        empty cells as None.
+
+        Args:
+            file_path: Path to Excel file
+
+        Yields:
+            Raw row dictionaries
+        """
+        # Header order is resolved once; each row is then zipped against it
+        # (C-level) instead of indexing every column by position
+        if CalamineWorkbook is not None:
+            # to_python() returns every row at once, so the file can be closed
+            # straight away. Leading empty rows/columns are kept so row 1 is
+            # the header row and cell positions match openpyxl's
+            with CalamineWorkbook.from_path(file_path) as workbook:
+                rows = iter(workbook.get_sheet_by_index(0).to_python(skip_empty_area=False))
+            headers = [str(value).strip() for value in next(rows, []) if value]
+            padding = [None] * len(headers)
+            for row in rows:
+                # any() stops at the first filled cell, and "" is falsy, so blank
+                # rows are skipped before the per-cell rewrite below
+                if not any(row):
+                    continue
+                # Calamine reports empty cells as ""; openpyxl reports None
+                if "" in row:
+                    row = [None if value == "" else value for value in row]
+                yield dict(zip(headers, row + padding if len(row) < len(headers) else row))
+            return
+
+        workbook = self._load_workbook(file_path)
+        try:
+            sheet = workbook[workbook.sheetnames[0]]
+            headers = self._get_sheet_headers(sheet)
+            padding = (None,) * len(headers)
+            for row in sheet.iter_rows(min_row=2, values_only=True):
+                # any() returns at the first filled cell, so only blank rows pay
+                # for a full scan. Probing just the edge cells would drop rows
+                # whose only values sit in middle columns
+                if any(row):
+                    yield dict(zip(headers, row + padding if len(row) < len(headers) else row))
+        finally:
+            workbook.close()
+
+    def _open(self, file_path: str) -> Any:
+        """
+        Parsed contents of file_path via _read(), parsed once per process() run
+
+        extract_rows() and extract_stores() both call this, so a run
+        decompresses and parses the workbook a single time. Outside
+        process() (or a parse_once() block) nothing is cached and every
+        call re-reads the file.
+        """
+        if self._file_cache is None:
+            return self._read(file_path)
+        parsed = self._file_cache.get(file_path)
+        if parsed is None:
+            parsed = self._file_cache[file_path] = self._read(file_path)
+        return parsed
+
+    def _open_frame(self, file_path: str):
+        """Sheet DataFrame for transform_dataframe(); _open(file_path) by default"""
+        return self._open(file_path)
+
+    def _read(self, file_path: str) -> Any:
+        """Parse file_path for _open() (first sheet as a DataFrame by default)"""
+        return self._read_frame(file_path)
+
+    def _read_frame(
+        self,
+        file_path: str,
+        sheet_name: Union[str, int] = 0,
+        dtype: Any = object,
+        fallback_to_first: bool = False
+    ):
+        """
+        Read one sheet into a pandas DataFrame shaped like the row readers
+
+        Headers are stripped, fully blank rows dropped and empty cells
+        returned as None, so frame.to_dict("records") matches the dicts
+        the openpyxl-based extract_rows() implementations build. Uses the
+        calamine engine when python-calamine is installed.
+
+        Args:
+            file_path: Path to Excel file
+            sheet_name: Sheet name (matched case-insensitively) or index
+            dtype: Column dtype(s) passed to pandas
+            fallback_to_first: If True, a missing named sheet reads the
+                first sheet instead of raising ValueError
+
+        Returns:
+            pandas DataFrame with object columns
+        """
+        import pandas as pd
+        try:
+            workbook = pd.ExcelFile(file_path, engine="calamine")
+        except ImportError:
+            workbook = pd.ExcelFile(file_path, engine="openpyxl")
+        # One open for name resolution and parsing; an unmatched name is
+        # passed through so pandas raises its usual ValueError
+        with workbook:
+            if isinstance(sheet_name, str):
+                sheet_name = match_sheet_name(workbook.sheet_names, sheet_name) or (0 if fallback_to_first else sheet_name)
+            df = workbook.parse(sheet_name, dtype=dtype)
+        df.columns = [str(c).strip() for c in df.columns]
+        df = df.dropna(how="all").reset_index(drop=True)
+        return df.astype(object).where(df.notna(), None)
+
     def _get_sheet_headers(self, sheet: Worksheet) -> List[str]:
         """
         Extract column headers from first row
@@ -257,7 +707,7 @@ class BibbiBseProcessor(ABC):
         """
         return get_sheet_headers(sheet, header_row=1)
 
-    def _validate_ean(self, value: Any, required: bool = True) -> Optional[str]:
+    def _validate_ean(self, value: Any, required: bool = True, strict: bool = True) -> Optional[str]:
         """
         Validate and normalize EAN code
 
@@ -266,14 +716,26 @@ class BibbiBseProcessor(ABC):
         Args:
             value: EAN value from Excel
             required: If False, returns None for empty values
+            strict: If False, returns None for invalid EANs instead of raising
 
         Returns:
-            Normalized 13-digit EAN string or None if not required
+            Normalized 13-digit EAN string, or None if not required / not strict
 
         Raises:
-            ValueError: If EAN is invalid and required=True
+            ValueError: If EAN is invalid and strict=True
         """
-        return validate_ean(value, required=required, strict=True)
+        # Fast paths: text cells that already hold 13 digits need no cleanup,
+        # and openpyxl hands numeric EAN cells over as int/float, which only
+        # need a range check (same results as the string normalization)
+        value_type = type(value)
+        if value_type is str and len(value) == 13 and value.isdigit():
+            return value
+        if value_type is int and 10**12 <= value < 10**13:
+            return str(value)
+        if value_type is float and 1e12 <= value < 1e13 and value.is_integer():
+            return str(int(value))
+
+        return validate_ean(value, required=required, strict=strict)
 
     def _to_int(self, value: Any, field_name: str) -> int:
         """
@@ -292,11 +754,13 @@ class BibbiBseProcessor(ABC):
         Raises:
             ValueError: If conversion fails
         """
+        # Fast path: numeric cells need no parsing
+        if type(value) is int:
+            return value
+
         # Handle accounting notation: "(123)" means negative
         if isinstance(value, str):
-            value = value.strip()
-            if value.startswith('(') and value.endswith(')'):
-                value = '-' + value[1:-1]
+            value = _strip_accounting(value)
 
         # Use shared utility for standard conversion
         return to_int(value, field_name)
@@ -318,11 +782,14 @@ class BibbiBseProcessor(ABC):
         Raises:
             ValueError: If conversion fails
         """
+        # Fast path: numeric cells need no parsing
+        value_type = type(value)
+        if value_type is float or value_type is int:
+            return float(value)
+
         # Handle accounting notation: "(123.45)" means negative
         if isinstance(value, str):
-            value = value.strip()
-            if value.startswith('(') and value.endswith(')'):
-                value = '-' + value[1:-1]
+            value = _strip_accounting(value)
 
         # Use shared utility with allow_none=True, default=0.0
         return to_float(value, field_name, allow_none=True, default=0.0)
@@ -341,9 +808,23 @@ class BibbiBseProcessor(ABC):
         Raises:
             ValueError: If conversion fails
         """
+        # Parse straight to Decimal (no float round-trip); same empty/accounting
+        # notation rules as _to_float
+        if value is None or value == "":
+            return DECIMAL_ZERO
+
+        if isinstance(value, str):
+            text = _strip_accounting(value)
+            if text == "":
+                return DECIMAL_ZERO
+        elif isinstance(value, float):
+            text = str(value)
+        else:
+            text = value
+
         try:
-            return Decimal(str(self._to_float(value, field_name)))
-        except (ValueError, InvalidOperation):
+            return Decimal(text)
+        except (ValueError, TypeError, InvalidOperation):
             raise ValueError(f"Invalid decimal for {field_name}: {value}")
 
     def _convert_currency(self, amount: float, from_currency: str) -> float:
@@ -360,16 +841,61 @@ class BibbiBseProcessor(ABC):
         if from_currency == "EUR":
             return amount
 
+        return round(amount * self._currency_rate(from_currency), 2)
+
+    def _convert_eur(self, amount: float) -> float:
+        """
+        Convert amount in the processor's own currency to EUR
+
+        Same result as _convert_currency(amount, self.get_currency()), with
+        the rate resolved once per processor instead of on every row.
+
+        Raises:
+            ValueError: If the processor's currency is unknown
+        """
+        rate = self._rate
+        if rate is None:
+            rate = self._rate = self._currency_rate(self.get_currency())
+        return amount if rate == 1.0 else round(amount * rate, 2)
+
+    def _convert_eur_column(self, amounts):
+        """
+        Column-wise _convert_eur: one multiply over a Series of amounts
+
+        Uses the same cached rate, and EUR amounts pass through unchanged.
+        Rounding uses Python's round() per value: Series.round() scales by
+        100 first and can land a cent off on products like -1.725.
+        """
+        rate = self._rate
+        if rate is None:
+            rate = self._rate = self._currency_rate(self.get_currency())
+        return amounts if rate == 1.0 else (amounts * rate).map(lambda amount: round(amount, 2))
+
+    def _currency_rate(self, from_currency: str) -> float:
+        """
+        EUR conversion rate for a currency (1.0 for EUR)
+
+        A processor's currency is fixed, so column-wise paths look the rate
+        up once per file and multiply the whole column.
+
+        Raises:
+            ValueError: If currency is unknown
+        """
+        if from_currency == "EUR":
+            return 1.0
+
         rate = self.CURRENCY_RATES.get(from_currency)
         if rate is None:
             raise ValueError(f"Unknown currency: {from_currency}")
 
-        return round(amount * rate, 2)
+        return rate
 
     def _validate_date(self, value: Any) -> datetime:
         """
         Validate and parse date value
 
+        Uses shared utility: app.utils.validation.parse_date
+
         Args:
             value: Date value (datetime object or string)
 
@@ -383,25 +909,22 @@ class BibbiBseProcessor(ABC):
             return value
 
         if isinstance(value, str):
-            # Try common date formats
-            for fmt in ["%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y", "%d-%m-%Y"]:
-                try:
-                    return datetime.strptime(value, fmt)
-                except ValueError:
-                    continue
-
-            raise ValueError(f"Invalid date format: {value}")
+            return parse_date(value)
 
         raise ValueError(f"Invalid date type: {type(value)}")
 
     def _calculate_quarter(self, month: int) -> int:
         """Calculate quarter from month (1-4)"""
-        return (month - 1) // 3 + 1
+        return QUARTER_BY_MONTH[month]
 
     def _get_reseller_sales_channel(self) -> Optional[str]:
         """
         Fetch sales_channel from resellers table (with caching)
 
+        Found reseller rows are cached per instance and process-wide (see
+        _fetch_reseller_row), so processors created for later uploads of
+        the same reseller skip the query. Misses and errors are not cached.
+
         Returns:
             sales_channel value ("B2B", "B2C", "B2B2C", etc.) or None
         """
@@ -410,24 +933,13 @@ class BibbiBseProcessor(ABC):
             return self._reseller_cache.get("sales_channel")
 
         try:
-            # Import here to avoid circular dependency
-            from app.core.bibbi import get_bibbi_db
-
-            bibbi_db = get_bibbi_db()
-
-            # NOTE: Use raw client to bypass tenant filter (resellers table has no tenant_id)
-            result = bibbi_db.client.table("resellers")\
-                .select("sales_channel, reseller")\
-                .eq("id", self.reseller_id)\
-                .execute()
+            # Cache for subsequent calls
+            self._reseller_cache = _fetch_reseller_row(self.reseller_id)
+            return self._reseller_cache.get("sales_channel")
 
-            if result.data and len(result.data) > 0:
-                # Cache for subsequent calls
-                self._reseller_cache = result.data[0]
-                return self._reseller_cache.get("sales_channel")
-            else:
-                print(f"[BibbiProcessor] Reseller {self.reseller_id} not found in resellers table")
-                return None
+        except _ResellerNotFound:
+            print(f"[BibbiProcessor] Reseller {self.reseller_id} not found in resellers table")
+            return None
 
         except Exception as e:
             print(f"[BibbiProcessor] Error fetching reseller details: {e}")
@@ -446,10 +958,22 @@ class BibbiBseProcessor(ABC):
         - sales_channel (from resellers table, can be overridden by child processors)
         - created_at
 
+        The fields are identical for every row of a batch, so they are built
+        once per batch (one created_at timestamp per batch) and each call
+        returns a shallow copy of that template. process() builds a fresh
+        template (resolving sales_channel) before transforming any row.
+
         NOTE: Child processors (like LibertyProcessor) can override sales_channel
         if their business logic requires a different semantic (e.g., distribution channel
         vs. business model).
         """
+        template = self._base_row_template
+        if template is None or template["batch_id"] != batch_id:
+            template = self._base_row_template = self._build_base_row_template(batch_id)
+        return template.copy()
+
+    def _build_base_row_template(self, batch_id: str) -> Dict[str, Any]:
+        """Build the shared base row fields for a batch"""
         base_row = {
             "tenant_id": self.tenant_id,
             "reseller_id": self.reseller_id,
@@ -471,3 +995,50 @@ class BibbiBseProcessor(ABC):
             base_row["sales_channel"] = "B2B"
 
         return base_row
+
+
+class _ResellerNotFound(LookupError):
+    """No resellers row for the requested id (raised so lru_cache skips it)"""
+
+
+@lru_cache(maxsize=1024)
+def _fetch_reseller_row(reseller_id: str) -> Dict[str, Any]:
+    """
+    resellers row (sales_channel, reseller) for reseller_id, cached per process
+
+    Only found rows are cached: lru_cache does not store raised exceptions,
+    so a missing reseller or a database error is retried on the next call.
+
+    Raises:
+        _ResellerNotFound: If the reseller does not exist
+    """
+    # Import here to avoid circular dependency
+    from app.core.bibbi import get_bibbi_db
+
+    bibbi_db = get_bibbi_db()
+
+    # NOTE: Use raw client to bypass tenant filter (resellers table has no tenant_id)
+    result = bibbi_db.client.table("resellers")\
+        .select("sales_channel, reseller")\
+        .eq("id", reseller_id)\
+        .execute()
+
+    if not result.data:
+        raise _ResellerNotFound(reseller_id)
+    return result.data[0]
+
+
+def clear_reseller_cache() -> None:
+    """Forget cached resellers rows (after a reseller's sales_channel changes, or between tests)"""
+    _fetch_reseller_row.cache_clear()
+
+
+def _chunked(rows: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Split an iterable of rows into lists of at most size rows"""
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
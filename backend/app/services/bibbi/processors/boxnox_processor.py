@@ -10,11 +10,16 @@ Handles Boxnox reseller data:
 Based on: backend/BIBBI/Resellers/resellers_info.md
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 import openpyxl
+import pandas as pd
 
-from .base import BibbiBseProcessor
+from app.utils.frames import (
+    RowErrors, column, first_truthy, is_ean13, month_start, normalize_ean,
+    normalize_store, quarter, to_number, truncate_to_int, truthy
+)
+from .base import BibbiBseProcessor, QUARTER_BY_MONTH, normalize_store_identifier, month_start_iso
 
 
 class BoxnoxProcessor(BibbiBseProcessor):
@@ -23,6 +28,7 @@ class BoxnoxProcessor(BibbiBseProcessor):
     VENDOR_NAME = "boxnox"
     CURRENCY = "EUR"
     TARGET_SHEET = "Sell Out by EAN"
+    VECTORIZED = True
 
     COLUMN_MAPPING = {
         "Product EAN": "product_ean",
@@ -35,6 +41,9 @@ class BoxnoxProcessor(BibbiBseProcessor):
         "Year": "year"
     }
 
+    # Identifier columns are read as text so EANs never pass through float
+    COLUMN_DTYPES = {"Product EAN": "string", "POS": "string"}
+
     def get_vendor_name(self) -> str:
         return self.VENDOR_NAME
 
@@ -47,30 +56,14 @@ class BoxnoxProcessor(BibbiBseProcessor):
         seen_stores = set()
 
         try:
-            workbook = self._load_workbook(file_path)
-
-            # Find correct sheet
-            sheet = None
-            if self.TARGET_SHEET in workbook.sheetnames:
-                sheet = workbook[self.TARGET_SHEET]
-            else:
-                sheet = workbook[workbook.sheetnames[0]]
-
-            headers = self._get_sheet_headers(sheet)
+            df = self._open(file_path)
 
             # Find POS column
-            pos_col_idx = None
-            for idx, header in enumerate(headers):
-                if "POS" in header.upper():
-                    pos_col_idx = idx
-                    break
-
-            if pos_col_idx is not None:
-                for row in sheet.iter_rows(min_row=2, values_only=True):
-                    if not any(row):
-                        continue
-
-                    pos_value = row[pos_col_idx] if pos_col_idx < len(row) else None
+            pos_col = next((header for header in df.columns if "POS" in header.upper()), None)
+
+            if pos_col is not None:
+                # Each distinct POS value once, in order of first appearance
+                for pos_value in df[pos_col].unique():
                     if pos_value:
                         pos_str = str(pos_value).strip()
                         if pos_str and pos_str not in seen_stores:
@@ -80,14 +73,12 @@ class BoxnoxProcessor(BibbiBseProcessor):
                             is_online = any(kw in pos_str.lower() for kw in ["online", "web", "e-shop"])
 
                             stores.append({
-                                "store_identifier": pos_str.lower().replace(' ', '_'),
+                                "store_identifier": normalize_store_identifier(pos_str),
                                 "store_name": f"Boxnox {pos_str}",
                                 "store_type": "online" if is_online else "physical",
                                 "reseller_id": self.reseller_id
                             })
 
-            workbook.close()
-
             if not stores:
                 # Fallback
                 stores = [{
@@ -110,30 +101,11 @@ class BoxnoxProcessor(BibbiBseProcessor):
 
     def extract_rows(self, file_path: str) -> List[Dict[str, Any]]:
         """Extract rows from Boxnox file"""
-        workbook = self._load_workbook(file_path)
-
-        # Find correct sheet
-        if self.TARGET_SHEET in workbook.sheetnames:
-            sheet = workbook[self.TARGET_SHEET]
-        else:
-            sheet = workbook[workbook.sheetnames[0]]
-
-        headers = self._get_sheet_headers(sheet)
-
-        rows = []
-        for row in sheet.iter_rows(min_row=2, values_only=True):
-            if not any(row):
-                continue
-
-            row_dict = {}
-            for idx, header in enumerate(headers):
-                if idx < len(row):
-                    row_dict[header] = row[idx]
+        return self._open(file_path).to_dict(orient="records")
 
-            rows.append(row_dict)
-
-        workbook.close()
-        return rows
+    def _read(self, file_path: str):
+        # "Sell Out by EAN" in any letter case, else the first sheet
+        return self._read_frame(file_path, sheet_name=self.TARGET_SHEET, dtype=self.COLUMN_DTYPES, fallback_to_first=True)
 
     def transform_row(self, raw_row: Dict[str, Any], batch_id: str) -> Optional[Dict[str, Any]]:
         """Transform Boxnox row to sales_unified schema"""
@@ -178,26 +150,80 @@ class BoxnoxProcessor(BibbiBseProcessor):
             if month < 1 or month > 12:
                 raise ValueError(f"Invalid month: {month}")
 
-            transformed["sale_date"] = datetime(year, month, 1).date().isoformat()
+            transformed["sale_date"] = month_start_iso(year, month)
             transformed["year"] = year
             transformed["month"] = month
-            transformed["quarter"] = self._calculate_quarter(month)
+            transformed["quarter"] = QUARTER_BY_MONTH[month]
         else:
             now = datetime.utcnow()
             transformed["sale_date"] = now.date().isoformat()
             transformed["year"] = now.year
             transformed["month"] = now.month
-            transformed["quarter"] = self._calculate_quarter(now.month)
+            transformed["quarter"] = QUARTER_BY_MONTH[now.month]
 
         # Store (POS)
         pos_value = raw_row.get("POS")
         if pos_value:
-            transformed["store_identifier"] = str(pos_value).strip().lower().replace(' ', '_')
+            transformed["store_identifier"] = normalize_store_identifier(pos_value)
         else:
             transformed["store_identifier"] = "boxnox_main"
 
         return transformed
 
+    def transform_dataframe(self, df, batch_id: str) -> Tuple[Dict[str, List[Any]], List[Dict[str, Any]]]:
+        """Column-wise transform_row: same checks, error messages and output per row"""
+        errors = RowErrors(df.index)
+
+        # EAN
+        ean_raw = column(df, "Product EAN")
+        ean = normalize_ean(ean_raw)
+        errors.add(~truthy(ean_raw), "Missing Product EAN")
+        errors.add(~is_ean13(ean), "Invalid EAN format: " + ean + " (must be 13 digits)")
+
+        # Quantity
+        qty_raw = column(df, "Sold Qty")
+        qty = to_number(qty_raw)
+        errors.add(qty_raw.isna(), "Missing Sold Qty")
+        errors.add(qty.isna(), "Invalid integer for Sold Qty: " + qty_raw.astype(str))
+        quantity = truncate_to_int(qty)
+        errors.add(quantity <= 0, "Invalid quantity: " + quantity.astype(str))
+
+        # Sales amount (already in EUR)
+        sales_raw = first_truthy(df, "Sales Amount (EUR)", "Sales Amount")
+        sales = to_number(sales_raw).where(sales_raw != "", 0.0)
+        errors.add(sales_raw.isna(), "Missing Sales Amount")
+        errors.add(sales.isna(), "Invalid float for Sales Amount: " + sales_raw.astype(str))
+
+        # Date
+        month_raw, year_raw = column(df, "Month"), column(df, "Year")
+        dated = truthy(month_raw) & truthy(year_raw)
+        month_num, year_num = to_number(month_raw), to_number(year_raw)
+        errors.add(dated & month_num.isna(), "Invalid integer for Month: " + month_raw.astype(str))
+        errors.add(dated & year_num.isna(), "Invalid integer for Year: " + year_raw.astype(str))
+        month, year = truncate_to_int(month_num), truncate_to_int(year_num)
+        errors.add(dated & ~month.between(1, 12), "Invalid month: " + month.astype(str))
+        errors.add(dated & ~year.between(1, 9999), "year " + year.astype(str) + " is out of range")
+
+        ok = errors.ok
+        now = datetime.utcnow()
+        month = month.where(dated, now.month)[ok]
+        year = year.where(dated, now.year)[ok]
+        sales = sales[ok].astype("float64")
+
+        out = pd.DataFrame({
+            "product_ean": ean[ok],
+            "quantity": quantity[ok],
+            "is_return": False,
+            "sales_local_currency": sales,
+            "sales_eur": sales,
+            "sale_date": month_start(year, month).where(dated[ok], now.date().isoformat()),
+            "year": year,
+            "month": month,
+            "quarter": quarter(month),
+            "store_identifier": normalize_store(column(df, "POS"), "boxnox_main")[ok],
+        })
+        return self._frame_output(df, out, errors, batch_id)
+
 
 def get_boxnox_processor(reseller_id: str) -> BoxnoxProcessor:
     """Factory function for Boxnox processor"""
@@ -1,11 +1,19 @@
 """CDLC (Creme de la Creme) Processor"""
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
-from .base import BibbiBseProcessor
+import pandas as pd
+from app.utils.frames import (
+    RowErrors, column, first_truthy, is_ean13, month_start, normalize_ean,
+    normalize_store, quarter, to_number, truncate_to_int, truthy
+)
+from .base import BibbiBseProcessor, QUARTER_BY_MONTH, normalize_store_identifier, month_start_iso
 
 class CDLCProcessor(BibbiBseProcessor):
     VENDOR_NAME = "cdlc"
     CURRENCY = "EUR"
+    VECTORIZED = True
+    # Identifier columns are read as text so EANs never pass through float
+    COLUMN_DTYPES = {"EAN": "string", "Product EAN": "string", "Store": "string", "Shop": "string"}
 
     def get_vendor_name(self) -> str:
         return self.VENDOR_NAME
@@ -17,28 +25,24 @@ class CDLCProcessor(BibbiBseProcessor):
         stores = []
         seen = set()
         try:
-            wb = self._load_workbook(file_path)
-            sheet = wb[wb.sheetnames[0]]
-            headers = self._get_sheet_headers(sheet)
+            df = self._open(file_path)
             
-            store_idx = next((i for i, h in enumerate(headers) if "store" in h.lower() or "shop" in h.lower()), None)
+            store_col = next((h for h in df.columns if "store" in h.lower() or "shop" in h.lower()), None)
             
-            if store_idx:
-                for row in sheet.iter_rows(min_row=2, values_only=True):
-                    if not any(row): continue
-                    store_val = row[store_idx] if store_idx < len(row) else None
+            if store_col is not None:
+                # Each distinct store value once, in order of first appearance
+                for store_val in df[store_col].unique():
                     if store_val:
                         store_str = str(store_val).strip()
                         if store_str and store_str not in seen:
                             seen.add(store_str)
                             is_online = store_str.lower() in ["e-shop", "online", "web"]
                             stores.append({
-                                "store_identifier": store_str.lower().replace(' ', '_'),
+                                "store_identifier": normalize_store_identifier(store_str),
                                 "store_name": f"CDLC {store_str}",
                                 "store_type": "online" if is_online else "physical",
                                 "reseller_id": self.reseller_id
                             })
-            wb.close()
             
             if not stores:
                 stores = [{"store_identifier": "e-shop", "store_name": "CDLC E-shop", "store_type": "online", "reseller_id": self.reseller_id}]
@@ -48,16 +52,10 @@ class CDLCProcessor(BibbiBseProcessor):
         return stores
 
     def extract_rows(self, file_path: str) -> List[Dict[str, Any]]:
-        wb = self._load_workbook(file_path)
-        sheet = wb[wb.sheetnames[0]]
-        headers = self._get_sheet_headers(sheet)
-        rows = []
-        for row in sheet.iter_rows(min_row=2, values_only=True):
-            if not any(row): continue
-            row_dict = {h: row[i] if i < len(row) else None for i, h in enumerate(headers)}
-            rows.append(row_dict)
-        wb.close()
-        return rows
+        return self._open(file_path).to_dict(orient="records")
+
+    def _read(self, file_path: str):
+        return self._read_frame(file_path, sheet_name=0, dtype=self.COLUMN_DTYPES)
 
     def transform_row(self, raw_row: Dict[str, Any], batch_id: str) -> Optional[Dict[str, Any]]:
         t = self._create_base_row(batch_id)
@@ -81,16 +79,65 @@ class CDLCProcessor(BibbiBseProcessor):
         year = raw_row.get("Year")
         if month and year:
             m, y = self._to_int(month, "Month"), self._to_int(year, "Year")
-            t["sale_date"] = datetime(y, m, 1).date().isoformat()
-            t["year"], t["month"], t["quarter"] = y, m, self._calculate_quarter(m)
+            t["sale_date"] = month_start_iso(y, m)
+            t["year"], t["month"], t["quarter"] = y, m, QUARTER_BY_MONTH[m]
         else:
             now = datetime.utcnow()
             t["sale_date"] = now.date().isoformat()
-            t["year"], t["month"], t["quarter"] = now.year, now.month, self._calculate_quarter(now.month)
+            t["year"], t["month"], t["quarter"] = now.year, now.month, QUARTER_BY_MONTH[now.month]
         
         store = raw_row.get("Store") or raw_row.get("Shop")
-        t["store_identifier"] = str(store).strip().lower().replace(' ', '_') if store else "e-shop"
+        t["store_identifier"] = normalize_store_identifier(store) if store else "e-shop"
         return t
 
+    def transform_dataframe(self, df, batch_id: str) -> Tuple[Dict[str, List[Any]], List[Dict[str, Any]]]:
+        """Column-wise transform_row: same checks, error messages and output per row"""
+        errors = RowErrors(df.index)
+
+        ean_raw = first_truthy(df, "EAN", "Product EAN")
+        ean = normalize_ean(ean_raw)
+        errors.add(~truthy(ean_raw), "Missing EAN")
+        errors.add(~is_ean13(ean), "Invalid EAN format: " + ean + " (must be 13 digits)")
+
+        qty_raw = first_truthy(df, "Quantity", "Qty")
+        qty = to_number(qty_raw)
+        errors.add(qty_raw.isna(), "Missing Quantity")
+        errors.add(qty.isna(), "Invalid integer for Quantity: " + qty_raw.astype(str))
+
+        sales_raw = first_truthy(df, "Total", "Amount")
+        sales = to_number(sales_raw).where(sales_raw != "", 0.0)
+        errors.add(sales_raw.isna(), "Missing Total/Amount")
+        errors.add(sales.isna(), "Invalid float for Total: " + sales_raw.astype(str))
+
+        month_raw, year_raw = column(df, "Month"), column(df, "Year")
+        dated = truthy(month_raw) & truthy(year_raw)
+        month_num, year_num = to_number(month_raw), to_number(year_raw)
+        errors.add(dated & month_num.isna(), "Invalid integer for Month: " + month_raw.astype(str))
+        errors.add(dated & year_num.isna(), "Invalid integer for Year: " + year_raw.astype(str))
+        month, year = truncate_to_int(month_num), truncate_to_int(year_num)
+        # datetime(y, m, 1) checks the year first
+        errors.add(dated & ~year.between(1, 9999), "year " + year.astype(str) + " is out of range")
+        errors.add(dated & ~month.between(1, 12), "month must be in 1..12")
+
+        ok = errors.ok
+        now = datetime.utcnow()
+        month = month.where(dated, now.month)[ok]
+        year = year.where(dated, now.year)[ok]
+        sales = sales[ok].astype("float64")
+
+        out = pd.DataFrame({
+            "product_ean": ean[ok],
+            "quantity": truncate_to_int(qty)[ok],
+            "is_return": False,
+            "sales_local_currency": sales,
+            "sales_eur": sales,
+            "sale_date": month_start(year, month).where(dated[ok], now.date().isoformat()),
+            "year": year,
+            "month": month,
+            "quarter": quarter(month),
+            "store_identifier": normalize_store(first_truthy(df, "Store", "Shop"), "e-shop")[ok],
+        })
+        return self._frame_output(df, out, errors, batch_id)
+
 def get_cdlc_processor(reseller_id: str) -> CDLCProcessor:
     return CDLCProcessor(reseller_id)
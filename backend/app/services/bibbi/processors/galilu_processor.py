@@ -10,14 +10,28 @@ Handles Galilu Poland reseller data with special cases:
 Based on: backend/BIBBI/Resellers/resellers_info.md
 """
 
-from typing import List, Dict, Any, Optional
+import logging
+from contextlib import contextmanager
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Set, Tuple
 from datetime import datetime
 import openpyxl
-
-from .base import BibbiBseProcessor
+import pandas as pd
+from openpyxl.worksheet.worksheet import Worksheet
+
+from .base import BibbiBseProcessor, ProcessingResult, QUARTER_BY_MONTH, month_fields, normalize_store_identifier, _chunked, CalamineWorkbook
+from app.utils.excel import get_sheet_headers
+from app.utils.frames import (
+    RowErrors, column, first_truthy, month_start, quarter, to_number,
+    truncate_to_int, truthy
+)
 from app.core.bibbi import BibbιDB
 from app.services.bibbi.product_mapping_service import BibbιProductMappingService
 
+logger = logging.getLogger(__name__)
+
+# (sheet_name, headers, records): one store sheet's rows as value tuples
+SheetRecords = Tuple[str, List[str], List[Tuple[Any, ...]]]
+
 
 class GaliluProcessor(BibbiBseProcessor):
     """Process Galilu Excel files with product name matching"""
@@ -25,6 +39,18 @@ class GaliluProcessor(BibbiBseProcessor):
     VENDOR_NAME = "galilu"
     CURRENCY = "PLN"
     PLN_TO_EUR_RATE = 0.23
+    VECTORIZED = True
+
+    # Sheets that hold no store data (besides "_"-prefixed system sheets)
+    SKIP_SHEETS = frozenset({"info", "metadata"})
+
+    # Rows whose product names and prices are resolved together in the row
+    # path (see _transform_rows); new names only cost one lookup per chunk
+    LOOKUP_CHUNK_ROWS = 10_000
+
+    # EANs per products query in _prefetch_prices (keeps the in.(...) filter
+    # well under PostgREST URL length limits)
+    PRICE_LOOKUP_CHUNK = 500
 
     # Column mapping from Galilu format to internal names
     COLUMN_MAPPING = {
@@ -48,6 +74,13 @@ class GaliluProcessor(BibbiBseProcessor):
         self.bibbi_db = bibbi_db
         # Initialize product mapping service for product name → EAN mapping
         self.product_mapping_service = BibbιProductMappingService(bibbi_db) if bibbi_db else None
+        # EAN -> list price (None = not in products); filled for each file by
+        # _prefetch_prices, consulted by _get_product_list_price, cleared by
+        # process() so corrected list prices apply to the next upload
+        self._price_cache: Dict[str, Optional[float]] = {}
+        # Product name -> EAN (None = not mapped); see _map_product_names.
+        # Cleared by process() so mappings added since the last upload apply
+        self._name_to_ean: Dict[str, Optional[str]] = {}
 
     def get_vendor_name(self) -> str:
         return self.VENDOR_NAME
@@ -65,51 +98,14 @@ class GaliluProcessor(BibbiBseProcessor):
         Returns:
             List of store dictionaries (one per sheet)
         """
-        stores = []
-
         try:
-            workbook = self._load_workbook(file_path)
-
-            for sheet_name in workbook.sheetnames:
-                # Skip system/hidden sheets
-                if sheet_name.startswith('_') or sheet_name.lower() in ['info', 'metadata']:
-                    continue
-
-                # Normalize store name
-                store_identifier = sheet_name.strip().lower().replace(' ', '_')
-
-                stores.append({
-                    "store_identifier": store_identifier,
-                    "store_name": f"Galilu {sheet_name}",
-                    "store_type": "physical",  # Galilu stores are physical retail
-                    "reseller_id": self.reseller_id,
-                    "country": "Poland"
-                })
-
-            workbook.close()
-
-            if not stores:
-                # Fallback: If no valid sheets, create single store
-                stores = [{
-                    "store_identifier": "galilu_main",
-                    "store_name": "Galilu Main Store",
-                    "store_type": "physical",
-                    "reseller_id": self.reseller_id,
-                    "country": "Poland"
-                }]
-
+            stores = self._open(file_path)[0]
         except Exception as e:
-            print(f"[Galilu] Error extracting stores: {e}")
-            # Fallback
-            stores = [{
-                "store_identifier": "galilu_main",
-                "store_name": "Galilu Main Store",
-                "store_type": "physical",
-                "reseller_id": self.reseller_id,
-                "country": "Poland"
-            }]
-
-        return stores
+            logger.warning("Error extracting stores: %s", e)
+            stores = []
+
+        # Fallback: If no valid sheets, create single store
+        return stores or [self._main_store()]
 
     def extract_rows(self, file_path: str) -> List[Dict[str, Any]]:
         """
@@ -118,31 +114,122 @@ class GaliluProcessor(BibbiBseProcessor):
         CRITICAL: Must process ALL sheets (each = different store)
         Each row gets tagged with sheet_name for store mapping
         """
-        all_rows = []
+        return list(_row_dicts(self._open(file_path)[1]))
 
-        workbook = self._load_workbook(file_path)
+    def iter_rows(self, file_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Stream rows of every store sheet, tagged with _sheet_name
 
-        for sheet_name in workbook.sheetnames:
-            # Skip system sheets
-            if sheet_name.startswith('_') or sheet_name.lower() in ['info', 'metadata']:
-                continue
+        Same rows as extract_rows(), read sheet by sheet without keeping
+        them; the workbook is closed when the generator finishes or is
+        closed. Feeding this to iter_transformed-style consumers keeps
+        memory flat in the row count.
+        """
+        with _sheet_reader(file_path, self._load_workbook) as (sheetnames, read_sheet):
+            for sheet_name in self._data_sheet_names(sheetnames):
+                headers, records = read_sheet(sheet_name)
+                yield from _row_dicts([(sheet_name, headers, records)])
+
+    def _data_sheet_names(self, sheetnames: List[str]) -> List[str]:
+        """Store sheets of a workbook, skipping system/hidden sheets"""
+        return [
+            name for name in sheetnames
+            if not (name.startswith('_') or name.lower() in self.SKIP_SHEETS)
+        ]
+
+    def _read(self, file_path: str) -> Tuple[List[Dict[str, Any]], List[SheetRecords]]:
+        # Stores and rows come from the same pass; process() parses the file once
+        return self._extract_sheets(file_path)
+
+    def extract_all(self, file_path: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Extract stores and rows in a single pass over the workbook
+
+        Each non-system sheet yields one store and its data rows, so the
+        file is unzipped and parsed once for both. Sheets are read with
+        python-calamine when installed, otherwise openpyxl read-only.
+
+        Returns:
+            (stores, rows): one store per sheet (possibly empty), and all
+            rows tagged with their _sheet_name
+        """
+        stores, sheets = self._extract_sheets(file_path)
+        return stores, list(_row_dicts(sheets))
 
-            sheet = workbook[sheet_name]
-            headers = self._get_sheet_headers(sheet)
+    def _extract_sheets(self, file_path: str) -> Tuple[List[Dict[str, Any]], List[SheetRecords]]:
+        """
+        extract_all() with rows kept per sheet as value tuples
 
-            for row in sheet.iter_rows(min_row=2, values_only=True):
-                if not any(row):
-                    continue
+        Returns:
+            (stores, sheets): one (sheet_name, headers, records) per store
+            sheet, each record a tuple of cell values in header order. A
+            tuple costs a fraction of a dict per row, and the column path
+            frames the records directly (see _open_frame)
+        """
+        with _sheet_reader(file_path, self._load_workbook) as (sheetnames, read_sheet):
+            sheet_names = self._data_sheet_names(sheetnames)
+            stores = [self._store_for_sheet(sheet_name) for sheet_name in sheet_names]
+
+            sheets = []
+            for sheet_name in sheet_names:
+                headers, records = read_sheet(sheet_name)
+                sheets.append((sheet_name, headers, list(records)))
+
+        return stores, sheets
+
+    def _store_for_sheet(self, sheet_name: str) -> Dict[str, Any]:
+        return {
+            # Normalize store name
+            "store_identifier": normalize_store_identifier(sheet_name),
+            "store_name": f"Galilu {sheet_name}",
+            "store_type": "physical",  # Galilu stores are physical retail
+            "reseller_id": self.reseller_id,
+            "country": "Poland"
+        }
+
+    def _main_store(self) -> Dict[str, Any]:
+        return {
+            "store_identifier": "galilu_main",
+            "store_name": "Galilu Main Store",
+            "store_type": "physical",
+            "reseller_id": self.reseller_id,
+            "country": "Poland"
+        }
+
+    def _open_frame(self, file_path: str):
+        """Rows of every store sheet in one frame; _sheet_name carries the store"""
+        frames = []
+        for sheet_name, headers, records in self._open(file_path)[1]:
+            if len(set(headers)) == len(headers) and "_sheet_name" not in headers:
+                frame = pd.DataFrame(records, columns=headers, dtype=object)
+                frame.insert(0, "_sheet_name", sheet_name)
+            else:
+                # Repeated headers: the last such column wins, as in the row dicts
+                frame = pd.DataFrame(_row_dicts([(sheet_name, headers, records)]), dtype=object)
+            frames.append(frame)
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
 
-                row_dict = {"_sheet_name": sheet_name}  # Store sheet name for later
-                for idx, header in enumerate(headers):
-                    if idx < len(row):
-                        row_dict[header] = row[idx]
+    def _transform_rows(
+        self,
+        raw_rows: Iterable[Dict[str, Any]],
+        batch_id: str
+    ) -> Iterator[Tuple[Dict[str, Any], Optional[Dict[str, Any]], Optional[Dict[str, Any]], Optional[str]]]:
+        """
+        Base _transform_rows() with product names and prices fetched ahead
 
-                all_rows.append(row_dict)
+        Rows are taken LOOKUP_CHUNK_ROWS at a time, so a streamed iter_rows()
+        is never held whole. Each distinct product name is resolved once,
+        and the new EANs' prices come from a few IN queries per chunk
+        instead of one query per row.
+        """
+        for chunk in _chunked(raw_rows, self.LOOKUP_CHUNK_ROWS):
+            names = {str(name).strip() for name in (row.get("Product") or row.get("Product Name") for row in chunk) if name}
+            name_to_ean = self._map_product_names(names)
+            eans = {name_to_ean.get(name) for name in names}
+            eans.discard(None)
+            self._prefetch_prices(eans)
 
-        workbook.close()
-        return all_rows
+            yield from super()._transform_rows(chunk, batch_id)
 
     def transform_row(
         self,
@@ -182,7 +269,8 @@ class GaliluProcessor(BibbiBseProcessor):
             raise ValueError("Missing Quantity")
 
         try:
-            quantity = self._to_int(qty_value, "Quantity")
+            # openpyxl returns whole-number cells as int; skip the call for those
+            quantity = qty_value if type(qty_value) is int else self._to_int(qty_value, "Quantity")
             if quantity <= 0:
                 raise ValueError(f"Invalid quantity: {quantity}")
 
@@ -200,7 +288,7 @@ class GaliluProcessor(BibbiBseProcessor):
         # Calculate sales amount
         sales_pln = list_price * quantity
         transformed["sales_local_currency"] = sales_pln
-        transformed["sales_eur"] = self._convert_currency(sales_pln, "PLN")
+        transformed["sales_eur"] = self._convert_eur(sales_pln)
 
         # Extract date information
         month_value = raw_row.get("Month")
@@ -208,8 +296,8 @@ class GaliluProcessor(BibbiBseProcessor):
 
         if month_value and year_value:
             try:
-                month = self._to_int(month_value, "Month")
-                year = self._to_int(year_value, "Year")
+                month = month_value if type(month_value) is int else self._to_int(month_value, "Month")
+                year = year_value if type(year_value) is int else self._to_int(year_value, "Year")
 
                 if month < 1 or month > 12:
                     raise ValueError(f"Invalid month: {month}")
@@ -218,10 +306,8 @@ class GaliluProcessor(BibbiBseProcessor):
                     raise ValueError(f"Invalid year: {year}")
 
                 # Create sale_date (use first day of month)
-                transformed["sale_date"] = datetime(year, month, 1).date().isoformat()
-                transformed["year"] = year
-                transformed["month"] = month
-                transformed["quarter"] = self._calculate_quarter(month)
+                transformed["sale_date"], transformed["year"], transformed["month"], transformed["quarter"] = \
+                    month_fields(year, month)
 
             except ValueError as e:
                 raise ValueError(f"Invalid date: {e}")
@@ -231,15 +317,87 @@ class GaliluProcessor(BibbiBseProcessor):
             transformed["sale_date"] = now.date().isoformat()
             transformed["year"] = now.year
             transformed["month"] = now.month
-            transformed["quarter"] = self._calculate_quarter(now.month)
+            transformed["quarter"] = QUARTER_BY_MONTH[now.month]
 
         # Extract store from sheet name
         sheet_name = raw_row.get("_sheet_name", "Sheet1")
-        store_identifier = sheet_name.strip().lower().replace(' ', '_')
-        transformed["store_identifier"] = store_identifier
+        # Same identifier as the sheet's store (normalized once per sheet)
+        transformed["store_identifier"] = normalize_store_identifier(sheet_name)
 
         return transformed
 
+    def transform_dataframe(self, df, batch_id: str) -> Tuple[Dict[str, List[Any]], List[Dict[str, Any]]]:
+        """Column-wise transform_row: same checks, error messages and output per row"""
+        errors = RowErrors(df.index)
+
+        # Product name → EAN, matched once per distinct name
+        name_raw = first_truthy(df, "Product", "Product Name")
+        named = truthy(name_raw)
+        name = name_raw.astype(str).str.strip()
+        errors.add(~named, "Missing Product name")
+        distinct_names = set(name[named])
+        self._map_product_names(distinct_names)
+        ean = name.map({n: self._match_product_name_to_ean(n) for n in distinct_names})
+        mapped = truthy(ean)
+        errors.add(~mapped, "Product not mapped: " + name)
+
+        # Quantity (transform_row wraps these messages in "Invalid quantity: ")
+        qty_raw = first_truthy(df, "Quantity", "Qty")
+        qty = to_number(qty_raw)
+        errors.add(qty_raw.isna(), "Missing Quantity")
+        errors.add(qty.isna(), "Invalid quantity: Invalid integer for Quantity: " + qty_raw.astype(str))
+        quantity = truncate_to_int(qty)
+        errors.add(quantity <= 0, "Invalid quantity: Invalid quantity: " + quantity.astype(str))
+
+        # List price from products, fetched once per distinct EAN
+        distinct_eans = set(ean[mapped])
+        self._prefetch_prices(distinct_eans)
+        list_price = ean.map({e: self._get_product_list_price(e) for e in distinct_eans})
+        errors.add(list_price.isna(), "Product price not found for EAN: " + ean.astype(str))
+
+        # Date (Month is converted before Year, as in transform_row)
+        month_raw, year_raw = column(df, "Month"), column(df, "Year")
+        dated = truthy(month_raw) & truthy(year_raw)
+        month_num, year_num = to_number(month_raw), to_number(year_raw)
+        errors.add(dated & month_num.isna(), "Invalid date: Invalid integer for Month: " + month_raw.astype(str))
+        errors.add(dated & year_num.isna(), "Invalid date: Invalid integer for Year: " + year_raw.astype(str))
+        month, year = truncate_to_int(month_num), truncate_to_int(year_num)
+        errors.add(dated & ~month.between(1, 12), "Invalid date: Invalid month: " + month.astype(str))
+        errors.add(dated & ~year.between(2000, 2100), "Invalid date: Invalid year: " + year.astype(str))
+
+        ok = errors.ok
+        # Store from sheet name: normalized once per sheet, then mapped to rows
+        sheet = column(df, "_sheet_name")[ok]
+        store = sheet.map({name: normalize_store_identifier(name) for name in sheet[truthy(sheet)].unique()})
+        now = datetime.utcnow()
+        month = month.where(dated, now.month)[ok]
+        year = year.where(dated, now.year)[ok]
+        quantity = quantity[ok]
+        sales_local = list_price[ok].astype("float64") * quantity
+        sales_eur = self._convert_eur_column(sales_local)
+
+        out = pd.DataFrame({
+            "product_name_raw": name[ok],
+            "product_ean": ean[ok],
+            "quantity": quantity,
+            "is_return": False,
+            "sales_local_currency": sales_local,
+            "sales_eur": sales_eur,
+            "sale_date": month_start(year, month).where(dated[ok], now.date().isoformat()),
+            "year": year,
+            "month": month,
+            "quarter": quarter(month),
+            "store_identifier": store.where(truthy(sheet), "sheet1"),
+        })
+        return self._frame_output(df, out, errors, batch_id)
+
+    def process(self, file_path: str, batch_id: str) -> ProcessingResult:
+        """Override base process to start each run with fresh product lookups"""
+        # Processor instances are reused across uploads (see vendor_router)
+        self._name_to_ean.clear()
+        self._price_cache.clear()
+        return super().process(file_path, batch_id)
+
     def _match_product_name_to_ean(self, product_name: str) -> Optional[str]:
         """
         Match Galilu product name to EAN via product mapping service
@@ -255,8 +413,50 @@ class GaliluProcessor(BibbiBseProcessor):
         Returns:
             EAN (product_ean) or None if not found
         """
+        if product_name in self._name_to_ean:
+            return self._name_to_ean[product_name]
+
+        ean = self._lookup_product_name(product_name)
+        self._name_to_ean[product_name] = ean
+        return ean
+
+    def _map_product_names(self, product_names: Set[str]) -> Dict[str, Optional[str]]:
+        """
+        Resolve many product names into _name_to_ean with one bulk call
+
+        Product names repeat across rows and sheets; each distinct name is
+        matched once per process() run, so transform_row only does dict lookups.
+
+        Args:
+            product_names: Galilu product names (stripped)
+
+        Returns:
+            The name cache (product name -> EAN or None)
+        """
+        pending = [name for name in product_names if name not in self._name_to_ean]
+        if not pending or not self.product_mapping_service:
+            return self._name_to_ean
+
+        try:
+            mapped = self.product_mapping_service.bulk_get_ean_mappings(self.reseller_id, pending)
+        except Exception as e:
+            # Unresolved names fall back to one-by-one matching in transform_row
+            logger.warning("Error matching products: %s", e)
+            return self._name_to_ean
+
+        unmapped = [name for name in pending if not mapped.get(name)]
+        logger.info("Mapped %d/%d product names", len(pending) - len(unmapped), len(pending))
+        if unmapped:
+            logger.info("Products not mapped: %s", unmapped)
+
+        for name in pending:
+            self._name_to_ean[name] = mapped.get(name)
+        return self._name_to_ean
+
+    def _lookup_product_name(self, product_name: str) -> Optional[str]:
+        """Single-name mapping service call behind _match_product_name_to_ean"""
         if not self.product_mapping_service:
-            print(f"[Galilu] Warning: No product mapping service available")
+            logger.warning("No product mapping service available")
             return None
 
         try:
@@ -267,15 +467,16 @@ class GaliluProcessor(BibbiBseProcessor):
                 use_fuzzy_match=True  # Enable fuzzy matching for variations
             )
 
+            # Arguments are only formatted when DEBUG is enabled
             if ean:
-                print(f"[Galilu] Mapped product: '{product_name}' → {ean}")
+                logger.debug("Mapped product: %r -> %s", product_name, ean)
             else:
-                print(f"[Galilu] Product not mapped: '{product_name}'")
+                logger.debug("Product not mapped: %r", product_name)
 
             return ean
 
         except Exception as e:
-            print(f"[Galilu] Error matching product: {e}")
+            logger.warning("Error matching product: %s", e)
             return None
 
     def _get_product_list_price(self, ean: str) -> Optional[float]:
@@ -291,8 +492,11 @@ class GaliluProcessor(BibbiBseProcessor):
         Returns:
             List price or None if not found
         """
+        if ean in self._price_cache:
+            return self._price_cache[ean]
+
         if not self.bibbi_db:
-            print(f"[Galilu] Warning: No database client for price lookup")
+            logger.warning("No database client for price lookup")
             return None
 
         try:
@@ -311,9 +515,120 @@ class GaliluProcessor(BibbiBseProcessor):
             return None
 
         except Exception as e:
-            print(f"[Galilu] Error getting product price: {e}")
+            logger.warning("Error getting product price: %s", e)
             return None
 
+    def _prefetch_prices(self, eans: Set[str]) -> Dict[str, Optional[float]]:
+        """
+        Load list prices for many EANs into _price_cache
+
+        One products query per PRICE_LOOKUP_CHUNK EANs, using an IN filter.
+        EANs the table has no (truthy) price for are cached as None, so
+        _get_product_list_price does not query them again one by one.
+
+        Args:
+            eans: Product EANs
+
+        Returns:
+            The price cache (EAN -> list price or None)
+        """
+        pending = sorted(ean for ean in eans if ean not in self._price_cache)
+        if not pending or not self.bibbi_db:
+            return self._price_cache
+
+        try:
+            for start in range(0, len(pending), self.PRICE_LOOKUP_CHUNK):
+                chunk = pending[start:start + self.PRICE_LOOKUP_CHUNK]
+                # NOTE: Use raw client to bypass tenant filter (products table has no tenant_id)
+                result = self.bibbi_db.client.table("products")\
+                    .select("ean,list_price")\
+                    .in_("ean", chunk)\
+                    .execute()
+
+                prices = {row.get("ean"): row.get("list_price") for row in result.data or []}
+                for ean in chunk:
+                    list_price = prices.get(ean)
+                    self._price_cache[ean] = float(list_price) if list_price else None
+
+        except Exception as e:
+            # Whatever was not cached falls back to per-EAN lookups
+            logger.warning("Error prefetching product prices: %s", e)
+
+        return self._price_cache
+
+
+def _sheet_records(sheet: Worksheet) -> Tuple[List[str], Iterator[Tuple[Any, ...]]]:
+    """(headers, data rows) of one openpyxl store sheet; rows are value tuples"""
+    # Read-only sheets trust the file's stored dimensions, which some
+    # exporters write wrong; read to the real end of the data instead
+    sheet.reset_dimensions()
+    headers = get_sheet_headers(sheet, header_row=1)
+    width = len(headers)
+
+    # any() runs in C and stops at the first filled cell; Galilu columns are
+    # found by header, so no fixed cell can stand in for the row. Cells past
+    # the last header are dropped, as zipping against the headers did
+    records = (
+        row if len(row) <= width else row[:width]
+        for row in sheet.iter_rows(min_row=2, values_only=True)
+        if any(row)
+    )
+    return headers, records
+
+
+def _calamine_records(rows: Iterable[List[Any]]) -> Tuple[List[str], Iterator[Tuple[Any, ...]]]:
+    """_sheet_records() for a python-calamine sheet (its to_python() rows)"""
+    rows = iter(rows)
+    # Same header rules as get_sheet_headers: filled cells, stripped
+    headers = [str(value).strip() for value in next(rows, []) if value]
+    width = len(headers)
+
+    def records() -> Iterator[Tuple[Any, ...]]:
+        for row in rows:
+            if not any(row):
+                continue
+            # Calamine reports empty cells as ""; openpyxl reports None
+            if "" in row:
+                row = [None if value == "" else value for value in row]
+            yield tuple(row[:width])
+
+    return headers, records()
+
+
+def _row_dicts(sheets: Iterable[SheetRecords]) -> Iterator[Dict[str, Any]]:
+    """Row dictionaries keyed by header, each tagged with its _sheet_name"""
+    for sheet_name, headers, records in sheets:
+        for record in records:
+            row_dict = {"_sheet_name": sheet_name}  # Store sheet name for later
+            row_dict.update(zip(headers, record))
+            yield row_dict
+
+
+@contextmanager
+def _sheet_reader(file_path: str, load_workbook: Callable[..., Any]):
+    """
+    Open file_path once for reading store sheets
+
+    Yields (sheet names, read) where read(sheet_name) returns that sheet's
+    (headers, records). Uses python-calamine (Rust parser, sheet list
+    without parsing sheet bodies) when installed; otherwise load_workbook
+    in read-only mode, which streams each sheet's XML. The workbook is
+    closed on exit.
+    """
+    if CalamineWorkbook is not None:
+        # Leading empty rows/columns are kept so row 1 is the header row
+        with CalamineWorkbook.from_path(file_path) as workbook:
+            yield workbook.sheet_names, lambda name: _calamine_records(
+                workbook.get_sheet_by_name(name).to_python(skip_empty_area=False)
+            )
+        return
+
+    workbook = load_workbook(file_path, read_only=True)
+    try:
+        yield workbook.sheetnames, lambda name: _sheet_records(workbook[name])
+    finally:
+        workbook.close()
+
 
 def get_galilu_processor(reseller_id: str, bibbi_db: BibbιDB) -> GaliluProcessor:
     """
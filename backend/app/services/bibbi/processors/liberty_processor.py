@@ -11,14 +11,33 @@ Handles Liberty UK reseller data with special cases:
 Based on: backend/BIBBI/Resellers/resellers_info.md
 """
 
-from typing import List, Dict, Any, Optional
-from datetime import datetime
-import openpyxl
+from collections import Counter, deque
+from itertools import islice
+from operator import itemgetter
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Sequence, Tuple
+from datetime import date, datetime
+import logging
+import pandas as pd
 import re
-import hashlib
+import time
 from supabase import Client
 
-from .base import BibbiBseProcessor
+from app.utils.frames import RowErrors, column, to_number, truncate_to_int, truthy
+from .base import BibbiBseProcessor, ProcessingResult, QUARTER_BY_MONTH, _chunked, CalamineWorkbook
+
+logger = logging.getLogger(__name__)
+
+# Liberty products shared by processor instances:
+# reseller_id -> (time.monotonic() when started, {liberty_name: {ean, functional_name} or None if not found})
+_LIBERTY_PRODUCTS_CACHE: Dict[str, Tuple[float, Dict[str, Optional[Dict[str, Any]]]]] = {}
+
+# Report date at the end of the filename: "... 28-09-2025.xlsx" or "27_04_2025.xlsx"
+_FILE_DATE_RE = re.compile(r'(\d{2})[-_](\d{2})[-_](\d{4})\.xlsx$', re.IGNORECASE)
+
+# Row 3 headers of a store's quantity column ("Sales Qty Un") and GBP sales
+# column ("Sales Inc VAT £ "): one case-insensitive scan per header cell
+_QTY_HEADER_RE = re.compile(r'qty|quantity', re.IGNORECASE)
+_SALES_HEADER_RE = re.compile(r'sales.*£|£.*sales', re.IGNORECASE | re.DOTALL)
 
 
 class LibertyProcessor(BibbiBseProcessor):
@@ -27,6 +46,11 @@ class LibertyProcessor(BibbiBseProcessor):
     VENDOR_NAME = "liberty"
     CURRENCY = "GBP"
     GBP_TO_EUR_RATE = 1.17
+    VECTORIZED = True
+    # Seconds looked-up products are reused by later files and processors
+    PRODUCT_CACHE_TTL = 300
+    # Liberty names per products query (.in_ filters travel in the URL)
+    PRODUCT_LOOKUP_CHUNK = 500
 
     # Column mapping from Liberty format to internal names
     # NOTE: Liberty has 3-row headers (rows 1-3), actual data starts at row 4
@@ -38,6 +62,31 @@ class LibertyProcessor(BibbiBseProcessor):
         "Sales Inc VAT £": "sales_gbp",  # Alternative without trailing space
     }
 
+    # Fields of each record extract_rows() yields (see _read_columns). The
+    # store's "Actual" quantity and GBP sales sit under fixed keys, whichever
+    # row 3 header they were read from
+    ROW_FIELDS = ('liberty_name', 'Item', '_qty', '_sales_gbp', 'store_identifier')
+
+    # Store column headers of single-store-column exports (see extract_stores)
+    STORE_HEADERS = frozenset({"Store", "Location", "Shop"})
+    # Substrings of a (lowercased) store column value that mark an online store
+    ONLINE_STORE_KEYWORDS = ("online", "web", "e-commerce", "ecom")
+
+    # Store identifier -> (city, sales_channel). Identifiers arrive lowercased
+    # from _parse_store_columns(); stores not listed are physical London shops
+    STORE_GEO = {
+        "flagship": ("London", "retail"),
+        "online": ("online", "online"),
+        "internet": ("online", "online"),
+    }
+    DEFAULT_STORE_GEO = ("London", "retail")
+
+    # Row 1 headers (lowercased) that are product columns or totals, not stores
+    NON_STORE_HEADERS = frozenset({
+        'retail group', 'brand', 'colour phase', 'product group', 'item id | colour', 'item',
+        'all warehouse', 'all sales channels', 'total'
+    })
+
     # Store-specific column pattern
     # Format: "Flagship" -> "Sales Qty Un", "Internet" -> "Sales Qty Un"
     # We need to detect which columns belong to which store dynamically
@@ -49,31 +98,80 @@ class LibertyProcessor(BibbiBseProcessor):
         # Store Supabase client for product lookups
         self.supabase = supabase_client
 
-        # Pre-load Liberty products into memory for fast lookups
-        # Query products table for all Liberty products
+        # Products for the Liberty names seen so far, filled per file by
+        # _load_liberty_products() once the file is parsed
         # Format: {liberty_name: {ean, functional_name}}
         self.liberty_products = {}
+
+        # Report date from the filename of the file being processed (see _read_columns)
+        self._current_file_date: Optional[date] = None
+        # (sale_date, year, month, quarter) every row of that file gets: the
+        # report date, or the current date for undated reports
+        self._sale_date_fields: Tuple[str, int, int, int] = _sale_date_fields(None)
+
+        # Store column values of the file being processed, None when it has no
+        # Store/Location/Shop column (see _read_columns and extract_stores)
+        self._store_column_values: Optional[List[Any]] = None
+
+        # Track unmatched Liberty names for reporting (name -> rows seen);
+        # cleared by process() so each run reports only its own misses
+        self.unmatched_liberty_names = Counter()
+
+    def _load_liberty_products(self, liberty_names: Iterable[str]) -> None:
+        """
+        Look up the given Liberty names in the products table
+
+        Only names the file uses are queried, with .in_() in chunks of
+        PRODUCT_LOOKUP_CHUNK, instead of every product that has a
+        liberty_name. Results, misses included, are cached per reseller for
+        PRODUCT_CACHE_TTL seconds, so later files only query names not seen
+        yet. A failed query is not cached and its names stay unmatched.
+
+        Args:
+            liberty_names: Liberty identifiers found in the file
+        """
+        now = time.monotonic()
+        cached = _LIBERTY_PRODUCTS_CACHE.get(self.reseller_id)
+        if cached is None or now - cached[0] >= self.PRODUCT_CACHE_TTL:
+            cached = _LIBERTY_PRODUCTS_CACHE[self.reseller_id] = (now, {})
+        known = cached[1]
+
+        liberty_names = set(filter(None, liberty_names))
+        pending = sorted(name for name in liberty_names if name not in known)
         try:
-            result = self.supabase.table("products")\
-                .select("liberty_name, ean, functional_name")\
-                .not_.is_("liberty_name", "null")\
-                .execute()
-
-            for product in result.data:
-                liberty_name = product.get('liberty_name')
-                if liberty_name:
-                    self.liberty_products[liberty_name] = {
+            for chunk in _chunked(pending, self.PRODUCT_LOOKUP_CHUNK):
+                result = self.supabase.table("products")\
+                    .select("liberty_name, ean, functional_name")\
+                    .in_("liberty_name", chunk)\
+                    .execute()
+
+                found = {
+                    product['liberty_name']: {
                         'ean': product['ean'],
                         'functional_name': product['functional_name']
                     }
-
-            print(f"[Liberty] Pre-loaded {len(self.liberty_products)} products from products table")
+                    for product in result.data if product.get('liberty_name')
+                }
+                for liberty_name in chunk:
+                    known[liberty_name] = found.get(liberty_name)
         except Exception as e:
-            print(f"[Liberty] WARNING: Failed to pre-load products: {e}")
-            self.liberty_products = {}
+            logger.warning("Failed to load products: %s", e)
 
-        # Track unmatched Liberty names for reporting
-        self.unmatched_liberty_names = []
+        for liberty_name in liberty_names:
+            product = known.get(liberty_name)
+            if product:
+                self.liberty_products[liberty_name] = product
+
+        logger.info("Loaded %d products from products table (%d of %d names queried)",
+                    len(self.liberty_products), len(pending), len(liberty_names))
+
+    @staticmethod
+    def invalidate_product_cache(reseller_id: Optional[str] = None) -> None:
+        """Forget cached Liberty products (after products change, or between tests); all resellers if None"""
+        if reseller_id is None:
+            _LIBERTY_PRODUCTS_CACHE.clear()
+        else:
+            _LIBERTY_PRODUCTS_CACHE.pop(reseller_id, None)
 
     def get_vendor_name(self) -> str:
         return self.VENDOR_NAME
@@ -96,18 +194,12 @@ class LibertyProcessor(BibbiBseProcessor):
         stores = []
 
         try:
-            workbook = self._load_workbook(file_path)
-            sheet = workbook[workbook.sheetnames[0]]
-            headers = self._get_sheet_headers(sheet)
-
-            # Find store column
-            store_col_idx = None
-            for idx, header in enumerate(headers):
-                if header in ["Store", "Location", "Shop"]:
-                    store_col_idx = idx
-                    break
+            # The store column is collected by the same parse extract_rows()
+            # uses, so within process() the workbook is only opened once
+            self._open(file_path)
+            store_column_values = self._store_column_values
 
-            if store_col_idx is None:
+            if store_column_values is None:
                 # No store column - assume single store
                 # Liberty minimum: Flagship + internet
                 stores = [
@@ -128,35 +220,28 @@ class LibertyProcessor(BibbiBseProcessor):
                     }
                 ]
             else:
-                # Extract unique store identifiers
-                seen_stores = set()
-                for row in sheet.iter_rows(min_row=2, values_only=True):
-                    if not any(row):
-                        continue
-
-                    store_value = row[store_col_idx] if store_col_idx < len(row) else None
-                    if store_value:
-                        store_str = str(store_value).strip().lower()
-                        if store_str and store_str not in seen_stores:
-                            seen_stores.add(store_str)
-
-                            # Determine store type
-                            is_online = any(keyword in store_str for keyword in ["online", "web", "e-commerce", "ecom"])
-                            store_type = "online" if is_online else "physical"
-
-                            stores.append({
-                                "store_identifier": store_str,
-                                "store_name": f"Liberty {store_value.strip()}",
-                                "store_type": store_type,
-                                "reseller_id": self.reseller_id,
-                                "city": "London" if store_type == "physical" else None,
-                                "country": "UK"
-                            })
-
-            workbook.close()
+                # Extract unique store identifiers, in order of first appearance
+                store_values = pd.Series(store_column_values, dtype=object)
+                store_names = store_values[truthy(store_values)].astype(str).str.strip()
+                unique_stores = pd.DataFrame({"identifier": store_names.str.lower(), "name": store_names})
+                unique_stores = unique_stores[unique_stores["identifier"] != ""].drop_duplicates("identifier")
+
+                for store_str, store_name in zip(unique_stores["identifier"], unique_stores["name"]):
+                    # Determine store type
+                    is_online = any(keyword in store_str for keyword in self.ONLINE_STORE_KEYWORDS)
+                    store_type = "online" if is_online else "physical"
+
+                    stores.append({
+                        "store_identifier": store_str,
+                        "store_name": f"Liberty {store_name}",
+                        "store_type": store_type,
+                        "reseller_id": self.reseller_id,
+                        "city": "London" if store_type == "physical" else None,
+                        "country": "UK"
+                    })
 
         except Exception as e:
-            print(f"[Liberty] Error extracting stores: {e}")
+            logger.warning("Error extracting stores: %s", e)
             # Fallback to default stores
             stores = [
                 {
@@ -178,7 +263,54 @@ class LibertyProcessor(BibbiBseProcessor):
 
         return stores
 
-    def _parse_store_columns(self, sheet) -> Dict[str, Dict[str, int]]:
+    def _read_header_rows(self, rows: Iterator[Sequence[Any]]) -> List[tuple]:
+        """
+        Take Liberty's 3 header rows from the front of a row stream
+
+        Args:
+            rows: Sheet rows from _sheet_rows(); the data rows stay unread
+
+        Returns:
+            Rows 1-3 as tuples of equal length (missing rows/cells as None)
+        """
+        header_rows = list(islice(rows, 3))
+        header_rows += [()] * (3 - len(header_rows))
+        # Streamed rows end at their last filled cell; pad to a common width so
+        # columns past the last store name in row 1 are still visited
+        width = max(len(row) for row in header_rows)
+        return [tuple(row) + (None,) * (width - len(row)) for row in header_rows]
+
+    def _sheet_rows(self, file_path: str) -> Iterator[Sequence[Any]]:
+        """
+        Stream the first sheet's rows (values only), row 1 first
+
+        Uses python-calamine (Rust xlsx parser) when installed, otherwise
+        openpyxl read-only mode, which streams the sheet XML instead of
+        building every cell; data_only returns cached formula values. Both
+        report empty cells as None. The workbook is closed once the rows
+        are exhausted or the generator is closed.
+        """
+        if CalamineWorkbook is not None:
+            # Keep leading empty rows/columns so indices match openpyxl's.
+            # to_python() returns every row at once, so the file is closed first
+            with CalamineWorkbook.from_path(file_path) as workbook:
+                rows = workbook.get_sheet_by_index(0).to_python(skip_empty_area=False)
+            for row in rows:
+                # Calamine reports empty cells as ""; openpyxl reports None
+                yield [None if value == "" else value for value in row] if "" in row else row
+            return
+
+        workbook = self._load_workbook(file_path, read_only=True)
+        try:
+            sheet = workbook[workbook.sheetnames[0]]
+            # Read-only sheets trust the file's stored dimensions, which some
+            # exporters write wrong; read to the real end of the data instead
+            sheet.reset_dimensions()
+            yield from sheet.iter_rows(values_only=True)
+        finally:
+            workbook.close()
+
+    def _parse_store_columns(self, header_rows: List[tuple]) -> Dict[str, Dict[str, int]]:
         """
         Parse Liberty's multi-store column structure from rows 1-3
 
@@ -186,6 +318,9 @@ class LibertyProcessor(BibbiBseProcessor):
         Row 2: Date range labels (Actual, YTD, etc.) - CRITICAL for filtering
         Row 3: Column headers (Sales Qty Un, Sales Inc VAT £, etc.)
 
+        Args:
+            header_rows: Values of rows 1-3, as returned by _read_header_rows()
+
         Returns:
             Dict mapping store identifier to column ranges for "Actual" columns only
             Example: {
@@ -198,60 +333,54 @@ class LibertyProcessor(BibbiBseProcessor):
         # Row 1 has store names like "Flagship", "Internet"
         # Row 2 has date range labels like "Actual", "YTD" - we ONLY want "Actual"
         # Row 3 has column headers like "Sales Qty Un", "Sales Inc VAT £ "
-        row1 = list(sheet[1])
-        row2 = list(sheet[2])
-        row3 = list(sheet[3])
+        row1, row2, row3 = header_rows
 
         current_store = None
         current_row2_label = ""  # Track most recent Row 2 value (handles merged cells)
 
-        for idx, cell in enumerate(row1):
-            if cell.value and str(cell.value).strip():
-                store_name = str(cell.value).strip()
+        for idx, value in enumerate(row1):
+            if value and str(value).strip():
+                store_name = str(value).strip().lower()
 
-                # Skip non-store headers
-                if store_name in ['Retail Group', 'Brand', 'Colour Phase', 'Product Group', 'Item ID | Colour', 'Item', 'All Warehouse', '']:
-                    continue
-
-                # Skip "All Sales Channels" - we want individual stores only
-                if store_name.lower() in ['all sales channels', 'total']:
+                # Skip non-store headers and totals - we want individual stores only
+                if store_name in self.NON_STORE_HEADERS:
                     continue
 
                 # Normalize store name to identifier
-                store_id = store_name.lower().replace(' ', '_')
+                store_id = store_name.replace(' ', '_')
                 if store_id not in store_columns:
                     store_columns[store_id] = {}
                     current_store = store_id
 
             # Update current Row 2 label when we find a value
             # This handles merged cells: when Row 2[idx] is None, we use the last seen label
-            if idx < len(row2) and row2[idx].value:
-                current_row2_label = str(row2[idx].value).strip().lower()
+            if idx < len(row2) and row2[idx]:
+                current_row2_label = str(row2[idx]).strip().lower()
 
             # Find quantity and sales columns under this store
             # CRITICAL FIX: Only map columns in "Actual" sections
             # Use current_row2_label instead of checking current cell (handles merged cells)
-            if current_store and idx < len(row3) and row3[idx].value:
+            if current_store and idx < len(row3) and row3[idx]:
                 # Skip this column if we're not in an "Actual" section
                 if 'actual' not in current_row2_label:
                     continue
 
                 # Now check Row 3 header and map columns
-                header = str(row3[idx].value).strip()
+                header = str(row3[idx])
 
-                if 'qty' in header.lower() or 'quantity' in header.lower():
+                if _QTY_HEADER_RE.search(header):
                     # Only set if not already set (take first "Actual" occurrence)
                     if 'qty_col' not in store_columns[current_store]:
                         store_columns[current_store]['qty_col'] = idx
-                elif 'sales' in header.lower() and '£' in header:
+                elif _SALES_HEADER_RE.search(header):
                     # Only set if not already set (take first "Actual" occurrence)
                     if 'sales_col' not in store_columns[current_store]:
                         store_columns[current_store]['sales_col'] = idx
 
-        print(f"[Liberty] Parsed store columns: {store_columns}")
+        logger.debug("Parsed store columns: %s", store_columns)
         return store_columns
 
-    def extract_rows(self, file_path: str) -> List[Dict[str, Any]]:
+    def extract_rows(self, file_path: str) -> Iterator[Dict[str, Any]]:
         """
         Extract rows from Liberty Excel file
 
@@ -263,107 +392,178 @@ class LibertyProcessor(BibbiBseProcessor):
           - Row 2: Sales data (quantities/amounts by store) - columns M onwards
 
         NEW: Creates MULTIPLE records per product - one for each store with data
+
+        Records are built one at a time from the columns _read_columns()
+        collects, so only the record being transformed exists as a dict.
+        """
+        columns = self._open(file_path)
+        return (dict(zip(columns, values)) for values in zip(*columns.values()))
+
+    def _read(self, file_path: str) -> Dict[str, List[Any]]:
+        # Parsed once per process() run via _open(); products are then looked
+        # up for just the Liberty names this file contains
+        columns = self._read_columns(file_path)
+        self._load_liberty_products(columns['liberty_name'])
+        return columns
+
+    def _read_columns(self, file_path: str) -> Dict[str, List[Any]]:
+        """
+        Parse the report into sales records held column-wise
+
+        One list per ROW_FIELDS field, entry i of each belonging to record
+        i. Six parallel lists cost far less than a six-key dict per record
+        on reports with many products and stores.
+
+        Returns:
+            Dict mapping each ROW_FIELDS name to its list of values
         """
-        workbook = self._load_workbook(file_path, read_only=False)
-        sheet = workbook[workbook.sheetnames[0]]
+        # Rows are only read forward, one at a time; the generator closes the
+        # workbook once exhausted (or when collected, if parsing fails)
+        rows = self._sheet_rows(file_path)
 
         # Parse store column structure
-        store_columns = self._parse_store_columns(sheet)
+        header_rows = self._read_header_rows(rows)
+        store_columns = self._parse_store_columns(header_rows)
+
+        # Exports with a single Store/Location/Shop column (first one in row 1)
+        # name the store per row; its values are kept for extract_stores()
+        store_column_values = None
+        store_idx = next(
+            (idx for idx, value in enumerate(header_rows[0])
+             if value is not None and str(value).strip() in self.STORE_HEADERS),
+            None
+        )
+        if store_idx is not None:
+            store_column_values = [row[store_idx] for row in header_rows[1:]]
+            rows = _tap_column(rows, store_idx, store_column_values)
+        self._store_column_values = store_column_values
 
         # Extract date from filename pattern "Continuity Supplier Size Report DD-MM-YYYY.xlsx" or "DD_MM_YYYY.xlsx"
-        # Example: "28-09-2025.xlsx" or "27_04_2025.xlsx" -> datetime(2025, 9, 28)
+        # Example: "28-09-2025.xlsx" or "27_04_2025.xlsx" -> date(2025, 9, 28)
+        # Every record of the file shares it, so it is kept once on the processor
+        # (one processor handles one file at a time) rather than in each record
         file_date = None
-        date_match = re.search(r'(\d{2})[-_](\d{2})[-_](\d{4})\.xlsx$', file_path, re.IGNORECASE)
+        date_match = _FILE_DATE_RE.search(file_path)
         if date_match:
             day, month, year = date_match.groups()
             try:
-                file_date = datetime(int(year), int(month), int(day))
-                print(f"[Liberty] Extracted date from filename: {file_date.date()}")
+                # Only the calendar date is used, so no datetime is built
+                file_date = date(int(year), int(month), int(day))
+                logger.debug("Extracted date from filename: %s", file_date)
             except ValueError as e:
-                print(f"[Liberty] Invalid date in filename ({day}/{month}/{year}): {e}")
+                logger.warning("Invalid date in filename (%s/%s/%s): %s", day, month, year, e)
                 file_date = None
         else:
-            print(f"[Liberty] Could not extract date from filename: {file_path}")
-
-        # Read row 3 as headers
-        headers = []
-        for cell in sheet[3]:  # Row 3 (1-indexed)
-            if cell.value:
-                headers.append(str(cell.value).strip())
-            else:
-                headers.append("")
-
-        print(f"[Liberty] Found {len(headers)} columns in row 3")
-        print(f"[Liberty] Detected {len(store_columns)} stores with data")
+            logger.warning("Could not extract date from filename: %s", file_path)
+        if file_date is None:
+            # Warned once here; transform_row/transform_dataframe fall back silently
+            logger.warning("No file date found, using current date")
+        self._current_file_date = file_date
+        self._sale_date_fields = _sale_date_fields(file_date)
+
+        logger.debug("Found %d columns in row 3", len(header_rows[2]))
+        logger.debug("Detected %d stores with data", len(store_columns))
+
+        # Stores missing either "Actual" column are skipped; decided once per
+        # file rather than for every product row
+        data_columns = []
+        for store_id, col_info in store_columns.items():
+            qty_col = col_info.get('qty_col')
+            sales_col = col_info.get('sales_col')
+            if qty_col is None or sales_col is None:
+                logger.warning("Store '%s' missing columns (qty_col: %s, sales_col: %s) - skipping",
+                               store_id, qty_col, sales_col)
+                continue
+            data_columns.append((store_id, qty_col, sales_col))
 
         # Process data rows starting from row 4
         # Liberty uses 3-row pattern: description row + blank row + Liberty ID/data row
-        rows = []
-        all_rows = list(sheet.iter_rows(min_row=4, values_only=True))
+        columns = {field: [] for field in self.ROW_FIELDS}
+        append_name, append_item, append_qty, append_sales, append_store = (
+            columns[field].append for field in self.ROW_FIELDS
+        )
+        # Rows stream through a 3-row window (window[0] = description row,
+        # window[2] = data row) instead of being listed up front; appending
+        # to the full window drops its oldest row, i.e. advances one row
+        window = deque(maxlen=3)
+
+        # Data rows are padded to cover every store column, so cells are read
+        # with one itemgetter call instead of a bounds check per cell
+        store_cells = [col for _, qty_col, sales_col in data_columns for col in (qty_col, sales_col)]
+        data_width = max(store_cells, default=-1) + 1
+        get_store_cells = itemgetter(*store_cells) if store_cells else None
+        # Most reports have exactly two stores (Flagship + Internet); those
+        # records are appended without the per-store loop
+        two_stores = len(data_columns) == 2
+        if two_stores:
+            first_store, second_store = data_columns[0][0], data_columns[1][0]
+
+        for row in rows:  # Row 4 onwards
+            window.append(row)
+            if len(window) < 3:
+                continue
 
-        i = 0
-        while i < len(all_rows):
-            description_row = all_rows[i]
+            description_row = window[0]
 
             # Skip empty rows
             if not any(description_row):
-                i += 1
                 continue
 
             # Check if this is a product description row (has text in column F)
             description = description_row[5] if len(description_row) > 5 else None  # Column F (0-indexed: 5)
 
-            # Check if row i+2 exists and has Liberty identifier
-            if i + 2 < len(all_rows):
-                data_row = all_rows[i + 2]
-                liberty_name = data_row[5] if len(data_row) > 5 else None  # Column F (0-indexed: 5)
-
-                # Liberty identifier format: "000834429 | 98-NO COLOUR Total"
-                # Must have "|" and end with "Total"
-                if liberty_name and isinstance(liberty_name, str) and '|' in liberty_name and liberty_name.endswith('Total'):
-                    # This is a valid 3-row product pattern
-
-                    # Create MULTIPLE records - one per store with data
-                    for store_id, col_info in store_columns.items():
-                        qty_col = col_info.get('qty_col')
-                        sales_col = col_info.get('sales_col')
-
-                        if qty_col is None or sales_col is None:
-                            print(f"[Liberty] WARNING: Store '{store_id}' missing columns (qty_col: {qty_col}, sales_col: {sales_col}) - skipping")
-                            continue
-
+            # Check if the row 2 below has a Liberty identifier
+            data_row = window[2]
+            liberty_name = data_row[5] if len(data_row) > 5 else None  # Column F (0-indexed: 5)
+
+            # Liberty identifier format: "000834429 | 98-NO COLOUR Total"
+            # Must have "|" and end with "Total". Read-only cells are str,
+            # numbers or None, so an exact type check suffices; the suffix
+            # test is anchored and rejects most rows before the "|" scan
+            if type(liberty_name) is str and liberty_name.endswith('Total') and '|' in liberty_name:
+                # This is a valid 3-row product pattern
+
+                # Create MULTIPLE records - one per store with data
+                if len(data_row) < data_width:
+                    data_row = (*data_row, *(None,) * (data_width - len(data_row)))
+
+                if two_stores:
+                    first_qty, first_sales, second_qty, second_sales = get_store_cells(data_row)
+                    # Same records, in the same order, as the loop below
+                    if first_qty or first_sales:
+                        append_name(liberty_name)
+                        append_item(description)
+                        append_qty(first_qty)
+                        append_sales(first_sales)
+                        append_store(first_store)
+                    if second_qty or second_sales:
+                        append_name(liberty_name)
+                        append_item(description)
+                        append_qty(second_qty)
+                        append_sales(second_sales)
+                        append_store(second_store)
+                else:
+                    for store_id, qty_col, sales_col in data_columns:
                         # Check if this store has data (non-zero quantity or sales)
-                        qty_value = data_row[qty_col] if qty_col < len(data_row) else None
-                        sales_value = data_row[sales_col] if sales_col < len(data_row) else None
+                        qty_value = data_row[qty_col]
+                        sales_value = data_row[sales_col]
 
                         # Skip if no data for this store
                         if not qty_value and not sales_value:
                             continue
 
-                        # Create a record for this store with Liberty identifier
-                        store_row = {
-                            'liberty_name': liberty_name,  # Liberty identifier for product lookup
-                            'Item': description,  # Keep description for reference
-                            'Sales Qty Un': qty_value,
-                            'Sales Inc VAT £ ': sales_value,
-                            'store_identifier': store_id,  # Add store identifier
-                            '_file_date': file_date  # Add extracted date (None if not found)
-                        }
+                        # Add a record for this store with Liberty identifier
+                        append_name(liberty_name)  # Liberty identifier for product lookup
+                        append_item(description)  # Keep description for reference
+                        append_qty(qty_value)
+                        append_sales(sales_value)
+                        append_store(store_id)  # Add store identifier
 
-                        rows.append(store_row)
+                # Consume all 3 rows (description + blank + data)
+                window.clear()
 
-                    # Skip all 3 rows (description + blank + data)
-                    i += 3
-                else:
-                    # Not a valid 3-row pattern, skip this row
-                    i += 1
-            else:
-                # Not enough rows left for 3-row pattern, skip
-                i += 1
-
-        workbook.close()
-        print(f"[Liberty] Extracted {len(rows)} sales records across {len(store_columns)} stores")
-        return rows
+        logger.info("Extracted %d sales records across %d stores", len(columns['liberty_name']), len(store_columns))
+        return columns
 
     def transform_row(
         self,
@@ -386,9 +586,6 @@ class LibertyProcessor(BibbiBseProcessor):
         - "Actual" columns have monthly sales data
         - Multiple store columns (Flagship, Internet, etc.)
         """
-        # Start with base row
-        transformed = self._create_base_row(batch_id)
-
         # Extract Liberty identifier from raw_row
         # Format: "000834429 | 98-NO COLOUR Total"
         liberty_name = raw_row.get("liberty_name")
@@ -402,35 +599,19 @@ class LibertyProcessor(BibbiBseProcessor):
 
         if product:
             # Match found - use EAN and functional_name from products table
-            transformed["product_ean"] = product["ean"]
-            transformed["functional_name"] = product["functional_name"]
+            product_ean = product["ean"]
+            functional_name = product["functional_name"]
         else:
             # No match found - still insert record with Liberty name as temporary identifier
             # Track as unmatched for reporting but don't discard the sales data
-            self.unmatched_liberty_names.append(liberty_name)
+            self.unmatched_liberty_names[liberty_name] += 1
             # Use Liberty name as temporary product identifier (database allows this per schema comment)
-            transformed["product_ean"] = liberty_name
-            transformed["functional_name"] = liberty_name
-
-        # Store Liberty identifier for reference
-        transformed["product_name_raw"] = liberty_name
+            product_ean = functional_name = liberty_name
 
         # Extract quantity - Liberty has no single "quantity" column
-        # Instead, quantity is in store-specific columns like "Sales Qty Un"
-        # For now, we'll look for YTD quantity (columns after "Actual")
-
-        # Try to find YTD Sales Qty Un column
-        qty_value = None
-        sales_value = None
-
-        # Liberty file structure from row 3:
-        # ...YTD columns are: "Sales Qty Un", "Sales Inc VAT £ " (with trailing space)
-
-        # Check for various quantity column names
-        for col_name in ["Sales Qty Un", "Sold", "Quantity"]:
-            if col_name in raw_row and raw_row[col_name] is not None:
-                qty_value = raw_row[col_name]
-                break
+        # Instead, quantity is in store-specific columns like "Sales Qty Un";
+        # _read_columns() already picked the store's "Actual" cell
+        qty_value = raw_row.get("_qty")
 
         if qty_value is None or qty_value == '':
             # No quantity data - skip this row (might be a header or summary row)
@@ -442,6 +623,14 @@ class LibertyProcessor(BibbiBseProcessor):
                 # Zero quantity - skip
                 return None
 
+            # Start with base row, only for rows that are kept
+            transformed = self._create_base_row(batch_id)
+            transformed["product_ean"] = product_ean
+            transformed["functional_name"] = functional_name
+
+            # Store Liberty identifier for reference
+            transformed["product_name_raw"] = liberty_name
+
             transformed["quantity"] = quantity
 
             # If quantity is negative (returns), mark as return
@@ -454,13 +643,9 @@ class LibertyProcessor(BibbiBseProcessor):
             raise ValueError(f"Invalid quantity: {e}")
 
         # Extract sales amount in GBP
-        # Try different column name variations
-        for col_name in ["Sales Inc VAT £ ", "Sales Inc VAT £", "Value", "Sales"]:
-            if col_name in raw_row and raw_row[col_name] is not None and raw_row[col_name] != '':
-                sales_value = raw_row[col_name]
-                break
+        sales_value = raw_row.get("_sales_gbp")
 
-        if sales_value is None:
+        if sales_value is None or sales_value == '':
             raise ValueError("Missing sales amount")
 
         try:
@@ -470,73 +655,155 @@ class LibertyProcessor(BibbiBseProcessor):
             transformed["sales_local_currency"] = sales_gbp
 
             # Convert to EUR
-            transformed["sales_eur"] = self._convert_currency(sales_gbp, "GBP")
+            transformed["sales_eur"] = self._convert_eur(sales_gbp)
 
         except ValueError as e:
             raise ValueError(f"Invalid sales amount: {e}")
 
-        # Extract date from filename (parsed in extract_rows and stored in raw_row)
-        # Fallback to current date if not available
-        file_date = raw_row.get("_file_date")
-        if file_date:
-            sale_date = file_date
-        else:
-            sale_date = datetime.utcnow()
-            print(f"[Liberty] WARNING: No file date found, using current date")
-
-        transformed["sale_date"] = sale_date.date().isoformat()
-        transformed["year"] = sale_date.year
-        transformed["month"] = sale_date.month
-        transformed["quarter"] = self._calculate_quarter(sale_date.month)
+        # Date from filename, or the current date if not available; resolved
+        # once per file in _read_columns (which also warns about the fallback)
+        (transformed["sale_date"], transformed["year"],
+         transformed["month"], transformed["quarter"]) = self._sale_date_fields
 
         # Store identification: Use the store_identifier from raw_row
         # This was set during extract_rows based on which store column had the data
         store_identifier = raw_row.get("store_identifier", "flagship")
         transformed["store_identifier"] = store_identifier
 
+        # City and sales_channel based on store type: online/e-commerce sales
+        # vs physical store sales (flagship, etc.)
+        # For Liberty, sales_channel represents distribution channel (not business model)
+        transformed["city"], transformed["sales_channel"] = self.STORE_GEO.get(store_identifier, self.DEFAULT_STORE_GEO)
+
+        # customer_id, country and upload_id come with the base row
+        return transformed
+
+    def _build_base_row_template(self, batch_id: str) -> Dict[str, Any]:
+        """Base row fields plus the fields every Liberty row shares"""
+        base_row = super()._build_base_row_template(batch_id)
+
         # Customer ID - Liberty is B2B reseller data, no customer information
-        transformed["customer_id"] = None
+        base_row["customer_id"] = None
 
         # Geography - Liberty is always UK
-        transformed["country"] = "UK"
-
-        # City and sales_channel based on store type
-        # For Liberty, sales_channel represents distribution channel (not business model)
-        if store_identifier.lower() in ["online", "internet"]:
-            # Online/e-commerce sales
-            transformed["city"] = "online"
-            transformed["sales_channel"] = "online"
-        else:
-            # Physical store sales (flagship, etc.)
-            transformed["city"] = "London"
-            transformed["sales_channel"] = "retail"
+        base_row["country"] = "UK"
 
         # Set upload_id for FK to uploads table
         # BIBBI schema uses upload_id (FK to uploads.id)
         # The batch_id parameter passed to transform_row is the upload UUID
-        transformed["upload_id"] = batch_id
+        base_row["upload_id"] = batch_id
+        return base_row
 
-        return transformed
+    # ------------------------------------------------------------------
+    # Vectorized path: same rules as transform_row, applied per column
+    # ------------------------------------------------------------------
+
+    def _open_frame(self, file_path: str):
+        # The parsed columns become the frame's columns without per-record dicts
+        return pd.DataFrame(self._open(file_path), columns=list(self.ROW_FIELDS), dtype=object)
 
-    def process_file(self, file_path: str) -> 'ProcessingResult':
-        """Override base process_file to add unmatched Liberty names reporting"""
-        # Call parent process_file
-        result = super().process_file(file_path)
+    def transform_dataframe(self, df, batch_id: str) -> Tuple[Dict[str, List[Any]], List[Dict[str, Any]]]:
+        """
+        Column-wise transform_row: same checks, skips, error messages and output per row
 
-        # Print unmatched Liberty names report
+        Rows transform_row would skip (returning None) are neither
+        transformed nor errors, as in the row path.
+        """
+        errors = RowErrors(df.index)
+
+        liberty_name = column(df, "liberty_name")
+        skipped = ~truthy(liberty_name)
+
+        # Lookup products in the pre-loaded products table. Each product has a
+        # row per store, so resolve every distinct name once and fan the
+        # result out by factorize code (-1, a missing name, hits the sentinel)
+        codes, names = pd.factorize(liberty_name)
+        products = [self.liberty_products.get(name) for name in names]
+        known = pd.Series([p is not None for p in products] + [False]).take(codes).set_axis(df.index)
+        self.unmatched_liberty_names.update(liberty_name[~skipped & ~known])
+        product_ean, functional_name = (
+            pd.Series([p[field] if p else name for p, name in zip(products, names)] + [None], dtype=object)
+            .take(codes).set_axis(df.index)
+            for field in ("ean", "functional_name")
+        )
+
+        # Returns arrive in accounting notation: "(1)" -> -1
+        qty_raw = column(df, "_qty")
+        skipped |= qty_raw.isna() | (qty_raw == "")
+        qty = to_number(qty_raw)
+        errors.add(~skipped & qty.isna(), "Invalid quantity: Invalid integer for Sales Qty Un: " + qty_raw.astype(str))
+        quantity = truncate_to_int(qty)
+        # Zero quantity rows are skipped, but only once the quantity parsed
+        skipped |= errors.ok & (quantity == 0)
+
+        sales_raw = column(df, "_sales_gbp")
+        sales_missing = sales_raw.isna() | (sales_raw == "")
+        sales_gbp = to_number(sales_raw).where(sales_raw.astype(str).str.strip() != "", 0.0)
+        errors.add(~skipped & sales_missing, "Missing sales amount")
+        errors.add(~skipped & sales_gbp.isna(), "Invalid sales amount: Invalid float for Sales Inc VAT: " + sales_raw.astype(str))
+
+        keep = errors.ok & ~skipped
+        # One report date per file; undated reports fall back to the current date
+        sale_date, year, month, quarter = self._sale_date_fields
+
+        store_identifier = column(df, "store_identifier").fillna("flagship")[keep]
+        city, sales_channel = (
+            store_identifier.map({store: geo[i] for store, geo in self.STORE_GEO.items()}).fillna(self.DEFAULT_STORE_GEO[i])
+            for i in (0, 1)
+        )
+        sales_local = sales_gbp[keep].astype("float64")
+        quantity = quantity[keep]
+
+        out = pd.DataFrame({
+            "product_ean": product_ean[keep],
+            "functional_name": functional_name[keep],
+            "product_name_raw": liberty_name[keep],
+            "quantity": quantity,
+            "is_return": quantity < 0,
+            "sales_local_currency": sales_local,
+            "sales_eur": self._convert_eur_column(sales_local),
+            "sale_date": sale_date,
+            "year": year,
+            "month": month,
+            "quarter": quarter,
+            "store_identifier": store_identifier,
+            "city": city,
+            "sales_channel": sales_channel,
+        })
+        return self._frame_output(df, out, errors, batch_id)
+
+    def process(self, file_path: str, batch_id: str) -> ProcessingResult:
+        """Override base process to add unmatched Liberty names reporting"""
+        # Processor instances are reused across uploads (see vendor_router)
+        self.unmatched_liberty_names.clear()
+        result = super().process(file_path, batch_id)
+
+        # Unmatched Liberty names report, one log record per run
         if self.unmatched_liberty_names:
-            print(f"\n[Liberty] ========== UNMATCHED LIBERTY NAMES ==========")
-            print(f"[Liberty] Total unmatched: {len(self.unmatched_liberty_names)}")
-            print(f"[Liberty] Unique unmatched: {len(set(self.unmatched_liberty_names))}")
-            print(f"[Liberty] ")
-            print(f"[Liberty] Liberty names not found in products table:")
-            for liberty_name in sorted(set(self.unmatched_liberty_names)):
-                print(f"[Liberty]   - {liberty_name}")
-            print(f"[Liberty] ==============================================\n")
+            logger.warning(
+                "Liberty names not found in products table - Total unmatched: %d, Unique unmatched: %d\n%s",
+                self.unmatched_liberty_names.total(),
+                len(self.unmatched_liberty_names),
+                "\n".join(f"  - {liberty_name}" for liberty_name in sorted(self.unmatched_liberty_names))
+            )
 
         return result
 
 
+def _tap_column(rows: Iterator[Sequence[Any]], idx: int, values: List[Any]) -> Iterator[Sequence[Any]]:
+    # Pass rows through unchanged, appending each row's cell idx to values
+    append = values.append
+    for row in rows:
+        append(row[idx] if idx < len(row) else None)
+        yield row
+
+
+def _sale_date_fields(file_date: Optional[date]) -> Tuple[str, int, int, int]:
+    # (sale_date, year, month, quarter) for a report date, today if undated
+    sale_date = file_date or datetime.utcnow().date()
+    return sale_date.isoformat(), sale_date.year, sale_date.month, QUARTER_BY_MONTH[sale_date.month]
+
+
 def get_liberty_processor(reseller_id: str, supabase_client: 'Client') -> LibertyProcessor:
     """
     Factory function to create Liberty processor
@@ -1,7 +1,7 @@
 """Selfridges Processor - 4 physical stores + 1 online, weekly reports"""
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-from .base import BibbiBseProcessor
+from .base import BibbiBseProcessor, QUARTER_BY_MONTH
 
 class SelfridgesProcessor(BibbiBseProcessor):
     VENDOR_NAME = "selfridges"
@@ -46,19 +46,19 @@ class SelfridgesProcessor(BibbiBseProcessor):
         if sales is None: raise ValueError("Missing Sales/Amount")
         sales_gbp = self._to_float(sales, "Sales")
         t["sales_local_currency"] = sales_gbp
-        t["sales_eur"] = self._convert_currency(sales_gbp, "GBP")
+        t["sales_eur"] = self._convert_eur(sales_gbp)
         
         date_val = raw_row.get("Date") or raw_row.get("Week")
         if date_val:
             try:
                 dt = self._validate_date(date_val)
-                t["sale_date"], t["year"], t["month"], t["quarter"] = dt.date().isoformat(), dt.year, dt.month, self._calculate_quarter(dt.month)
+                t["sale_date"], t["year"], t["month"], t["quarter"] = dt.date().isoformat(), dt.year, dt.month, QUARTER_BY_MONTH[dt.month]
             except:
                 now = datetime.utcnow()
-                t["sale_date"], t["year"], t["month"], t["quarter"] = now.date().isoformat(), now.year, now.month, self._calculate_quarter(now.month)
+                t["sale_date"], t["year"], t["month"], t["quarter"] = now.date().isoformat(), now.year, now.month, QUARTER_BY_MONTH[now.month]
         else:
             now = datetime.utcnow()
-            t["sale_date"], t["year"], t["month"], t["quarter"] = now.date().isoformat(), now.year, now.month, self._calculate_quarter(now.month)
+            t["sale_date"], t["year"], t["month"], t["quarter"] = now.date().isoformat(), now.year, now.month, QUARTER_BY_MONTH[now.month]
         
         store = raw_row.get("Store") or raw_row.get("Location")
         if store:
@@ -1,7 +1,8 @@
 """Skins NL Processor - SalesPerLocation sheet, reports to SA"""
 from typing import List, Dict, Any, Optional
 from datetime import datetime
-from .base import BibbiBseProcessor
+from app.utils.excel import find_sheet_by_name
+from .base import BibbiBseProcessor, QUARTER_BY_MONTH, month_start_iso
 
 class SkinsNLProcessor(BibbiBseProcessor):
     VENDOR_NAME = "skins_nl"
@@ -18,7 +19,7 @@ class SkinsNLProcessor(BibbiBseProcessor):
         stores = []
         try:
             wb = self._load_workbook(file_path)
-            sheet = wb.get(self.TARGET_SHEET) or wb[wb.sheetnames[0]]
+            sheet = find_sheet_by_name(wb, self.TARGET_SHEET, fallback_to_first=True, case_insensitive=True)
             headers = self._get_sheet_headers(sheet)
             
             loc_idx = next((i for i, h in enumerate(headers) if "location" in h.lower() or "store" in h.lower()), None)
@@ -47,7 +48,7 @@ class SkinsNLProcessor(BibbiBseProcessor):
 
     def extract_rows(self, file_path: str) -> List[Dict[str, Any]]:
         wb = self._load_workbook(file_path)
-        sheet = wb.get(self.TARGET_SHEET) or wb[wb.sheetnames[0]]
+        sheet = find_sheet_by_name(wb, self.TARGET_SHEET, fallback_to_first=True, case_insensitive=True)
         headers = self._get_sheet_headers(sheet)
         rows = [{h: row[i] if i < len(row) else None for i, h in enumerate(headers)} for row in sheet.iter_rows(min_row=2, values_only=True) if any(row)]
         wb.close()
@@ -74,10 +75,10 @@ class SkinsNLProcessor(BibbiBseProcessor):
         month, year = raw_row.get("Month"), raw_row.get("Year")
         if month and year:
             m, y = self._to_int(month, "Month"), self._to_int(year, "Year")
-            t["sale_date"], t["year"], t["month"], t["quarter"] = datetime(y, m, 1).date().isoformat(), y, m, self._calculate_quarter(m)
+            t["sale_date"], t["year"], t["month"], t["quarter"] = month_start_iso(y, m), y, m, QUARTER_BY_MONTH[m]
         else:
             now = datetime.utcnow()
-            t["sale_date"], t["year"], t["month"], t["quarter"] = now.date().isoformat(), now.year, now.month, self._calculate_quarter(now.month)
+            t["sale_date"], t["year"], t["month"], t["quarter"] = now.date().isoformat(), now.year, now.month, QUARTER_BY_MONTH[now.month]
         
         loc = raw_row.get("Location") or raw_row.get("Store")
         t["store_identifier"] = str(loc).strip().lower().replace(' ', '_') if loc else "main"
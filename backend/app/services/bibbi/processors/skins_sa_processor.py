@@ -15,7 +15,7 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 import openpyxl
 
-from .base import BibbiBseProcessor
+from .base import BibbiBseProcessor, QUARTER_BY_MONTH, month_start_iso
 
 
 class SkinsSAProcessor(BibbiBseProcessor):
@@ -203,7 +203,7 @@ class SkinsSAProcessor(BibbiBseProcessor):
             transformed["sales_local_currency"] = sales_zar
 
             # Convert to EUR
-            transformed["sales_eur"] = self._convert_currency(sales_zar, "ZAR")
+            transformed["sales_eur"] = self._convert_eur(sales_zar)
 
         except ValueError as e:
             raise ValueError(f"Invalid sales amount: {e}")
@@ -217,7 +217,7 @@ class SkinsSAProcessor(BibbiBseProcessor):
                 transformed["sale_date"] = sale_date.date().isoformat()
                 transformed["year"] = sale_date.year
                 transformed["month"] = sale_date.month
-                transformed["quarter"] = self._calculate_quarter(sale_date.month)
+                transformed["quarter"] = QUARTER_BY_MONTH[sale_date.month]
 
             except ValueError as e:
                 # Fall back to Month/Year if OrderDate parsing fails
@@ -234,10 +234,10 @@ class SkinsSAProcessor(BibbiBseProcessor):
                     if year < 2000 or year > 2100:
                         raise ValueError(f"Invalid year: {year}")
 
-                    transformed["sale_date"] = datetime(year, month, 1).date().isoformat()
+                    transformed["sale_date"] = month_start_iso(year, month)
                     transformed["year"] = year
                     transformed["month"] = month
-                    transformed["quarter"] = self._calculate_quarter(month)
+                    transformed["quarter"] = QUARTER_BY_MONTH[month]
                 else:
                     raise ValueError(f"Invalid date: {e}")
         else:
@@ -256,10 +256,10 @@ class SkinsSAProcessor(BibbiBseProcessor):
                     if year < 2000 or year > 2100:
                         raise ValueError(f"Invalid year: {year}")
 
-                    transformed["sale_date"] = datetime(year, month, 1).date().isoformat()
+                    transformed["sale_date"] = month_start_iso(year, month)
                     transformed["year"] = year
                     transformed["month"] = month
-                    transformed["quarter"] = self._calculate_quarter(month)
+                    transformed["quarter"] = QUARTER_BY_MONTH[month]
 
                 except ValueError as e:
                     raise ValueError(f"Invalid date: {e}")
@@ -269,7 +269,7 @@ class SkinsSAProcessor(BibbiBseProcessor):
                 transformed["sale_date"] = now.date().isoformat()
                 transformed["year"] = now.year
                 transformed["month"] = now.month
-                transformed["quarter"] = self._calculate_quarter(now.month)
+                transformed["quarter"] = QUARTER_BY_MONTH[now.month]
 
         # Extract store from Column A
         store_code = raw_row.get("_store_code_column_a")
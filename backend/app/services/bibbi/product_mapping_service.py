@@ -11,19 +11,85 @@ Critical for:
 
 Features:
 - Fuzzy matching for product name variations
-- In-memory caching for performance
+- In-memory caching for performance, optionally backed by an on-disk cache
 - CRUD operations for product mappings
 - Batch mapping operations
 """
 
+import sqlite3
+import time
 import uuid
 from datetime import datetime
 from typing import Dict, Any, Optional, List, Tuple
-from difflib import SequenceMatcher
+
+from rapidfuzz import fuzz, process as fuzz_process
 
 from app.core.bibbi import BibbιDB, BIBBI_TENANT_ID
 
 
+class PersistentMappingCache:
+    """
+    On-disk LRU of product code → EAN matches, kept across restarts
+
+    A SQLite file, so worker processes on one host can share it. Only
+    matches are stored: a code that found nothing is looked up again next
+    time, so newly created mappings are never hidden by a cached miss.
+    Bumping SCHEMA_VERSION empties existing cache files on open.
+    """
+
+    SCHEMA_VERSION = 1
+
+    # Evict least recently used entries every this many writes
+    EVICT_EVERY = 256
+
+    def __init__(self, path: str, max_entries: int = 50_000):
+        """
+        Open (or create) the cache file
+
+        Args:
+            path: SQLite file path
+            max_entries: Entries kept after eviction
+        """
+        self.max_entries = max_entries
+        self._writes = 0
+        # Autocommit; each statement is its own short transaction
+        self._conn = sqlite3.connect(path, timeout=5, isolation_level=None, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS mappings "
+            "(key TEXT PRIMARY KEY, ean TEXT NOT NULL, used_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS mappings_used_at ON mappings (used_at)")
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+            self._conn.execute("DELETE FROM mappings")
+            self._conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+    def get(self, key: str) -> Optional[str]:
+        """EAN stored for key (marking it recently used), or None"""
+        row = self._conn.execute("SELECT ean FROM mappings WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        self._conn.execute("UPDATE mappings SET used_at = ? WHERE key = ?", (time.time(), key))
+        return row[0]
+
+    def set(self, key: str, ean: str) -> None:
+        """Store a match for key"""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO mappings (key, ean, used_at) VALUES (?, ?, ?)",
+            (key, ean, time.time())
+        )
+        self._writes += 1
+        if self._writes % self.EVICT_EVERY == 0:
+            self._conn.execute(
+                "DELETE FROM mappings WHERE key IN "
+                "(SELECT key FROM mappings ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        self._conn.execute("DELETE FROM mappings")
+
+
 class BibbιProductMappingService:
     """
     Service for BIBBI product code → EAN mapping
@@ -38,16 +104,26 @@ class BibbιProductMappingService:
     # Fuzzy matching threshold (85% similarity)
     FUZZY_MATCH_THRESHOLD = 0.85
 
-    def __init__(self, bibbi_db: BibbιDB):
+    # Codes per exact-match query (keeps the in.(...) filter within URL limits)
+    EXACT_LOOKUP_CHUNK = 500
+
+    # Rows per page when loading all active mappings; PostgREST caps any
+    # single response at its max-rows setting (1000 by default)
+    MAPPINGS_PAGE_SIZE = 1000
+
+    def __init__(self, bibbi_db: BibbιDB, cache_path: Optional[str] = None):
         """
         Initialize product mapping service
 
         Args:
             bibbi_db: BIBBI-specific Supabase client
+            cache_path: SQLite file for matches kept across runs; defaults
+                to settings.bibbi_mapping_cache_path (unset = memory only)
         """
         self.db = bibbi_db
         # Cache: {reseller_id:product_code -> ean}
         self._mapping_cache: Dict[str, str] = {}
+        self._persistent_cache = self._open_persistent_cache(cache_path)
 
     def get_ean_by_product_code(
         self,
@@ -81,14 +157,15 @@ class BibbιProductMappingService:
 
         # Check cache first
         cache_key = self._make_cache_key(reseller_id, normalized_code)
-        if cache_key in self._mapping_cache:
-            return self._mapping_cache[cache_key]
+        ean = self._cached_ean(cache_key)
+        if ean is not None:
+            return ean
 
         # Try exact match
         mapping = self._find_exact_mapping(reseller_id, normalized_code)
         if mapping:
             ean = mapping["product_id"]
-            self._mapping_cache[cache_key] = ean
+            self._remember(cache_key, ean)
             return ean
 
         # Try fuzzy match if enabled
@@ -96,7 +173,7 @@ class BibbιProductMappingService:
             mapping = self._find_fuzzy_mapping(reseller_id, normalized_code)
             if mapping:
                 ean = mapping["product_id"]
-                self._mapping_cache[cache_key] = ean
+                self._remember(cache_key, ean)
                 return ean
 
         return None
@@ -125,13 +202,34 @@ class BibbιProductMappingService:
             )
             # Returns: {"PRODUCT_A": "1234567890123", "PRODUCT_B": None, ...}
         """
-        result = {}
+        normalized_codes = [self._normalize_product_code(product_code) for product_code in product_codes]
+        # Codes that normalize alike share one lookup, misses included
+        by_normalized: Dict[str, Optional[str]] = {
+            normalized_code: self._cached_ean(self._make_cache_key(reseller_id, normalized_code))
+            for normalized_code in normalized_codes
+        }
 
-        for product_code in product_codes:
-            ean = self.get_ean_by_product_code(reseller_id, product_code)
-            result[product_code] = ean
+        # Exact matches for the cache misses, queried by code
+        pending = [code for code, ean in by_normalized.items() if ean is None]
+        exact = self._find_exact_mappings(reseller_id, pending) if pending else {}
 
-        return result
+        # Fuzzy matching scores every active mapping, so they are only
+        # loaded when some code has no exact mapping
+        if any(code not in exact for code in pending):
+            mappings = self._get_active_mappings(reseller_id)
+        else:
+            mappings = []
+
+        for normalized_code in pending:
+            mapping = exact.get(normalized_code) or self._best_fuzzy_match(normalized_code, mappings)
+            if mapping:
+                ean = by_normalized[normalized_code] = mapping["product_id"]
+                self._remember(self._make_cache_key(reseller_id, normalized_code), ean)
+
+        return {
+            product_code: by_normalized[normalized_code]
+            for product_code, normalized_code in zip(product_codes, normalized_codes)
+        }
 
     def create_mapping(
         self,
@@ -199,7 +297,7 @@ class BibbιProductMappingService:
 
             # Update cache
             cache_key = self._make_cache_key(reseller_id, normalized_code)
-            self._mapping_cache[cache_key] = ean
+            self._remember(cache_key, ean)
 
             print(f"[BibbιProductMapping] Created mapping: {product_code} → {ean}")
             return mapping_id
@@ -405,6 +503,46 @@ class BibbιProductMappingService:
             print(f"[BibbιProductMapping] Error finding exact mapping: {e}")
             return None
 
+    def _find_exact_mappings(
+        self,
+        reseller_id: str,
+        product_codes: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Find exact product mappings for many codes
+
+        One query per EXACT_LOOKUP_CHUNK codes, using an IN filter.
+
+        Args:
+            reseller_id: Reseller UUID
+            product_codes: Normalized product codes
+
+        Returns:
+            Dictionary mapping product_code → mapping record (codes with
+            no mapping are left out)
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+
+        for start in range(0, len(product_codes), self.EXACT_LOOKUP_CHUNK):
+            chunk = product_codes[start:start + self.EXACT_LOOKUP_CHUNK]
+            try:
+                result = self.db.table("product_reseller_mappings")\
+                    .select("*")\
+                    .eq("reseller_id", reseller_id)\
+                    .eq("is_active", True)\
+                    .in_("reseller_product_code", chunk)\
+                    .execute()
+
+            except Exception as e:
+                # Codes in this chunk fall through to fuzzy matching
+                print(f"[BibbιProductMapping] Error finding exact mappings: {e}")
+                continue
+
+            for mapping in result.data or []:
+                found.setdefault(mapping.get("reseller_product_code"), mapping)
+
+        return found
+
     def _find_fuzzy_mapping(
         self,
         reseller_id: str,
@@ -422,43 +560,82 @@ class BibbιProductMappingService:
         Returns:
             Best matching mapping record or None
         """
-        try:
-            # Get all mappings for reseller
-            result = self.db.table("product_reseller_mappings")\
-                .select("*")\
-                .eq("reseller_id", reseller_id)\
-                .eq("is_active", True)\
-                .execute()
+        return self._best_fuzzy_match(product_code, self._get_active_mappings(reseller_id))
 
-            if not result.data:
-                return None
-
-            # Find best fuzzy match
-            best_match = None
-            best_score = 0.0
+    def _get_active_mappings(self, reseller_id: str) -> List[Dict[str, Any]]:
+        """
+        Get all active mappings for a reseller
 
-            for mapping in result.data:
-                stored_code = mapping.get("reseller_product_code", "")
-                similarity = self._calculate_similarity(product_code, stored_code)
+        Read in pages of MAPPINGS_PAGE_SIZE rows, so resellers with more
+        mappings than PostgREST returns at once still get all of them.
 
-                if similarity > best_score and similarity >= self.FUZZY_MATCH_THRESHOLD:
-                    best_score = similarity
-                    best_match = mapping
+        Args:
+            reseller_id: Reseller UUID
 
-            if best_match:
-                print(f"[BibbιProductMapping] Fuzzy match: '{product_code}' → '{best_match['reseller_product_code']}' (score: {best_score:.2f})")
+        Returns:
+            List of mapping records
+        """
+        mappings: List[Dict[str, Any]] = []
 
-            return best_match
+        try:
+            while True:
+                start = len(mappings)
+                result = self.db.table("product_reseller_mappings")\
+                    .select("*")\
+                    .eq("reseller_id", reseller_id)\
+                    .eq("is_active", True)\
+                    .order("mapping_id")\
+                    .range(start, start + self.MAPPINGS_PAGE_SIZE - 1)\
+                    .execute()
+
+                page = result.data or []
+                mappings.extend(page)
+                if len(page) < self.MAPPINGS_PAGE_SIZE:
+                    return mappings
 
         except Exception as e:
-            print(f"[BibbιProductMapping] Error finding fuzzy mapping: {e}")
+            print(f"[BibbιProductMapping] Error getting active mappings: {e}")
+            return mappings
+
+    def _best_fuzzy_match(
+        self,
+        product_code: str,
+        mappings: List[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Best mapping at or above FUZZY_MATCH_THRESHOLD
+
+        Args:
+            product_code: Normalized product code
+            mappings: Candidate mapping records
+
+        Returns:
+            Best matching mapping record or None
+        """
+        # One C++ pass over all candidates, scored like _calculate_similarity;
+        # the first of equally good matches wins
+        codes = [mapping.get("reseller_product_code") or "" for mapping in mappings]
+        found = fuzz_process.extractOne(
+            product_code,
+            codes,
+            scorer=fuzz.ratio,
+            processor=str.lower,
+            score_cutoff=self.FUZZY_MATCH_THRESHOLD * 100
+        )
+        if not found:
             return None
 
+        best_match = mappings[found[2]]
+        print(f"[BibbιProductMapping] Fuzzy match: '{product_code}' → '{best_match['reseller_product_code']}' (score: {found[1] / 100:.2f})")
+
+        return best_match
+
     def _calculate_similarity(self, str1: str, str2: str) -> float:
         """
         Calculate similarity ratio between two strings
 
-        Uses SequenceMatcher for similarity comparison.
+        rapidfuzz's normalized Indel ratio: 2 * LCS / (len1 + len2),
+        case-insensitive.
 
         Args:
             str1: First string
@@ -467,7 +644,7 @@ class BibbιProductMappingService:
         Returns:
             Similarity ratio (0.0 to 1.0)
         """
-        return SequenceMatcher(None, str1.lower(), str2.lower()).ratio()
+        return fuzz.ratio(str1.lower(), str2.lower()) / 100
 
     def _normalize_product_code(self, product_code: str) -> str:
         """
@@ -520,13 +697,58 @@ class BibbιProductMappingService:
         """
         return f"{reseller_id}:{product_code}"
 
+    def _cached_ean(self, cache_key: str) -> Optional[str]:
+        """
+        EAN for a cache key from memory, then from the on-disk cache
+
+        Disk hits are copied into memory; disk errors count as misses.
+        """
+        ean = self._mapping_cache.get(cache_key)
+        if ean is None and self._persistent_cache is not None:
+            try:
+                ean = self._persistent_cache.get(cache_key)
+            except sqlite3.Error as e:
+                print(f"[BibbιProductMapping] Error reading mapping cache: {e}")
+                return None
+            if ean is not None:
+                self._mapping_cache[cache_key] = ean
+        return ean
+
+    def _remember(self, cache_key: str, ean: str) -> None:
+        """Cache a match in memory and, when enabled, on disk"""
+        self._mapping_cache[cache_key] = ean
+        if self._persistent_cache is not None:
+            try:
+                self._persistent_cache.set(cache_key, ean)
+            except sqlite3.Error as e:
+                print(f"[BibbιProductMapping] Error writing mapping cache: {e}")
+
+    def _open_persistent_cache(self, cache_path: Optional[str]) -> Optional[PersistentMappingCache]:
+        """On-disk cache at cache_path (or the configured path), or None when off"""
+        if cache_path is None:
+            from app.core.config import settings
+            cache_path = settings.bibbi_mapping_cache_path
+        if not cache_path:
+            return None
+
+        try:
+            return PersistentMappingCache(cache_path)
+        except sqlite3.Error as e:
+            print(f"[BibbιProductMapping] Mapping cache unavailable, using memory only: {e}")
+            return None
+
     def clear_cache(self) -> None:
         """
-        Clear in-memory mapping cache
+        Clear in-memory and on-disk mapping caches
 
         Use when mappings may be stale (after updates/deletes).
         """
         self._mapping_cache.clear()
+        if self._persistent_cache is not None:
+            try:
+                self._persistent_cache.clear()
+            except sqlite3.Error as e:
+                print(f"[BibbιProductMapping] Error clearing mapping cache: {e}")
         print("[BibbιProductMapping] Cache cleared")
 
 
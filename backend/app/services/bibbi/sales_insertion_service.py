@@ -15,7 +15,7 @@ Features:
 
 import uuid
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Iterable, Optional, List, Tuple
 from app.core.bibbi import BibbιDB, BIBBI_TENANT_ID
 
 
@@ -64,6 +64,8 @@ class BibbιSalesInsertionService:
 
     # Default batch size for bulk inserts
     DEFAULT_BATCH_SIZE = 1000
+    # Slices at or below this size fall back to row-by-row insertion
+    ROW_BY_ROW_THRESHOLD = 16
 
     def __init__(self, bibbi_db: BibbιDB):
         """
@@ -110,27 +112,55 @@ class BibbιSalesInsertionService:
         - Living documents (Boxnox, Aromateque, Skins SA) re-uploading same data
         """
         batch_size = batch_size or self.DEFAULT_BATCH_SIZE
+
+        print(f"[BibbιSalesInsertion] Inserting {len(validated_data)} rows (batch size: {batch_size})...")
+
+        return self.insert_sales_batches(
+            (validated_data[start:start + batch_size] for start in range(0, len(validated_data), batch_size)),
+            store_mapping=store_mapping
+        )
+
+    def insert_sales_batches(
+        self,
+        batches: Iterable[List[Dict[str, Any]]],
+        store_mapping: Optional[Dict[str, str]] = None
+    ) -> InsertionResult:
+        """
+        Insert sales rows arriving in chunks, one bulk insert per chunk
+
+        Chunks are consumed as they are produced (e.g. from
+        ProcessingResult.iter_batches()), so a caller can feed a large
+        upload without slicing the full row list up front. Each chunk is
+        handled like one batch of insert_validated_sales(), including
+        duplicate isolation.
+
+        Args:
+            batches: Lists of validated sales records, in row order
+            store_mapping: Dict mapping store_identifier → store_id (UUID)
+
+        Returns:
+            InsertionResult with statistics and errors
+        """
         store_mapping = store_mapping or {}
 
-        total_rows = len(validated_data)
+        total_rows = 0
         inserted_rows = 0
         duplicate_rows = 0
         failed_rows = 0
         errors = []
 
-        print(f"[BibbιSalesInsertion] Inserting {total_rows} rows (batch size: {batch_size})...")
         if store_mapping:
             print(f"[BibbιSalesInsertion] Using store mapping: {store_mapping}")
 
         # Process in batches
-        for batch_start in range(0, total_rows, batch_size):
-            batch_end = min(batch_start + batch_size, total_rows)
-            batch = validated_data[batch_start:batch_end]
-            batch_num = (batch_start // batch_size) + 1
+        for batch_num, batch in enumerate(batches, start=1):
+            if not batch:
+                continue
 
             print(f"[BibbιSalesInsertion] Processing batch {batch_num} ({len(batch)} rows)...")
 
-            batch_result = self._insert_batch(batch, batch_start, store_mapping)
+            batch_result = self._insert_batch(batch, total_rows, store_mapping)
+            total_rows += len(batch)
 
             inserted_rows += batch_result["inserted"]
             duplicate_rows += batch_result["duplicates"]
@@ -173,64 +203,7 @@ class BibbιSalesInsertionService:
         errors = []
 
         try:
-            # Prepare batch data - ensure only valid BIBBI schema fields
-            # BIBBI sales_unified schema (verified 2025-10-24 via Supabase MCP):
-            # - id: auto-generated UUID PRIMARY KEY
-            # - product_ean, reseller_id, store_id, customer_id (nullable), upload_id
-            # - functional_name, sale_date, quantity, sales_local_currency, currency, sales_eur
-            # - year, month, quarter, sales_channel, country, city
-            # - created_at, updated_at
-            # NOTE: Uses upload_id (NOT upload_batch_id) - FK to uploads.id
-
-            batch_data = []
-            for row in batch:
-                # Clean row: remove fields not in BIBBI schema
-                cleaned_row = {k: v for k, v in row.items() if k not in [
-                    "sales_id",           # Auto-generated as 'id'
-                    "tenant_id",          # Not in BIBBI schema (no multi-tenancy)
-                    "batch_id",           # Use upload_id instead
-                    "upload_batch_id",    # WRONG: Use upload_id instead
-                    "vendor_name",        # Not in schema
-                    "product_name_raw",   # Not in schema (temporary field)
-                    "is_return",          # Not in schema
-                    "return_quantity",    # Not in schema (quantity handles returns via negatives)
-                    "local_currency",     # Use currency instead
-                    "store_identifier",   # Not in schema (only store_id exists)
-                ]}
-
-                # Convert store_identifier to store_id using mapping
-                store_identifier = row.get("store_identifier")
-                if store_identifier and store_identifier in store_mapping:
-                    store_id = store_mapping[store_identifier]
-                    cleaned_row["store_id"] = store_id
-
-                    # Populate geography fields from stores table
-                    store_details = self._get_store_details(store_id)
-                    if store_details:
-                        # Only populate if not already set by processor
-                        if not cleaned_row.get("country"):
-                            cleaned_row["country"] = store_details.get("country")
-                        if not cleaned_row.get("region"):
-                            cleaned_row["region"] = store_details.get("region")
-                        if not cleaned_row.get("city"):
-                            cleaned_row["city"] = store_details.get("city")
-                elif "store_id" not in cleaned_row:
-                    # No mapping available and no store_id - this will fail FK constraint
-                    print(f"[BibbιSalesInsertion] Warning: No store_id mapping for store_identifier='{store_identifier}'")
-
-                # Populate reseller_name from reseller_id (denormalization for AI queries)
-                if "reseller_id" in cleaned_row and not cleaned_row.get("reseller_name"):
-                    reseller_name = self._get_reseller_name(cleaned_row["reseller_id"])
-                    if reseller_name:
-                        cleaned_row["reseller_name"] = reseller_name
-
-                # Ensure timestamps
-                if "created_at" not in cleaned_row:
-                    cleaned_row["created_at"] = datetime.utcnow().isoformat()
-                if "updated_at" not in cleaned_row:
-                    cleaned_row["updated_at"] = datetime.utcnow().isoformat()
-
-                batch_data.append(cleaned_row)
+            batch_data = self._prepare_batch_rows(batch, store_mapping)
 
             # Attempt batch insert
             result = self.db.table("sales_unified").insert(batch_data).execute()
@@ -244,9 +217,9 @@ class BibbιSalesInsertionService:
 
             # Check if it's a duplicate key violation
             if "duplicate key" in error_str or "unique constraint" in error_str:
-                # Fall back to row-by-row insertion to identify duplicates
-                print(f"[BibbιSalesInsertion] Batch duplicate detected, falling back to row-by-row insertion")
-                row_result = self._insert_row_by_row(batch, offset, store_mapping)
+                # Split the batch to isolate duplicates (row-by-row only for small slices)
+                print(f"[BibbιSalesInsertion] Batch duplicate detected, splitting batch to isolate duplicates")
+                row_result = self._insert_bisected(batch, offset, store_mapping)
                 inserted = row_result["inserted"]
                 duplicates = row_result["duplicates"]
                 failed = row_result["failed"]
@@ -273,6 +246,124 @@ class BibbιSalesInsertionService:
             "errors": errors
         }
 
+    def _prepare_batch_rows(
+        self,
+        batch: List[Dict[str, Any]],
+        store_mapping: Dict[str, str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Clean rows for insertion and resolve store/geography/reseller fields
+
+        Args:
+            batch: List of rows to insert
+            store_mapping: Dict mapping store_identifier → store_id (UUID)
+
+        Returns:
+            Rows ready for sales_unified insert
+        """
+        # Prepare batch data - ensure only valid BIBBI schema fields
+        # BIBBI sales_unified schema (verified 2025-10-24 via Supabase MCP):
+        # - id: auto-generated UUID PRIMARY KEY
+        # - product_ean, reseller_id, store_id, customer_id (nullable), upload_id
+        # - functional_name, sale_date, quantity, sales_local_currency, currency, sales_eur
+        # - year, month, quarter, sales_channel, country, city
+        # - created_at, updated_at
+        # NOTE: Uses upload_id (NOT upload_batch_id) - FK to uploads.id
+        batch_data = []
+        for row in batch:
+            # Clean row: remove fields not in BIBBI schema
+            cleaned_row = {k: v for k, v in row.items() if k not in [
+                "sales_id",           # Auto-generated as 'id'
+                "tenant_id",          # Not in BIBBI schema (no multi-tenancy)
+                "batch_id",           # Use upload_id instead
+                "upload_batch_id",    # WRONG: Use upload_id instead
+                "vendor_name",        # Not in schema
+                "product_name_raw",   # Not in schema (temporary field)
+                "is_return",          # Not in schema
+                "return_quantity",    # Not in schema (quantity handles returns via negatives)
+                "local_currency",     # Use currency instead
+                "store_identifier",   # Not in schema (only store_id exists)
+            ]}
+
+            # Convert store_identifier to store_id using mapping
+            store_identifier = row.get("store_identifier")
+            if store_identifier and store_identifier in store_mapping:
+                store_id = store_mapping[store_identifier]
+                cleaned_row["store_id"] = store_id
+
+                # Populate geography fields from stores table
+                store_details = self._get_store_details(store_id)
+                if store_details:
+                    # Only populate if not already set by processor
+                    if not cleaned_row.get("country"):
+                        cleaned_row["country"] = store_details.get("country")
+                    if not cleaned_row.get("region"):
+                        cleaned_row["region"] = store_details.get("region")
+                    if not cleaned_row.get("city"):
+                        cleaned_row["city"] = store_details.get("city")
+            elif "store_id" not in cleaned_row:
+                # No mapping available and no store_id - this will fail FK constraint
+                print(f"[BibbιSalesInsertion] Warning: No store_id mapping for store_identifier='{store_identifier}'")
+
+            # Populate reseller_name from reseller_id (denormalization for AI queries)
+            if "reseller_id" in cleaned_row and not cleaned_row.get("reseller_name"):
+                reseller_name = self._get_reseller_name(cleaned_row["reseller_id"])
+                if reseller_name:
+                    cleaned_row["reseller_name"] = reseller_name
+
+            # Ensure timestamps
+            if "created_at" not in cleaned_row:
+                cleaned_row["created_at"] = datetime.utcnow().isoformat()
+            if "updated_at" not in cleaned_row:
+                cleaned_row["updated_at"] = datetime.utcnow().isoformat()
+
+            batch_data.append(cleaned_row)
+
+        return batch_data
+
+    def _insert_bisected(
+        self,
+        batch: List[Dict[str, Any]],
+        offset: int,
+        store_mapping: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """
+        Insert a batch that failed as a whole by recursively halving it
+
+        Clean halves still go in as one bulk insert each, so a batch with a
+        few duplicates costs O(duplicates * log(batch)) requests instead of
+        one request per row. Slices at or below ROW_BY_ROW_THRESHOLD use
+        _insert_row_by_row to classify individual rows.
+
+        Args:
+            batch: List of rows to insert
+            offset: Row number offset for error reporting
+            store_mapping: Dict mapping store_identifier → store_id (UUID)
+
+        Returns:
+            Dictionary with inserted/duplicate/failed counts and errors
+        """
+        if len(batch) <= self.ROW_BY_ROW_THRESHOLD:
+            return self._insert_row_by_row(batch, offset, store_mapping)
+
+        totals = {"inserted": 0, "duplicates": 0, "failed": 0, "errors": []}
+        mid = len(batch) // 2
+
+        for part, part_offset in ((batch[:mid], offset), (batch[mid:], offset + mid)):
+            try:
+                result = self.db.table("sales_unified").insert(
+                    self._prepare_batch_rows(part, store_mapping)
+                ).execute()
+                totals["inserted"] += len(result.data or [])
+            except Exception:
+                part_result = self._insert_bisected(part, part_offset, store_mapping)
+                totals["inserted"] += part_result["inserted"]
+                totals["duplicates"] += part_result["duplicates"]
+                totals["failed"] += part_result["failed"]
+                totals["errors"].extend(part_result["errors"])
+
+        return totals
+
     def _insert_row_by_row(
         self,
         batch: List[Dict[str, Any]],
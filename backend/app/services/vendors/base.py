@@ -15,7 +15,7 @@ from decimal import Decimal, InvalidOperation
 import openpyxl
 from openpyxl.worksheet.worksheet import Worksheet
 
-from app.utils.validation import validate_ean, to_int, to_float, validate_month, validate_year
+from app.utils.validation import validate_ean, to_int, to_float, validate_month, validate_year, parse_date, QUARTER_BY_MONTH
 from app.utils.excel import (
     extract_rows_from_sheet,
     get_sheet_headers,
@@ -287,10 +287,21 @@ class VendorProcessor(ABC):
         Raises:
             ValueError: If conversion fails
         """
+        # Parse straight to Decimal; a float -> str -> Decimal round-trip
+        # costs two conversions and can change the digits
+        if value is None or value == "":
+            raise ValueError(f"Invalid decimal for {field_name}: {value}")
+
+        if isinstance(value, str):
+            text = value.strip()
+        elif isinstance(value, float):
+            text = str(value)
+        else:
+            text = value
+
         try:
-            float_val = self._to_float(value, field_name)
-            return Decimal(str(float_val))
-        except (ValueError, InvalidOperation):
+            return Decimal(text)
+        except (ValueError, TypeError, InvalidOperation):
             raise ValueError(f"Invalid decimal for {field_name}: {value}")
 
     # Currency Conversion
@@ -336,6 +347,8 @@ class VendorProcessor(ABC):
         """
         Validate and parse date value
 
+        Uses shared utility: app.utils.validation.parse_date
+
         Args:
             value: Date value (datetime object or string)
 
@@ -349,14 +362,7 @@ class VendorProcessor(ABC):
             return value
 
         if isinstance(value, str):
-            # Try common date formats
-            for fmt in ["%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y", "%d-%m-%Y"]:
-                try:
-                    return datetime.strptime(value, fmt)
-                except ValueError:
-                    continue
-
-            raise ValueError(f"Invalid date format: {value}")
+            return parse_date(value)
 
         raise ValueError(f"Invalid date type: {type(value)}")
 
@@ -370,7 +376,7 @@ class VendorProcessor(ABC):
         Returns:
             Quarter number (1-4)
         """
-        return (month - 1) // 3 + 1
+        return QUARTER_BY_MONTH[month]
 
     # Helper Methods
 
@@ -89,12 +89,8 @@ class CDLCProcessor:
             if not any(row):
                 continue
 
-            row_dict = {}
-            for idx, header in enumerate(headers):
-                if idx < len(row):
-                    row_dict[header] = row[idx]
-
-            rows.append(row_dict)
+            # zip stops at the shorter of headers/row, like the old index check
+            rows.append(dict(zip(headers, row)))
 
         return rows
 
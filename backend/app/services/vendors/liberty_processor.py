@@ -7,11 +7,38 @@ Extracts Flagship (physical store in London) and Internet (online) sales separat
 
 import os
 import re
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Iterator, List, Dict, Iterable, Optional, Sequence
 import openpyxl
 from supabase import create_client, Client
 
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # python-calamine is optional; openpyxl read-only is the fallback
+    CalamineWorkbook = None
+
+# Characters dropped from numeric text: currency symbol and thousands separators
+_NUMERIC_NOISE = str.maketrans("", "", "£,")
+
+
+@lru_cache(maxsize=4)
+def _bibbi_client(url: str, key: str) -> Client:
+    """BIBBI Supabase client, created once per process for each (url, key)"""
+    return create_client(url, key)
+
+
+@dataclass(slots=True)
+class _StoreSale:
+    """One store's figures for a product, held until names are mapped"""
+    liberty_name: str
+    quantity: int
+    sales_gbp: float
+    sales_eur: float
+    store_identifier: str
+
 
 class LibertyProcessor:
     """Process Liberty vendor files for demo tenant"""
@@ -28,6 +55,9 @@ class LibertyProcessor:
     # Currency conversion rate
     GBP_TO_EUR = 1.17
 
+    # Liberty names per products query in _map_product_names()
+    PRODUCT_LOOKUP_CHUNK = 500
+
     def __init__(self):
         """Initialize processor with BIBBI Supabase connection for product mapping"""
         self.bibbi_supabase: Optional[Client] = None
@@ -41,7 +71,7 @@ class LibertyProcessor:
             bibbi_key = os.getenv("BIBBI_SUPABASE_SERVICE_KEY")
 
             if bibbi_key:
-                self.bibbi_supabase = create_client(bibbi_url, bibbi_key)
+                self.bibbi_supabase = _bibbi_client(bibbi_url, bibbi_key)
                 print("[LibertyProcessor] Connected to BIBBI Supabase for product mapping")
             else:
                 print("[LibertyProcessor] WARNING: BIBBI_SUPABASE_SERVICE_KEY not set, product mapping disabled")
@@ -72,39 +102,64 @@ class LibertyProcessor:
         now = datetime.now()
         return now.year, now.month, now.day
 
-    def _map_product_name(self, liberty_name: str) -> str:
+    def _map_product_names(self, liberty_names: Iterable[str]) -> Dict[str, str]:
         """
-        Map Liberty product name to functional name using BIBBI database
+        Map Liberty product names to functional names using BIBBI database
+
+        All names are looked up together, one products query per
+        PRODUCT_LOOKUP_CHUNK names, instead of one query per product.
 
         Args:
-            liberty_name: Raw product name from Liberty file
+            liberty_names: Raw product names from Liberty file
 
         Returns:
-            Mapped functional name (uppercase) or original if no mapping found
+            Dict mapping each name to its functional name (uppercase), or to
+            the name itself in uppercase if no mapping found
         """
-        if not self.bibbi_supabase or not liberty_name:
-            return liberty_name.upper() if liberty_name else ""
+        # Fallback to raw Liberty name in uppercase
+        mapped = {liberty_name: liberty_name.upper() for liberty_name in liberty_names}
+        if not self.bibbi_supabase or not mapped:
+            return mapped
+
+        # Names are matched on their stripped form
+        names_by_key: Dict[str, List[str]] = {}
+        for liberty_name in mapped:
+            names_by_key.setdefault(liberty_name.strip(), []).append(liberty_name)
+
+        keys = sorted(names_by_key)
+        matched = 0
+        for start in range(0, len(keys), self.PRODUCT_LOOKUP_CHUNK):
+            chunk = keys[start:start + self.PRODUCT_LOOKUP_CHUNK]
+            try:
+                # Query BIBBI products table for liberty_name mapping
+                result = self.bibbi_supabase.table("products")\
+                    .select("liberty_name, functional_name")\
+                    .in_("liberty_name", chunk)\
+                    .execute()
+            except Exception as e:
+                print(f"[LibertyProcessor] Product mapping failed for {len(chunk)} names: {e}")
+                continue
 
-        try:
-            # Query BIBBI products table for liberty_name mapping
-            result = self.bibbi_supabase.table("products")\
-                .select("functional_name")\
-                .eq("liberty_name", liberty_name.strip())\
-                .execute()
-
-            if result.data and len(result.data) > 0:
-                functional_name = result.data[0].get("functional_name")
-                if functional_name:
-                    print(f"[LibertyProcessor] Mapped '{liberty_name}' → '{functional_name}'")
-                    return functional_name.upper()
-        except Exception as e:
-            print(f"[LibertyProcessor] Product mapping failed for '{liberty_name}': {e}")
+            # First product row per name wins, as with a single-name query
+            functional_names: Dict[str, Optional[str]] = {}
+            for product in result.data or []:
+                functional_names.setdefault(product.get("liberty_name"), product.get("functional_name"))
 
-        # Fallback to raw Liberty name in uppercase
-        return liberty_name.upper() if liberty_name else ""
+            for key, functional_name in functional_names.items():
+                if functional_name and key in names_by_key:
+                    matched += 1
+                    for liberty_name in names_by_key[key]:
+                        mapped[liberty_name] = functional_name.upper()
+
+        print(f"[LibertyProcessor] Mapped {matched}/{len(names_by_key)} Liberty product names")
+        return mapped
 
     def _clean_numeric_value(self, value) -> Optional[float]:
         """Clean and convert numeric values, handling parentheses as negatives"""
+        # Numeric cells (the common case) need no text cleanup; bool is
+        # excluded, its text never parsed as a number
+        if type(value) is int or type(value) is float:
+            return float(value)
         if value is None or value == "":
             return None
 
@@ -117,8 +172,8 @@ class LibertyProcessor:
             if is_negative:
                 str_val = str_val[1:-1]  # Remove parentheses
 
-            # Remove currency symbols and commas
-            str_val = str_val.replace("£", "").replace(",", "").strip()
+            # Remove currency symbols and commas (one pass over the text)
+            str_val = str_val.translate(_NUMERIC_NOISE).strip()
 
             if not str_val or str_val == "-":
                 return None
@@ -130,11 +185,11 @@ class LibertyProcessor:
 
     def _is_total_row(self, row: tuple) -> bool:
         """Check if row is a total/summary row"""
+        # "grand total", "subtotal" and "... total" all contain "total"
         for cell_val in row:
             if cell_val and isinstance(cell_val, str):
-                val_lower = str(cell_val).lower()
-                if any(word in val_lower for word in ['total', 'sum', 'grand total', 'subtotal']) or \
-                   val_lower.endswith(' total'):
+                val_lower = cell_val.lower()
+                if 'total' in val_lower or 'sum' in val_lower:
                     return True
         return False
 
@@ -163,6 +218,39 @@ class LibertyProcessor:
 
         return False
 
+    def _sheet_rows(self, file_path: str, width: int) -> Iterator[Sequence[Any]]:
+        """
+        Stream the data rows (row 4 onwards) of the report, first width columns only
+
+        Uses python-calamine (Rust xlsx parser) when installed, otherwise
+        openpyxl read-only mode, which streams the sheet XML instead of
+        building every cell; data_only returns cached formula values. Both
+        report empty cells as None. Liberty reports have a single sheet:
+        calamine reads the first one, openpyxl the active one.
+        """
+        if CalamineWorkbook is not None:
+            # Keep leading empty rows/columns so indices match openpyxl's.
+            # to_python() returns every row at once, so the file is closed first
+            with CalamineWorkbook.from_path(file_path) as workbook:
+                rows = workbook.get_sheet_by_index(0).to_python(skip_empty_area=False)
+            for row in islice(rows, 3, None):
+                # Calamine reports empty cells as ""; openpyxl reports None
+                row = [None if value == "" else value for value in row[:width]]
+                yield row + [None] * (width - len(row))
+            return
+
+        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            sheet = workbook.active
+            # Read-only sheets trust the file's stored dimensions, which some
+            # exporters write wrong; read to the real end of the data instead
+            sheet.reset_dimensions()
+            # Cells to the right of width (YTD and other store sections) are
+            # dropped by the reader; rows are padded to width with None
+            yield from sheet.iter_rows(min_row=4, max_col=width, values_only=True)
+        finally:
+            workbook.close()
+
     def process(self, file_path: str, user_id: str, batch_id: str) -> List[Dict]:
         """
         Process Liberty Excel file and return list of records for sales_unified table
@@ -184,51 +272,60 @@ class LibertyProcessor:
 
         print(f"[LibertyProcessor] Extracted date: {sale_date} (from filename: {filename})")
 
-        # Load Excel workbook
-        workbook = openpyxl.load_workbook(file_path, data_only=True)
-        sheet = workbook.active
-
-        # Get all rows as list
-        rows = list(sheet.iter_rows(values_only=True))
-
-        print(f"[LibertyProcessor] Total rows in file: {len(rows)}")
         print(f"[LibertyProcessor] Skipping first 3 header rows, processing from row 4")
 
         records = []
         processed_rows = []  # Track for duplicate detection
-
-        # Start from row 4 (index 3) to skip 3-row header structure
+        # Store sales in file order; names are mapped after the sheet is
+        # read, with one lookup for all of them, and only then turned into
+        # record dicts
+        candidates: List[_StoreSale] = []
+
+        # Only columns A up to the last mapped column are used: rows come
+        # back exactly this wide, missing cells as None (see _sheet_rows)
+        width = max(self.COLUMN_MAPPING.values()) + 1
+        total_rows = 3
+
+        # Column positions are resolved once, not looked up per row
+        columns = self.COLUMN_MAPPING
+        product_name_col = columns["product_name"]
+        flagship_qty_col, flagship_sales_col = columns["flagship_qty"], columns["flagship_sales_gbp"]
+        internet_qty_col, internet_sales_col = columns["internet_qty"], columns["internet_sales_gbp"]
+
+        # Start from row 4 to skip 3-row header structure
         # Liberty structure: product header row → data row → total row (repeating)
-        idx = 3
-        while idx < len(rows) - 1:  # -1 because we read pairs
-            # Get current row and next row
-            header_row = rows[idx]
-            data_row = rows[idx + 1] if idx + 1 < len(rows) else None
+        # Each row is paired with the one before it; after a product is read
+        # its total row is skipped and pairing restarts with the next row
+        previous_row = None
+        skip_total_row = False
+        for row in self._sheet_rows(file_path, width):
+            total_rows += 1
+            if skip_total_row:
+                skip_total_row = False
+                continue
 
-            # Skip if not enough columns
-            if not header_row or not data_row or len(header_row) <= max(self.COLUMN_MAPPING.values()) or len(data_row) <= max(self.COLUMN_MAPPING.values()):
-                idx += 1
+            # Get current row and next row
+            header_row, data_row = previous_row, row
+            previous_row = row
+            if header_row is None:
                 continue
 
             # Extract product name from header row (Column F)
-            liberty_name = header_row[self.COLUMN_MAPPING["product_name"]]
+            liberty_name = header_row[product_name_col]
 
             # Skip if no product name or is a total row
             if not liberty_name or str(liberty_name).strip() == "" or self._is_total_row(header_row):
-                idx += 1
                 continue
 
             # Check if data row has any numeric values (not empty header row)
-            flagship_qty_raw = data_row[self.COLUMN_MAPPING["flagship_qty"]]
-            flagship_sales_raw = data_row[self.COLUMN_MAPPING["flagship_sales_gbp"]]
+            flagship_qty_raw = data_row[flagship_qty_col]
+            flagship_sales_raw = data_row[flagship_sales_col]
 
             # If data row is also empty (no quantities), skip this pair
             if (not flagship_qty_raw or flagship_qty_raw == '') and (not flagship_sales_raw or flagship_sales_raw == ''):
-                idx += 1
                 continue
 
-            # Map to functional name
-            functional_name = self._map_product_name(str(liberty_name))
+            liberty_name = str(liberty_name)
 
             # Extract Flagship data from data row (columns O, P)
             flagship_qty = self._clean_numeric_value(flagship_qty_raw)
@@ -236,57 +333,65 @@ class LibertyProcessor:
 
             # Create Flagship record if has data
             if flagship_qty is not None and flagship_sales_gbp is not None:
-                flagship_record = {
-                    "functional_name": functional_name,
-                    "product_id": functional_name,  # Use functional_name as product_id
-                    "quantity": int(flagship_qty) if flagship_qty else 0,
-                    "sales_gbp": flagship_sales_gbp,
-                    "sales_eur": round(flagship_sales_gbp * self.GBP_TO_EUR, 2) if flagship_sales_gbp else 0,
-                    "store_identifier": "London",
-                    "sale_date": sale_date,
-                    "year": year,
-                    "month": month,
-                }
-
-                # Check for duplicates
-                if not self._is_duplicate_row(flagship_record, processed_rows):
-                    # Include if quantity > 0 OR (quantity <= 0 AND has sales value)
-                    if flagship_record["quantity"] > 0 or (flagship_record["quantity"] <= 0 and flagship_record["sales_gbp"] != 0):
-                        records.append(flagship_record)
-                        processed_rows.append(flagship_record)
+                flagship_sale = _StoreSale(
+                    liberty_name,
+                    int(flagship_qty) if flagship_qty else 0,
+                    flagship_sales_gbp,
+                    round(flagship_sales_gbp * self.GBP_TO_EUR, 2) if flagship_sales_gbp else 0,
+                    "London",
+                )
+
+                # Include if quantity > 0 OR (quantity <= 0 AND has sales value)
+                if flagship_sale.quantity > 0 or (flagship_sale.quantity <= 0 and flagship_sale.sales_gbp != 0):
+                    candidates.append(flagship_sale)
 
             # Extract Internet data from data row (columns S, T)
-            internet_qty_raw = data_row[self.COLUMN_MAPPING["internet_qty"]]
-            internet_sales_raw = data_row[self.COLUMN_MAPPING["internet_sales_gbp"]]
+            internet_qty_raw = data_row[internet_qty_col]
+            internet_sales_raw = data_row[internet_sales_col]
 
             internet_qty = self._clean_numeric_value(internet_qty_raw)
             internet_sales_gbp = self._clean_numeric_value(internet_sales_raw)
 
             # Create Internet record if has data
             if internet_qty is not None and internet_sales_gbp is not None:
-                internet_record = {
-                    "functional_name": functional_name,
-                    "product_id": functional_name,  # Use functional_name as product_id
-                    "quantity": int(internet_qty) if internet_qty else 0,
-                    "sales_gbp": internet_sales_gbp,
-                    "sales_eur": round(internet_sales_gbp * self.GBP_TO_EUR, 2) if internet_sales_gbp else 0,
-                    "store_identifier": "Online",
-                    "sale_date": sale_date,
-                    "year": year,
-                    "month": month,
-                }
-
-                # Check for duplicates
-                if not self._is_duplicate_row(internet_record, processed_rows):
-                    # Include if quantity > 0 OR (quantity <= 0 AND has sales value)
-                    if internet_record["quantity"] > 0 or (internet_record["quantity"] <= 0 and internet_record["sales_gbp"] != 0):
-                        records.append(internet_record)
-                        processed_rows.append(internet_record)
+                internet_sale = _StoreSale(
+                    liberty_name,
+                    int(internet_qty) if internet_qty else 0,
+                    internet_sales_gbp,
+                    round(internet_sales_gbp * self.GBP_TO_EUR, 2) if internet_sales_gbp else 0,
+                    "Online",
+                )
+
+                # Include if quantity > 0 OR (quantity <= 0 AND has sales value)
+                if internet_sale.quantity > 0 or (internet_sale.quantity <= 0 and internet_sale.sales_gbp != 0):
+                    candidates.append(internet_sale)
 
             # Move to next product (skip data row and total row)
-            idx += 3
-
-        workbook.close()
+            previous_row = None
+            skip_total_row = True
+
+        print(f"[LibertyProcessor] Total rows in file: {total_rows}")
+
+        # Map to functional names, then drop duplicates in file order
+        functional_names = self._map_product_names({sale.liberty_name for sale in candidates})
+        for sale in candidates:
+            functional_name = functional_names[sale.liberty_name]
+            record = {
+                "functional_name": functional_name,
+                "product_id": functional_name,  # Use functional_name as product_id
+                "quantity": sale.quantity,
+                "sales_gbp": sale.sales_gbp,
+                "sales_eur": sale.sales_eur,
+                "store_identifier": sale.store_identifier,
+                "sale_date": sale_date,
+                "year": year,
+                "month": month,
+            }
+
+            # Check for duplicates
+            if not self._is_duplicate_row(record, processed_rows):
+                records.append(record)
+                processed_rows.append(record)
 
         print(f"[LibertyProcessor] Extracted {len(records)} records (after deduplication)")
         print(f"[LibertyProcessor] Sample record: {records[0] if records else 'No records'}")
@@ -60,21 +60,52 @@ def extract_rows_from_sheet(
         if skip_empty and not any(row):
             continue
 
-        # Build dictionary from row
-        row_dict = {}
-        for idx, header in enumerate(headers):
-            if idx < len(row):
-                row_dict[header] = row[idx]
-
-        rows.append(row_dict)
+        # Build dictionary from row (zip stops at the shorter of headers/row,
+        # so short rows simply omit their trailing columns)
+        rows.append(dict(zip(headers, row)))
 
     return rows
 
 
+def match_sheet_name(
+    sheetnames: List[str],
+    sheet_name: str,
+    case_insensitive: bool = True
+) -> Optional[str]:
+    """
+    Resolve a sheet name against a workbook's sheet names
+
+    An exact match wins; otherwise names are compared lowercased through a
+    dict built once, so "Sell out by EAN" finds "Sell Out by EAN".
+
+    Args:
+        sheetnames: Sheet names in workbook order
+        sheet_name: Name to look for
+        case_insensitive: If False, only an exact match counts
+
+    Returns:
+        The workbook's spelling of the sheet name, or None if absent
+
+    Examples:
+        >>> match_sheet_name(["Summary", "Sell Out by EAN"], "sell out by ean")
+        'Sell Out by EAN'
+    """
+    if sheet_name in sheetnames:
+        return sheet_name
+    if not case_insensitive:
+        return None
+    # First sheet wins if two names differ only by case
+    by_lower = {}
+    for name in sheetnames:
+        by_lower.setdefault(name.lower(), name)
+    return by_lower.get(sheet_name.lower())
+
+
 def find_sheet_by_name(
     workbook: openpyxl.Workbook,
     sheet_name: str,
-    fallback_to_first: bool = False
+    fallback_to_first: bool = False,
+    case_insensitive: bool = False
 ) -> Worksheet:
     """
     Find worksheet by name with optional fallback
@@ -83,6 +114,7 @@ def find_sheet_by_name(
         workbook: Excel workbook object
         sheet_name: Name of sheet to find
         fallback_to_first: If True, returns first sheet when named sheet not found
+        case_insensitive: If True, also matches names differing only by case
 
     Returns:
         Worksheet object
@@ -96,8 +128,9 @@ def find_sheet_by_name(
         >>> # Or with fallback:
         >>> sheet = find_sheet_by_name(workbook, "Data", fallback_to_first=True)
     """
-    if sheet_name in workbook.sheetnames:
-        return workbook[sheet_name]
+    match = match_sheet_name(workbook.sheetnames, sheet_name, case_insensitive)
+    if match is not None:
+        return workbook[match]
 
     if fallback_to_first:
         return workbook[workbook.sheetnames[0]]
@@ -200,7 +233,8 @@ def count_data_rows(
 def safe_load_workbook(
     file_path: str,
     data_only: bool = True,
-    read_only: bool = False
+    read_only: bool = False,
+    keep_links: bool = False
 ) -> openpyxl.Workbook:
     """
     Safely load Excel workbook with error handling
@@ -209,6 +243,8 @@ def safe_load_workbook(
         file_path: Path to Excel file
         data_only: If True, reads cell values instead of formulas (default: True)
         read_only: If True, opens in read-only mode for better performance
+        keep_links: If True, also parses external workbook links. Only
+            needed when the workbook is saved again (default: False)
 
     Returns:
         Workbook object
@@ -225,7 +261,9 @@ def safe_load_workbook(
         return openpyxl.load_workbook(
             file_path,
             data_only=data_only,
-            read_only=read_only
+            read_only=read_only,
+            keep_vba=False,
+            keep_links=keep_links
         )
     except FileNotFoundError:
         raise ValueError(f"Excel file not found: {file_path}")
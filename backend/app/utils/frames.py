@@ -0,0 +1,136 @@
+"""
+Column-wise (pandas) data validation utilities for vendor data
+
+DataFrame counterparts of app.utils.validation, used by processors that
+transform a whole sheet at once (transform_dataframe) instead of row by
+row. Each helper reproduces the row-level conversion, including its
+error message, so both paths report the same results for the same file.
+
+All functions follow consistent patterns:
+- Take and return pandas Series aligned on the frame's index
+- Never raise for bad cell values; invalid cells come back as NaN/False
+- Row errors are collected with RowErrors (first failing check wins)
+"""
+
+from typing import Any
+
+import pandas as pd
+
+
+def column(df: pd.DataFrame, name: str) -> pd.Series:
+    """
+    Column by name, or an all-None column if the sheet does not have it
+
+    Column-wise `row.get(name)`.
+    """
+    if name in df:
+        return df[name]
+    return pd.Series(None, index=df.index, dtype=object)
+
+
+def truthy(series: pd.Series) -> pd.Series:
+    """
+    Mask of cells that are truthy in Python (not None, "" or 0)
+
+    Examples:
+        >>> truthy(pd.Series(["a", "", None, 0, 5])).tolist()
+        [True, False, False, False, True]
+    """
+    return series.notna() & (series != "") & (series != 0)
+
+
+def first_truthy(df: pd.DataFrame, *names: str) -> pd.Series:
+    """
+    Column-wise `row.get(a) or row.get(b) or ...`
+
+    Each cell takes the first truthy value across the named columns, or the
+    last column's value if none is truthy (as the `or` chain does).
+    """
+    result = column(df, names[-1])
+    for name in reversed(names[:-1]):
+        values = column(df, name)
+        result = values.where(truthy(values), result)
+    return result
+
+
+def to_number(series: pd.Series) -> pd.Series:
+    """
+    Parse cells as floats, NaN where they are not numeric
+
+    Supports accounting notation like the processors' _to_int/_to_float:
+    "(123.45)" = -123.45. "inf" is rejected as non-numeric.
+    """
+    text = series.astype(str).str.strip().str.replace(r"^\((.*)\)$", r"-\1", regex=True)
+    numbers = pd.to_numeric(text, errors="coerce")
+    # Infinite values are not usable sales figures; treat them like text
+    return numbers.where(numbers.abs() != float("inf"))
+
+
+def truncate_to_int(numbers: pd.Series) -> pd.Series:
+    """
+    int(float(x)) for parsed numbers (truncates toward zero)
+
+    NaN cells become 0; callers are expected to have flagged those rows.
+    """
+    return numbers.fillna(0).astype("int64")
+
+
+def month_start(year: pd.Series, month: pd.Series) -> pd.Series:
+    """ISO date of the first day of each month, as datetime(y, m, 1).date().isoformat()"""
+    return year.astype(str).str.zfill(4) + "-" + month.astype(str).str.zfill(2) + "-01"
+
+
+def quarter(month: pd.Series) -> pd.Series:
+    """Quarter (1-4) of each month number, as QUARTER_BY_MONTH[m] row by row"""
+    return (month - 1) // 3 + 1
+
+
+def normalize_ean(series: pd.Series) -> pd.Series:
+    """
+    EAN text as validate_ean() builds it before the format check
+
+    Strips whitespace and drops anything after a decimal point (Excel
+    number formatting). Use is_ean13() on the result for the check itself.
+    """
+    return series.astype(str).str.strip().str.split(".", n=1).str[0]
+
+
+def is_ean13(series: pd.Series) -> pd.Series:
+    """Mask of normalized EAN strings that are exactly 13 digits"""
+    return series.str.fullmatch(r"\d{13}").fillna(False).astype(bool)
+
+
+def normalize_store(series: pd.Series, default: str) -> pd.Series:
+    """
+    Store identifiers as `str(v).strip().lower().replace(' ', '_')`
+
+    Cells that are not truthy get the processor's default store identifier.
+    """
+    identifiers = series.astype(str).str.strip().str.lower().str.replace(" ", "_", regex=False)
+    return identifiers.where(truthy(series), default)
+
+
+class RowErrors:
+    """
+    Per-row error messages for a column-wise transform
+
+    Checks are added in the same order transform_row() runs them; a row
+    keeps the message of the first check it fails, matching the row path
+    where the first raised ValueError wins.
+    """
+
+    def __init__(self, index: pd.Index):
+        self.messages = pd.Series(None, index=index, dtype=object)
+
+    def add(self, failed: pd.Series, message: Any) -> None:
+        """
+        Record message (a string or a per-row Series) for rows where failed
+
+        Rows that already failed an earlier check keep their message.
+        """
+        self.messages = self.messages.where(self.messages.notna() | ~failed, message)
+
+    @property
+    def ok(self) -> pd.Series:
+        """Mask of rows that passed every check"""
+        return self.messages.isna()
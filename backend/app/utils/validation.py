@@ -10,8 +10,23 @@ All functions follow consistent patterns:
 - Provide clear error messages with context
 """
 
+import re
+from datetime import datetime
+from functools import lru_cache
 from typing import Any, Optional
 
+# Quarter for each month (index 0 unused), so per-row code does a tuple
+# lookup instead of arithmetic
+QUARTER_BY_MONTH = (0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4)
+
+# Date string shapes and the strptime formats they can be, tried in order
+# (d/m/Y and m/d/Y share a shape; day-first wins when both parse)
+_DATE_FORMATS_BY_SHAPE = (
+    (re.compile(r"\d{4}-\s?\d{1,2}-\s?\d{1,2}"), ("%Y-%m-%d",)),
+    (re.compile(r"\s?\d{1,2}/\s?\d{1,2}/\d{4}"), ("%d/%m/%Y", "%m/%d/%Y")),
+    (re.compile(r"\s?\d{1,2}-\s?\d{1,2}-\d{4}"), ("%d-%m-%Y",)),
+)
+
 
 def validate_ean(
     value: Any,
@@ -133,6 +148,47 @@ def validate_year(value: Any, min_year: int = 2000, max_year: int = 2100) -> int
     return year
 
 
+@lru_cache(maxsize=4096)
+def parse_date(value: str) -> datetime:
+    """
+    Parse a date string in one of the supported vendor formats
+
+    Supported formats, in order of preference: YYYY-MM-DD, DD/MM/YYYY,
+    MM/DD/YYYY, DD-MM-YYYY. The string's shape picks the candidate formats,
+    so at most two strptime calls are made. Results are cached, since date
+    columns repeat the same few values on every row.
+
+    Args:
+        value: Date string
+
+    Returns:
+        Parsed datetime
+
+    Raises:
+        ValueError: If the string matches none of the formats
+
+    Examples:
+        >>> parse_date("2024-03-15")
+        datetime.datetime(2024, 3, 15, 0, 0)
+
+        >>> parse_date("12/31/2024")  # not a valid DD/MM/YYYY date
+        datetime.datetime(2024, 12, 31, 0, 0)
+
+        >>> parse_date("March 2024")
+        Traceback: ValueError: Invalid date format: March 2024
+    """
+    for shape, formats in _DATE_FORMATS_BY_SHAPE:
+        if shape.fullmatch(value):
+            for fmt in formats:
+                try:
+                    return datetime.strptime(value, fmt)
+                except ValueError:
+                    continue
+            break
+
+    raise ValueError(f"Invalid date format: {value}")
+
+
 def to_int(value: Any, field_name: str) -> int:
     """
     Convert value to integer with error handling
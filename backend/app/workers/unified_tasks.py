@@ -195,9 +195,9 @@ def _process_bibbi(context: UploadContext) -> Dict[str, Any]:
     print(f"[BIBBI] Step 1: Parsing file with {context.detected_vendor} processor")
     processing_result = processor.process(context.file_path, context.batch_id)
 
-    # Extract records from ProcessingResult
-    parsed_records = processing_result.transformed_data
-    print(f"[BIBBI] Parsed {len(parsed_records)} records ({processing_result.successful_rows} success, {processing_result.failed_rows} failed)")
+    # Records stay in the ProcessingResult; step 3 streams them out in insert-sized chunks
+    parsed_count = processing_result.successful_rows
+    print(f"[BIBBI] Parsed {parsed_count} records ({processing_result.successful_rows} success, {processing_result.failed_rows} failed)")
     print(f"[BIBBI] Detected {len(processing_result.stores)} stores")
 
     # STEP 2: Create/update store records and build store_identifier → store_id mapping
@@ -221,12 +221,13 @@ def _process_bibbi(context: UploadContext) -> Dict[str, Any]:
     print(f"[BIBBI] Store mapping: {store_mapping}")
 
     # STEP 3: Insert validated sales data into sales_unified
-    print(f"[BIBBI] Step 3: Inserting {len(parsed_records)} records into sales_unified")
+    print(f"[BIBBI] Step 3: Inserting {parsed_count} records into sales_unified")
     insertion_service = BibbιSalesInsertionService(bibbi_db)
 
     try:
-        insertion_result = insertion_service.insert_validated_sales(
-            validated_data=parsed_records,
+        # One bulk insert per chunk of transformed rows
+        insertion_result = insertion_service.insert_sales_batches(
+            processing_result.iter_batches(insertion_service.DEFAULT_BATCH_SIZE),
             store_mapping=store_mapping  # Pass mapping to convert store_identifier → store_id
         )
 
@@ -245,7 +246,7 @@ def _process_bibbi(context: UploadContext) -> Dict[str, Any]:
 
         rows_inserted = 0
         rows_duplicate = 0
-        rows_failed = len(parsed_records)
+        rows_failed = parsed_count
         final_status = "failed"
 
     # STEP 4: Update batch status with statistics
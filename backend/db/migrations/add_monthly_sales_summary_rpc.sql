@@ -0,0 +1,68 @@
+-- ============================================
+-- Monthly Sales Summary RPC Function
+-- Used by SalesAggregator._get_monthly_summary
+-- ============================================
+-- Aggregates offline (sellout_entries2) and online (ecommerce_orders)
+-- sales per month in a single UNION ALL statement, so the combined
+-- 'all' channel summary costs one round-trip instead of two full-table
+-- fetches grouped in Python.
+--
+-- SECURITY INVOKER (default) keeps the caller's RLS policies in effect.
+
+CREATE OR REPLACE FUNCTION get_monthly_sales_summary(
+    p_channel TEXT DEFAULT 'all',
+    p_start_date DATE DEFAULT NULL,
+    p_end_date DATE DEFAULT NULL
+) RETURNS TABLE(
+    period DATE,
+    revenue DOUBLE PRECISION,
+    units BIGINT,
+    transactions BIGINT,
+    channel TEXT
+)
+AS $$
+BEGIN
+    RETURN QUERY
+    SELECT s.period, s.revenue, s.units, s.transactions, s.channel
+    FROM (
+        SELECT
+            make_date(o.year, o.month, 1) AS period,
+            SUM(o.sales_eur)::DOUBLE PRECISION AS revenue,
+            SUM(o.quantity)::BIGINT AS units,
+            COUNT(*) AS transactions,
+            'offline'::TEXT AS channel
+        FROM sellout_entries2 o
+        WHERE p_channel IN ('offline', 'all')
+          -- Rows without a period were never grouped into a month
+          AND o.year IS NOT NULL AND o.month IS NOT NULL
+          -- Offline data is month-granular: only filter when both bounds are given
+          AND (
+              p_start_date IS NULL OR p_end_date IS NULL
+              OR make_date(o.year, o.month, 1) BETWEEN p_start_date AND p_end_date
+          )
+        GROUP BY o.year, o.month
+
+        UNION ALL
+
+        SELECT
+            date_trunc('month', e.order_date)::DATE AS period,
+            SUM(e.sales_eur)::DOUBLE PRECISION AS revenue,
+            SUM(e.quantity)::BIGINT AS units,
+            COUNT(*) AS transactions,
+            'online'::TEXT AS channel
+        FROM ecommerce_orders e
+        WHERE p_channel IN ('online', 'all')
+          AND e.order_date IS NOT NULL
+          AND (p_start_date IS NULL OR e.order_date >= p_start_date)
+          AND (p_end_date IS NULL OR e.order_date <= p_end_date)
+        GROUP BY date_trunc('month', e.order_date)
+    ) s
+    -- Offline months first, then online months, each newest first
+    ORDER BY (s.channel = 'online'), s.period DESC;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+GRANT EXECUTE ON FUNCTION get_monthly_sales_summary(TEXT, DATE, DATE) TO authenticated;
+GRANT EXECUTE ON FUNCTION get_monthly_sales_summary(TEXT, DATE, DATE) TO service_role;
+
+COMMENT ON FUNCTION get_monthly_sales_summary(TEXT, DATE, DATE) IS 'Monthly revenue/units/transactions for offline and online sales in one UNION ALL query.';
@@ -6,12 +6,22 @@ shared utilities from app/utils/validation.py and app/utils/excel.py
 """
 
 import pytest
+import pandas as pd
 import tempfile
 import openpyxl
 from pathlib import Path
 from typing import List, Dict, Any, Optional
-
-from app.services.bibbi.processors.base import BibbiBseProcessor
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+from app.services.bibbi.processors.base import (
+    BibbiBseProcessor,
+    ProcessingResult,
+    clear_reseller_cache,
+    month_fields,
+    month_start_iso,
+    normalize_store_identifier
+)
 from app.services.vendors.base import VendorProcessor
 
 
@@ -114,6 +124,29 @@ class TestBibbiBseProcessorUtilities:
             yield tmp.name
             Path(tmp.name).unlink()
 
+    def test_iter_sheet_dicts_calamine_matches_openpyxl(self, test_processor, tmp_path):
+        """Test _iter_sheet_dicts() reads the same dicts with python-calamine as with openpyxl"""
+        pytest.importorskip("python_calamine")
+        file_path = tmp_path / "sheet.xlsx"
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.append(["EAN", " Product ", "Quantity", "Price"])
+        ws.append(["1234567890123", "Product A", None, 99.99])
+        ws.append([])
+        ws.append(["9876543210987", "Product B", 5])
+        wb.save(file_path)
+        wb.close()
+
+        with patch("app.services.bibbi.processors.base.CalamineWorkbook", None):
+            expected = list(test_processor._iter_sheet_dicts(str(file_path)))
+        rows = list(test_processor._iter_sheet_dicts(str(file_path)))
+
+        assert expected == [
+            {"EAN": "1234567890123", "Product": "Product A", "Quantity": None, "Price": 99.99},
+            {"EAN": "9876543210987", "Product": "Product B", "Quantity": 5, "Price": None},
+        ]
+        assert rows == expected
+
     def test_load_workbook_uses_shared_utility(self, test_processor, test_excel_file):
         """Test _load_workbook() uses safe_load_workbook()"""
         workbook = test_processor._load_workbook(test_excel_file, read_only=True)
@@ -152,6 +185,14 @@ class TestBibbiBseProcessorUtilities:
         with pytest.raises(ValueError):
             test_processor._validate_ean("invalid", required=True)
 
+    def test_validate_ean_fast_paths_match_shared_utility(self, test_processor):
+        """Test the _validate_ean() fast paths agree with validate_ean()"""
+        from app.utils.validation import validate_ean
+
+        for value in ["1234567890123", " 1234567890123 ", "1234567890123.0", "123456789012a",
+                      "١٢٣٤٥٦٧٨٩٠١٢٣", 1234567890123, 123, 1234567890123.0, 1234567890123.5]:
+            assert test_processor._validate_ean(value, strict=False) == validate_ean(value, strict=False)
+
     def test_to_int_uses_shared_utility(self, test_processor):
         """Test _to_int() uses to_int() with accounting notation support"""
         # Standard integer
@@ -192,6 +233,12 @@ class TestBibbiBseProcessorUtilities:
         assert isinstance(value, Decimal)
         assert value == Decimal("99.99")
 
+        # Accounting notation (negative)
+        assert test_processor._to_decimal(" (12.50) ", "price") == Decimal("-12.50")
+
+        # Whitespace-only cells are empty, like ""
+        assert test_processor._to_decimal("   ", "price") == Decimal("0.0")
+
     def test_convert_currency(self, test_processor):
         """Test _convert_currency() utility"""
         # EUR to EUR (no conversion)
@@ -206,6 +253,83 @@ class TestBibbiBseProcessorUtilities:
         with pytest.raises(ValueError, match="Unknown currency"):
             test_processor._convert_currency(100.0, "XXX")
 
+    def test_convert_eur_uses_processor_currency(self, test_processor):
+        """Test _convert_eur() matches _convert_currency() for the processor's currency"""
+        assert test_processor._convert_eur(100.0) == test_processor._convert_currency(100.0, test_processor.get_currency())
+
+        test_processor.get_currency = lambda: "GBP"
+        test_processor._rate = None
+        assert test_processor._convert_eur(100.0) == test_processor._convert_currency(100.0, "GBP")
+
+    def test_convert_eur_column_matches_convert_eur(self, test_processor):
+        """Test _convert_eur_column() converts a column like _convert_eur() does per value"""
+        amounts = pd.Series([100.0, 12.345, 0.0, -7.5])
+        assert test_processor._convert_eur_column(amounts) is amounts  # EUR passes through
+
+        test_processor.get_currency = lambda: "PLN"
+        test_processor._rate = None
+        assert test_processor._convert_eur_column(amounts).tolist() == [test_processor._convert_eur(a) for a in amounts]
+
+    def test_currency_rate(self, test_processor):
+        """Test _currency_rate() returns the per-file rate used for column-wise conversion"""
+        assert test_processor._currency_rate("EUR") == 1.0
+        assert test_processor._currency_rate("GBP") == test_processor.CURRENCY_RATES["GBP"]
+
+        with pytest.raises(ValueError, match="Unknown currency"):
+            test_processor._currency_rate("XXX")
+
+    def test_reseller_lookup_shared_across_instances(self):
+        """Test a second processor for the same reseller skips the resellers query"""
+        client = Mock()
+        client.table.return_value.select.return_value.eq.return_value.execute.return_value = Mock(
+            data=[{"sales_channel": "B2C", "reseller": "Shared"}]
+        )
+        reseller_id = str(uuid4())
+
+        with patch("app.core.bibbi.get_bibbi_db", return_value=Mock(client=client)):
+            assert TestBibbiProcessor(reseller_id)._get_reseller_sales_channel() == "B2C"
+            assert TestBibbiProcessor(reseller_id)._get_reseller_sales_channel() == "B2C"
+            assert client.table.call_count == 1
+
+            clear_reseller_cache()
+            assert TestBibbiProcessor(reseller_id)._get_reseller_sales_channel() == "B2C"
+            assert client.table.call_count == 2
+
+    def test_month_start_iso(self):
+        """Test month_start_iso() formats and validates like datetime(y, m, 1)"""
+        from datetime import datetime
+
+        assert month_start_iso(2024, 3) == "2024-03-01"
+        for year, month in [(2024, 13), (0, 1)]:
+            with pytest.raises(ValueError) as expected:
+                datetime(year, month, 1)
+            with pytest.raises(ValueError, match=str(expected.value)):
+                month_start_iso(year, month)
+
+    def test_month_fields(self):
+        """Test month_fields() bundles sale_date, year, month and quarter"""
+        assert month_fields(2024, 11) == ("2024-11-01", 2024, 11, 4)
+        with pytest.raises(ValueError):
+            month_fields(2024, 13)
+
+    def test_normalize_store_identifier(self):
+        """Test normalize_store_identifier() lowercases, strips and underscores store names"""
+        assert normalize_store_identifier(" Riga Mall ") == "riga_mall"
+        assert normalize_store_identifier(1) == "1"
+        assert normalize_store_identifier(1.0) == "1.0"
+
+    def test_reseller_lookup_misses_not_cached(self):
+        """Test a reseller that is not found is queried again next time"""
+        client = Mock()
+        client.table.return_value.select.return_value.eq.return_value.execute.return_value = Mock(data=[])
+        reseller_id = str(uuid4())
+
+        with patch("app.core.bibbi.get_bibbi_db", return_value=Mock(client=client)):
+            assert TestBibbiProcessor(reseller_id)._get_reseller_sales_channel() is None
+            assert TestBibbiProcessor(reseller_id)._get_reseller_sales_channel() is None
+
+        assert client.table.call_count == 2
+
     def test_calculate_quarter(self, test_processor):
         """Test _calculate_quarter() utility"""
         assert test_processor._calculate_quarter(1) == 1
@@ -233,6 +357,50 @@ class TestBibbiBseProcessorUtilities:
         assert first_row["unit_price"] == 99.99  # to_float
         assert first_row["vendor_name"] == "test_bibbi"
 
+    def test_processing_pipeline_streams_rows_and_stores(self, test_excel_file):
+        """Test process() consumes generator rows and collects stores per row"""
+
+        class StreamingProcessor(TestBibbiProcessor):
+            def extract_rows(self, file_path):
+                yield from super().extract_rows(file_path)
+
+            def store_from_row(self, raw_row):
+                return {
+                    "store_identifier": raw_row["Product"].lower().replace(" ", "_"),
+                    "store_name": raw_row["Product"],
+                    "store_type": "physical",
+                    "reseller_id": self.reseller_id
+                }
+
+            def extract_stores(self, file_path):
+                raise AssertionError("stores should come from rows")
+
+        result = StreamingProcessor(reseller_id="test-reseller-123").process(
+            test_excel_file, batch_id="test-batch-123"
+        )
+
+        assert result.total_rows == 2
+        assert result.successful_rows == 2
+        assert [s["store_identifier"] for s in result.stores] == ["product_a", "product_b"]
+
+    def test_processing_result_materializes_columns(self):
+        """Test column-wise ProcessingResult exposes the same rows as transformed_data"""
+        result = ProcessingResult(
+            vendor="test_bibbi",
+            total_rows=2,
+            successful_rows=2,
+            failed_rows=0,
+            transformed_data=None,
+            stores=[],
+            errors=[],
+            transformed_columns={"product_ean": ["1234567890123", "9876543210987"], "quantity": [10, 5]}
+        )
+
+        assert result.transformed_data == [
+            {"product_ean": "1234567890123", "quantity": 10},
+            {"product_ean": "9876543210987", "quantity": 5},
+        ]
+        assert result.to_dict()["transformed_data"] == result.transformed_data
 
 # ============================================
 # VENDOR BASE PROCESSOR TESTS
@@ -310,6 +478,10 @@ class TestVendorProcessorUtilities:
         value = test_processor._to_decimal(99.99, "amount")
         from decimal import Decimal
         assert isinstance(value, Decimal)
+        assert value == Decimal("99.99")
+        assert test_processor._to_decimal(" 12.345678901234567890 ", "amount") == Decimal("12.345678901234567890")
+        with pytest.raises(ValueError, match="Invalid decimal for amount"):
+            test_processor._to_decimal("abc", "amount")
 
     def test_vendor_processor_currency_conversion(self, test_processor):
         """Test VendorProcessor currency conversion"""
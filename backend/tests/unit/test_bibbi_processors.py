@@ -11,7 +11,7 @@ import pytest
 import tempfile
 import openpyxl
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime
 from unittest.mock import Mock, MagicMock, patch
 from decimal import Decimal
 
@@ -49,6 +49,11 @@ def test_batch_id():
     return "4fbf4ea6-g3bg-550d-9111-e5985da066b16"
 
 
+def _without_timestamps(rows):
+    """Rows without created_at, which differs between two processing runs"""
+    return [{k: v for k, v in row.items() if k != "created_at"} for row in rows]
+
+
 # ============================================
 # BOXNOX PROCESSOR TESTS
 # ============================================
@@ -113,6 +118,106 @@ class TestBoxnoxProcessor:
             Path(tmp.name).unlink()
 
 
+    def test_extract_rows_reads_identifiers_as_text(self, test_reseller_id):
+        """Test extract_rows keeps EANs as text and falls back to the first sheet"""
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
+            wb = openpyxl.Workbook()
+            ws = wb.active
+            ws.title = "Sheet1"
+            ws.append(["Product EAN", "Sold Qty", "Sales Amount (EUR)", "POS"])
+            ws.append([1234567890123, 10, 100.50, "Riga Mall"])
+            ws.append([None, None, None, None])
+            ws.append(["9876543210987", 5, 50.25, None])
+            wb.save(tmp.name)
+            wb.close()
+
+            rows = BoxnoxProcessor(test_reseller_id).extract_rows(tmp.name)
+
+            Path(tmp.name).unlink()
+
+        assert [row["Product EAN"] for row in rows] == ["1234567890123", "9876543210987"]
+        assert rows[0]["POS"] == "Riga Mall"
+        assert rows[1]["POS"] is None
+
+    def test_extract_rows_matches_target_sheet_case_insensitively(self, test_reseller_id):
+        """Test a differently-cased "Sell Out by EAN" sheet is read instead of the first sheet"""
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
+            wb = openpyxl.Workbook()
+            wb.active.title = "Summary"
+            wb.active.append(["Total"])
+            ws = wb.create_sheet("Sell out by EAN")
+            ws.append(["Product EAN", "Sold Qty", "Sales Amount (EUR)", "POS"])
+            ws.append(["1234567890123", 10, 100.50, "Riga Mall"])
+            wb.save(tmp.name)
+            wb.close()
+
+            rows = BoxnoxProcessor(test_reseller_id).extract_rows(tmp.name)
+
+            Path(tmp.name).unlink()
+
+        assert [row["Product EAN"] for row in rows] == ["1234567890123"]
+
+
+    @patch("app.services.bibbi.processors.base.BibbiBseProcessor._get_reseller_sales_channel", return_value="B2B")
+    def test_process_parses_file_once(self, _mock_channel, test_reseller_id, test_batch_id):
+        """Test rows and stores come from a single parse of the workbook"""
+        processor = BoxnoxProcessor(test_reseller_id)
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
+            wb = openpyxl.Workbook()
+            ws = wb.active
+            ws.title = "Sell Out by EAN"
+            ws.append(["Product EAN", "Sold Qty", "Sales Amount (EUR)", "Month", "Year", "POS"])
+            ws.append(["1234567890123", 10, 100.50, 1, 2024, "Riga Mall"])
+            wb.save(tmp.name)
+            wb.close()
+
+            with patch.object(processor, "_read_frame", wraps=processor._read_frame) as read_frame:
+                result = processor.process(tmp.name, test_batch_id)
+
+            Path(tmp.name).unlink()
+
+        assert read_frame.call_count == 1
+        assert result.successful_rows == 1
+        assert [s["store_identifier"] for s in result.stores] == ["riga_mall"]
+        assert processor._file_cache is None
+
+
+    @patch("app.services.bibbi.processors.base.BibbiBseProcessor._get_reseller_sales_channel", return_value="B2B")
+    def test_vectorized_path_matches_row_path(self, _mock_channel, test_reseller_id, test_batch_id):
+        """Test transform_dataframe produces the same rows and errors as transform_row"""
+        processor = BoxnoxProcessor(test_reseller_id)
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
+            wb = openpyxl.Workbook()
+            ws = wb.active
+            ws.title = "Sell Out by EAN"
+            ws.append(["Product EAN", "Sold Qty", "Sales Amount (EUR)", "Sales Amount", "Month", "Year", "POS"])
+            ws.append([1234567890123, 10, 100.50, None, 3, 2024, "Riga Mall"])
+            ws.append(["9876543210987", "(2)", None, "20.5", None, None, None])  # Negative quantity
+            ws.append(["9876543210987", 2.9, None, "7", 12, 2023, "Online Shop"])
+            ws.append([None, 1, 5, None, 1, 2024, None])                          # Missing EAN
+            ws.append(["123", 1, 5, None, 1, 2024, None])                         # Invalid EAN
+            ws.append(["1234567890123", None, 5, None, 1, 2024, None])            # Missing quantity
+            ws.append(["1234567890123", "abc", 5, None, 1, 2024, None])
+            ws.append(["1234567890123", 1, None, None, 1, 2024, None])            # Missing amount
+            ws.append(["1234567890123", 1, "n/a", None, 1, 2024, None])
+            ws.append(["1234567890123", 1, 5, None, 13, 2024, None])              # Invalid month
+            ws.append(["1234567890123", 1, 5, None, "May", 2024, None])
+            wb.save(tmp.name)
+            wb.close()
+
+            vectorized = processor.process(tmp.name, test_batch_id)
+            processor.VECTORIZED = False
+            row_path = processor.process(tmp.name, test_batch_id)
+
+            Path(tmp.name).unlink()
+
+        assert vectorized.total_rows == row_path.total_rows == 11
+        assert vectorized.successful_rows == 2
+        assert _without_timestamps(vectorized.transformed_data) == _without_timestamps(row_path.transformed_data)
+        assert vectorized.errors == row_path.errors
+        assert vectorized.stores == row_path.stores
+
+
 # ============================================
 # GALILU PROCESSOR TESTS
 # ============================================
@@ -171,6 +276,240 @@ class TestGaliluProcessor:
             Path(tmp.name).unlink()
 
 
+    @patch("app.services.bibbi.processors.base.BibbiBseProcessor._get_reseller_sales_channel", return_value="B2B")
+    def test_process_parses_workbook_once(self, _mock_channel, test_reseller_id, test_batch_id):
+        """Test stores (one per sheet) and rows come from a single workbook pass"""
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
+            wb = openpyxl.Workbook()
+            wb.active.title = "Warsaw Centrum"
+            wb.active.append(["Product", "Quantity", "Month", "Year"])
+            wb.active.append(["Product A", 2, 1, 2024])
+            wb.create_sheet("_hidden").append(["ignored"])
+            wb.create_sheet("Info").append(["ignored"])
+            ws = wb.create_sheet("Krakow")
+            ws.append(["Product", "Quantity", "Month", "Year"])
+            ws.append(["Product B", 1, 1, 2024])
+            wb.save(tmp.name)
+            wb.close()
+
+            processor = GaliluProcessor(test_reseller_id)
+            # openpyxl backend, so the workbook loads can be counted
+            with patch("app.services.bibbi.processors.galilu_processor.CalamineWorkbook", None), \
+                    patch.object(processor, "_load_workbook", wraps=processor._load_workbook) as load:
+                result = processor.process(tmp.name, test_batch_id)
+
+            Path(tmp.name).unlink()
+
+        assert load.call_count == 1
+        assert result.total_rows == 2
+        assert [store["store_identifier"] for store in result.stores] == ["warsaw_centrum", "krakow"]
+        assert [error["raw_data"]["_sheet_name"] for error in result.errors] == ["Warsaw Centrum", "Krakow"]
+
+    def test_calamine_rows_match_openpyxl_rows(self, test_reseller_id):
+        """Test python-calamine and openpyxl read the same dicts (blank rows skipped, empty cells None)"""
+        pytest.importorskip("python_calamine")
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
+            wb = openpyxl.Workbook()
+            wb.active.title = "Krakow"
+            wb.active.append(["Product", "Quantity", "Month", "Year"])
+            wb.active.append(["Product A", 2, 1, 2024])
+            wb.active.append([None, None, None, None])
+            wb.active.append(["Product B", None, 3, 2024])
+            wb.save(tmp.name)
+            wb.close()
+
+            with patch("app.services.bibbi.processors.galilu_processor.CalamineWorkbook", None):
+                expected = GaliluProcessor(test_reseller_id).extract_rows(tmp.name)
+            rows = GaliluProcessor(test_reseller_id).extract_rows(tmp.name)
+
+            Path(tmp.name).unlink()
+
+        assert [row["Product"] for row in expected] == ["Product A", "Product B"]
+        assert expected[1]["Quantity"] is None
+        assert rows == expected
+
+    @patch("app.services.bibbi.processors.base.BibbiBseProcessor._get_reseller_sales_channel", return_value="B2B")
+    def test_iter_rows_streams_into_row_transform(self, _mock_channel, test_reseller_id, test_batch_id):
+        """Test iter_rows() yields extract_rows()' rows and the row transform consumes it chunk by chunk"""
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
+            wb = openpyxl.Workbook()
+            wb.active.title = "Krakow"
+            wb.active.append(["Product", "Quantity", "Month", "Year"])
+            for i in range(5):
+                wb.active.append([f"Product {i % 2}", i + 1, 1, 2024])
+            wb.save(tmp.name)
+            wb.close()
+
+            processor = GaliluProcessor(test_reseller_id)
+            processor.LOOKUP_CHUNK_ROWS = 2
+            processor._map_product_names = Mock(wraps=processor._map_product_names)
+            rows = processor.iter_rows(tmp.name)
+            assert list(processor.iter_rows(tmp.name)) == processor.extract_rows(tmp.name)
+
+            results = list(processor._transform_rows(rows, test_batch_id))
+
+            Path(tmp.name).unlink()
+
+        assert len(results) == 5
+        assert processor._map_product_names.call_count == 3  # one per 2-row chunk
+
+    @patch("app.services.bibbi.processors.base.BibbiBseProcessor._get_reseller_sales_channel", return_value="B2B")
+    def test_names_and_prices_resolved_in_bulk(self, _mock_channel, test_reseller_id, test_batch_id):
+        """Test product names are mapped once each and prices come from one IN query, not one per row"""
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
+            wb = openpyxl.Workbook()
+            wb.active.title = "Krakow"
+            wb.active.append(["Product", "Quantity", "Month", "Year"])
+            for name in ["Product A", "Product B", "Product A", "Product B"]:
+                wb.active.append([name, 2, 1, 2024])
+            wb.save(tmp.name)
+            wb.close()
+
+            db = MagicMock()
+            products = db.client.table.return_value.select.return_value
+            products.in_.return_value.execute.return_value.data = [
+                {"ean": "1111111111111", "list_price": "10.0"},
+                {"ean": "2222222222222", "list_price": 5},
+            ]
+            processor = GaliluProcessor(test_reseller_id, db)
+            processor.product_mapping_service = Mock()
+            processor.product_mapping_service.bulk_get_ean_mappings.side_effect = \
+                lambda reseller_id, names: {name: {"Product A": "1111111111111", "Product B": "2222222222222"}[name] for name in names}
+
+            result = processor.process(tmp.name, test_batch_id)
+
+            Path(tmp.name).unlink()
+
+        assert result.successful_rows == 4
+        assert [row["sales_local_currency"] for row in result.transformed_data] == [20.0, 10.0, 20.0, 10.0]
+        products.in_.assert_called_once_with("ean", ["1111111111111", "2222222222222"])
+        products.eq.assert_not_called()
+        # Each distinct name is matched once, in bulk
+        processor.product_mapping_service.bulk_get_ean_mappings.assert_called_once()
+        assert sorted(processor.product_mapping_service.bulk_get_ean_mappings.call_args[0][1]) == ["Product A", "Product B"]
+        processor.product_mapping_service.get_ean_by_product_code.assert_not_called()
+
+    @patch("app.services.bibbi.processors.base.BibbiBseProcessor._get_reseller_sales_channel", return_value="B2B")
+    def test_reused_processor_sees_new_mappings(self, _mock_channel, test_reseller_id, test_batch_id):
+        """Test a mapping added after an upload failed to match is used by the next run of the same processor"""
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
+            wb = openpyxl.Workbook()
+            wb.active.title = "Krakow"
+            wb.active.append(["Product", "Quantity", "Month", "Year"])
+            wb.active.append(["Product A", 2, 1, 2024])
+            wb.save(tmp.name)
+            wb.close()
+
+            db = MagicMock()
+            products = db.client.table.return_value.select.return_value
+            products.in_.return_value.execute.return_value.data = [{"ean": "1111111111111", "list_price": 10}]
+            processor = GaliluProcessor(test_reseller_id, db)
+            processor.product_mapping_service = Mock()
+            processor.product_mapping_service.bulk_get_ean_mappings.return_value = {}
+            processor.product_mapping_service.get_ean_by_product_code.return_value = None
+            first = processor.process(tmp.name, test_batch_id)
+
+            processor.product_mapping_service.bulk_get_ean_mappings.return_value = {"Product A": "1111111111111"}
+            second = processor.process(tmp.name, test_batch_id)
+
+            Path(tmp.name).unlink()
+
+        assert first.successful_rows == 0
+        assert second.successful_rows == 1
+        assert second.transformed_data[0]["product_ean"] == "1111111111111"
+
+    @patch("app.services.bibbi.processors.base.BibbiBseProcessor._get_reseller_sales_channel", return_value="B2B")
+    def test_reused_processor_sees_new_prices(self, _mock_channel, test_reseller_id, test_batch_id):
+        """Test list prices are looked up again on each run of the same processor"""
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
+            wb = openpyxl.Workbook()
+            wb.active.title = "Krakow"
+            wb.active.append(["Product", "Quantity", "Month", "Year"])
+            wb.active.append(["Product A", 2, 1, 2024])
+            wb.save(tmp.name)
+            wb.close()
+
+            db = MagicMock()
+            prices = db.client.table.return_value.select.return_value.in_.return_value.execute.return_value
+            processor = GaliluProcessor(test_reseller_id, db)
+            processor.product_mapping_service = Mock()
+            processor.product_mapping_service.bulk_get_ean_mappings.return_value = {"Product A": "1111111111111"}
+
+            prices.data = [{"ean": "1111111111111", "list_price": 10}]
+            first = processor.process(tmp.name, test_batch_id)
+            prices.data = [{"ean": "1111111111111", "list_price": 12}]
+            second = processor.process(tmp.name, test_batch_id)
+
+            Path(tmp.name).unlink()
+
+        assert first.transformed_data[0]["sales_local_currency"] == 20.0
+        assert second.transformed_data[0]["sales_local_currency"] == 24.0
+
+    def test_name_mapping_logs_one_summary(self, test_reseller_id, caplog):
+        """Test bulk name mapping logs a single INFO summary, not a line per product"""
+        processor = GaliluProcessor(test_reseller_id)
+        processor.product_mapping_service = Mock()
+        processor.product_mapping_service.bulk_get_ean_mappings.return_value = {"Product A": "1111111111111"}
+
+        with caplog.at_level("INFO", logger="app.services.bibbi.processors.galilu_processor"):
+            processor._map_product_names({"Product A", "Product B"})
+
+        assert [record.getMessage() for record in caplog.records] == [
+            "Mapped 1/2 product names",
+            "Products not mapped: ['Product B']",
+        ]
+
+    @patch("app.services.bibbi.processors.base.BibbiBseProcessor._get_reseller_sales_channel", return_value="B2B")
+    def test_vectorized_path_matches_row_path(self, _mock_channel, test_reseller_id, test_batch_id):
+        """Test transform_dataframe produces the same rows and errors as transform_row"""
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
+            wb = openpyxl.Workbook()
+            ws = wb.active
+            ws.title = "Warsaw Centrum"
+            ws.append(["Product", "Quantity", "Month", "Year"])
+            ws.append([" Product A ", 2, 3, 2024])
+            ws.append(["Product B", "3", None, None])              # Undated
+            ws.append([None, 1, 1, 2024])                          # Missing name
+            ws.append(["Unknown", 1, 1, 2024])                     # Not mapped
+            ws.append(["Product A", None, 1, 2024])                # Missing quantity
+            ws.append(["Product A", "abc", 1, 2024])
+            ws.append(["Product A", 0, 1, 2024])                   # Zero quantity
+            ws.append(["Product C", 1, 1, 2024])                   # No price
+            ws.append(["Product A", 1, 13, 2024])                  # Invalid month
+            ws.append(["Product A", 1, 1, 1999])                   # Invalid year
+            ws = wb.create_sheet("Krakow")
+            ws.append(["Product", "Quantity", "Month", "Year"])
+            ws.append(["Product B", 4.5, 12, 2023])
+            wb.save(tmp.name)
+            wb.close()
+
+            db = MagicMock()
+            products = db.client.table.return_value.select.return_value
+            products.in_.return_value.execute.return_value.data = [
+                {"ean": "1111111111111", "list_price": "10.5"},
+                {"ean": "2222222222222", "list_price": 7},
+            ]
+            eans = {"Product A": "1111111111111", "Product B": "2222222222222", "Product C": "3333333333333"}
+
+            def run(vectorized):
+                processor = GaliluProcessor(test_reseller_id, db)
+                processor.VECTORIZED = vectorized
+                processor.product_mapping_service = Mock()
+                processor.product_mapping_service.bulk_get_ean_mappings.side_effect = \
+                    lambda reseller_id, names: {name: eans.get(name) for name in names}
+                return processor.process(tmp.name, test_batch_id)
+
+            vectorized = run(True)
+            row_path = run(False)
+
+            Path(tmp.name).unlink()
+
+        assert vectorized.total_rows == row_path.total_rows == 11
+        assert vectorized.successful_rows == 3
+        assert _without_timestamps(vectorized.transformed_data) == _without_timestamps(row_path.transformed_data)
+        assert vectorized.errors == row_path.errors
+        assert vectorized.stores == row_path.stores
+
 # ============================================
 # SKINS SA PROCESSOR TESTS
 # ============================================
@@ -203,6 +542,127 @@ class TestSkinsSAProcessor:
             Path(tmp.name).unlink()
 
 
+# ============================================
+# AROMATEQUE PROCESSOR TESTS
+# ============================================
+
+class TestAromatequeProcessor:
+    """Test Aromateque processor"""
+
+    @pytest.fixture
+    def processor(self, test_reseller_id):
+        return AromatequProcessor(test_reseller_id)
+
+    @patch("app.services.bibbi.processors.base.BibbiBseProcessor._get_reseller_sales_channel", return_value="B2B")
+    def test_vectorized_path_matches_row_path(self, _mock_channel, processor, test_batch_id):
+        """Test transform_dataframe produces the same rows and errors as transform_row"""
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
+            wb = openpyxl.Workbook()
+            ws = wb.active
+
+            ws.append(["EAN", "Brand", "Quantity", "Amount", "Total", "Month", "Year", "Store"])
+            ws.append(["1234567890123", None, 10, 100.50, None, 3, 2024, "Riga Mall"])
+            ws.append([None, "9876543210987.0", "(2)", "(20.5)", None, 12, 2023, "Online Shop"])
+            ws.append([None, None, 1, 5, None, 1, 2024, None])           # Missing EAN
+            ws.append(["123", None, 1, 5, None, 1, 2024, None])          # Invalid EAN
+            ws.append(["1234567890123", None, "abc", 5, None, 1, 2024, None])
+            ws.append(["1234567890123", None, 1, None, None, 1, 2024, None])
+            ws.append(["1234567890123", None, 1, 0, 7, 13, 2024, None])  # Invalid month
+            ws.append(["1234567890123", None, 2.7, 0, 7, None, None, "riga mall"])
+            ws.append(["1234567890123", None, 1, 5, None, "x", "y", None])   # Year reported first
+            ws.append(["1234567890123", None, 1, 5, None, 13, -1, None])     # Year range before month
+            ws.append(["1234567890123", None, 1, 5, None, 12.5, 2024, None])  # Truncated like int()
+
+            wb.save(tmp.name)
+            wb.close()
+
+            vectorized = processor.process(tmp.name, test_batch_id)
+            processor.VECTORIZED = False
+            row_path = processor.process(tmp.name, test_batch_id)
+
+            Path(tmp.name).unlink()
+
+        assert vectorized.total_rows == row_path.total_rows == 11
+        assert vectorized.successful_rows == 4
+        assert _without_timestamps(vectorized.transformed_data) == _without_timestamps(row_path.transformed_data)
+        assert vectorized.errors == row_path.errors
+        assert vectorized.stores == row_path.stores
+
+    @patch("app.services.bibbi.processors.base.BibbiBseProcessor._get_reseller_sales_channel", return_value="B2B")
+    def test_compiled_transformer_keeps_fallback_semantics(self, _mock_channel, processor, test_batch_id):
+        """Test the per-file transformer treats falsy cells like the `or` chains did"""
+        transform = processor.compile_transformer(["Brand", "Qty", "Amount", "Location"])
+
+        row, error = transform({"Brand": "1234567890123", "Qty": 0, "Amount": 5, "Location": "Riga Mall"}, test_batch_id)
+        assert row is None and error == "Missing Quantity"
+
+        row, error = transform({"Brand": "1234567890123", "Qty": 2, "Amount": 5, "Location": "Riga Mall"}, test_batch_id)
+        assert error is None
+        assert (row["product_ean"], row["quantity"], row["store_identifier"]) == ("1234567890123", 2, "riga_mall")
+
+    @patch("app.services.bibbi.processors.base.BibbiBseProcessor._get_reseller_sales_channel", return_value="B2B")
+    def test_store_fallback_does_not_reopen_workbook(self, _mock_channel, processor, test_batch_id):
+        """Test stores come from the streamed rows, not a second workbook pass"""
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
+            wb = openpyxl.Workbook()
+            ws = wb.active
+            ws.append(["EAN", "Quantity", "Amount", "Month", "Year"])
+            ws.append(["1234567890123", 1, 5, 1, 2024])
+            wb.save(tmp.name)
+            wb.close()
+
+            with patch.object(processor, "_load_workbook", wraps=processor._load_workbook) as load:
+                result = super(AromatequProcessor, processor).process(tmp.name, test_batch_id)
+
+            Path(tmp.name).unlink()
+
+        assert result.stores == [processor._main_store()]
+        assert load.call_count <= 1
+
+
+# ============================================
+# CDLC PROCESSOR TESTS
+# ============================================
+
+class TestCDLCProcessor:
+    """Test CDLC processor"""
+
+    @pytest.fixture
+    def processor(self, test_reseller_id):
+        return CDLCProcessor(test_reseller_id)
+
+    @patch("app.services.bibbi.processors.base.BibbiBseProcessor._get_reseller_sales_channel", return_value="B2B")
+    def test_vectorized_path_matches_row_path(self, _mock_channel, processor, test_batch_id):
+        """Test transform_dataframe produces the same rows and errors as transform_row"""
+        with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
+            wb = openpyxl.Workbook()
+            ws = wb.active
+            ws.append(["Store", "EAN", "Product EAN", "Quantity", "Qty", "Total", "Amount", "Month", "Year"])
+            ws.append(["Riga Mall", "1234567890123", None, 10, None, 100.50, None, 3, 2024])
+            ws.append([None, None, 9876543210987, 0, "(2)", None, "20.5", None, None])
+            ws.append(["E-shop", "1234567890123", None, 1, None, 5, None, 13, 2024])  # Invalid month
+            ws.append([None, "1234567890123", None, 1, None, 5, None, 2, -1])         # Invalid year
+            ws.append([None, "123", None, 1, None, 5, None, 1, 2024])
+            ws.append([None, None, None, 1, None, 5, None, 1, 2024])
+            ws.append([None, "1234567890123", None, None, None, 5, None, 1, 2024])
+            ws.append([None, "1234567890123", None, 1, None, None, None, 1, 2024])
+            ws.append([None, "1234567890123", None, 1, None, "bad", None, "x", 2024])
+            wb.save(tmp.name)
+            wb.close()
+
+            vectorized = processor.process(tmp.name, test_batch_id)
+            processor.VECTORIZED = False
+            row_path = processor.process(tmp.name, test_batch_id)
+
+            Path(tmp.name).unlink()
+
+        assert vectorized.total_rows == row_path.total_rows == 9
+        assert vectorized.successful_rows == 2
+        assert _without_timestamps(vectorized.transformed_data) == _without_timestamps(row_path.transformed_data)
+        assert vectorized.errors == row_path.errors
+        assert [s["store_identifier"] for s in vectorized.stores] == ["riga_mall", "e-shop"]
+
+
 # ============================================
 # VALIDATION TESTS (ALL PROCESSORS)
 # ============================================
@@ -410,8 +870,8 @@ class TestLibertyProcessor:
         raw_row = {
             "Item ID | Colour": "000834429 | 98-NO COLOUR",
             "Item": "Test Product",
-            "Sales Qty Un": 10,
-            "Sales Inc VAT £ ": 150.50,
+            "_qty": 10,
+            "_sales_gbp": 150.50,
             "store_identifier": "flagship",
             "_file_date": datetime(2024, 1, 15)
         }
@@ -471,8 +931,8 @@ class TestLibertyProcessor:
         raw_row = {
             "Item ID | Colour": "000834429 | 98-NO COLOUR",
             "Item": "Test Product",
-            "Sales Qty Un": 10,
-            "Sales Inc VAT £ ": 150.50,
+            "_qty": 10,
+            "_sales_gbp": 150.50,
             "store_identifier": "flagship",
             "_file_date": datetime(2024, 1, 15)
         }
@@ -501,8 +961,8 @@ class TestLibertyProcessor:
         raw_row = {
             "Item ID | Colour": "000834429 | 98-NO COLOUR",
             "Item": "Test Product",
-            "Sales Qty Un": -5,  # Return
-            "Sales Inc VAT £ ": -75.25,
+            "_qty": -5,  # Return
+            "_sales_gbp": -75.25,
             "store_identifier": "flagship",
             "_file_date": datetime(2024, 1, 15)
         }
@@ -512,3 +972,279 @@ class TestLibertyProcessor:
         # Verify return flags
         assert result["is_return"] is True
         assert result["quantity"] == -5  # Negative quantity indicates return
+
+
+def _write_liberty_workbook(path, products):
+    """
+    Write a Liberty-shaped report: 3 header rows, then one 3-row block per
+    product (description row, blank row, "<id> | <colour> Total" data row)
+
+    products: (description, liberty_name, (flagship qty, sales), (internet qty, sales))
+    """
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(["Retail Group", "Brand", "Colour Phase", "Product Group", "Item ID | Colour", "Item",
+               "All Sales Channels", None, "Flagship", None, None, None, "Internet", None, None, None])
+    ws.append([None] * 6 + ["Actual", None, "Actual", None, "YTD", None, "Actual", None, "YTD", None])
+    ws.append([None] * 4 + ["Item ID | Colour", "Item"] + ["Sales Qty Un", "Sales Inc VAT £ "] * 5)
+    for description, liberty_name, flagship, internet in products:
+        ws.append(["Liberty", "BIBBI", None, "Fragrance", None, description])
+        ws.append([])
+        ws.append([None] * 5 + [liberty_name, 99, 999.0, *flagship, 99, 999.0, *internet, 99, 999.0])
+    wb.save(path)
+    wb.close()
+
+
+class TestLibertyExtraction:
+    """Test Liberty report parsing (3-row header, 3-row product blocks, one record per store)"""
+
+    PRODUCTS = [
+        ("Rose Eau de Parfum", "000834429 | 98-NO COLOUR Total", (2, 30.0), (None, None)),
+        ("Oud Candle", "000834430 | 98-NO COLOUR Total", (1, 10.0), ("(1)", "(15.50)")),
+        ("Subtotal line", "BIBBI Total", (5, 50.0), (5, 50.0)),
+    ]
+
+    @pytest.fixture(autouse=True)
+    def fresh_product_cache(self):
+        LibertyProcessor.invalidate_product_cache()
+        yield
+        LibertyProcessor.invalidate_product_cache()
+
+    @pytest.fixture
+    def supabase(self):
+        client = MagicMock()
+        client.table.return_value.select.return_value.in_.return_value.execute.return_value.data = [
+            {"liberty_name": "000834429 | 98-NO COLOUR Total", "ean": "1234567890123", "functional_name": "ROSE EDP"}
+        ]
+        return client
+
+    @pytest.fixture
+    def liberty_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = str(Path(tmp_dir) / "Continuity Supplier Size Report 27-04-2025.xlsx")
+            _write_liberty_workbook(path, self.PRODUCTS)
+            yield path
+
+    def test_extract_rows_one_record_per_store_with_data(self, supabase, liberty_file, test_reseller_id):
+        """Test each product block yields a record per store with Actual qty/sales, skipping non-product rows"""
+        processor = LibertyProcessor(test_reseller_id, supabase)
+        rows = list(processor.extract_rows(liberty_file))
+
+        assert [(row["liberty_name"], row["store_identifier"], row["_qty"], row["_sales_gbp"]) for row in rows] == [
+            ("000834429 | 98-NO COLOUR Total", "flagship", 2, 30.0),
+            ("000834430 | 98-NO COLOUR Total", "flagship", 1, 10.0),
+            ("000834430 | 98-NO COLOUR Total", "internet", "(1)", "(15.50)"),
+        ]
+        assert rows[0]["Item"] == "Rose Eau de Parfum"
+        assert "_file_date" not in rows[0]
+        assert processor._current_file_date == date(2025, 4, 27)
+
+    def test_extract_rows_resyncs_after_stray_rows(self, supabase, test_reseller_id):
+        """Test blocks are found one row at a time after stray rows, and a trailing partial block is ignored"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = str(Path(tmp_dir) / "27_04_2025.xlsx")
+            _write_liberty_workbook(path, self.PRODUCTS[:1])
+            wb = openpyxl.load_workbook(path)
+            ws = wb.active
+            ws.insert_rows(4, amount=2)
+            ws["F4"] = "Brand header"
+            ws.append(["Liberty", "BIBBI", None, "Fragrance", None, "Cut off"])
+            ws.append([])
+            wb.save(path)
+            wb.close()
+
+            rows = list(LibertyProcessor(test_reseller_id, supabase).extract_rows(path))
+
+        assert [(row["liberty_name"], row["store_identifier"]) for row in rows] == [
+            ("000834429 | 98-NO COLOUR Total", "flagship"),
+        ]
+
+    @patch("app.services.bibbi.processors.base.BibbiBseProcessor._get_reseller_sales_channel", return_value="B2B")
+    def test_vectorized_path_matches_row_path(self, _mock_channel, supabase, test_reseller_id, test_batch_id):
+        """Test transform_dataframe produces the same rows, skips and errors as transform_row"""
+        products = [
+            ("Rose", "000834429 | 98-NO COLOUR Total", (2, 30.0), ("(1)", "(15.50)")),
+            ("Unmatched", "000834430 | 98-NO COLOUR Total", (3.7, "12"), (None, 5.0)),  # Internet: no quantity
+            ("Zero", "000834431 | 98-NO COLOUR Total", (0, 9.0), ("abc", 1.0)),
+            ("No sales", "000834432 | 98-NO COLOUR Total", (1, ""), (1, "n/a")),
+        ]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = str(Path(tmp_dir) / "27_04_2025.xlsx")
+            _write_liberty_workbook(path, products)
+
+            def run(vectorized):
+                processor = LibertyProcessor(test_reseller_id, supabase)
+                processor.VECTORIZED = vectorized
+                return processor, processor.process(path, test_batch_id)
+
+            vectorized_processor, vectorized = run(True)
+            row_processor, row_path = run(False)
+
+        assert vectorized.total_rows == row_path.total_rows == 8
+        assert vectorized.successful_rows == 3
+        assert _without_timestamps(vectorized.transformed_data) == _without_timestamps(row_path.transformed_data)
+        assert vectorized.errors == row_path.errors
+        assert vectorized_processor.unmatched_liberty_names == row_processor.unmatched_liberty_names
+        assert {(row["customer_id"], row["country"], row["upload_id"]) for row in row_path.transformed_data} == {
+            (None, "UK", test_batch_id)
+        }
+
+    @patch("app.services.bibbi.processors.base.BibbiBseProcessor._get_reseller_sales_channel", return_value="B2B")
+    def test_unmatched_names_counted_once_per_name(self, _mock_channel, supabase, test_reseller_id, test_batch_id, caplog):
+        """Test repeat misses bump a count instead of growing a list, and process() reports them"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = str(Path(tmp_dir) / "27_04_2025.xlsx")
+            _write_liberty_workbook(path, self.PRODUCTS[1:2] * 3)
+
+            processor = LibertyProcessor(test_reseller_id, supabase)
+            with caplog.at_level("WARNING", logger="app.services.bibbi.processors.liberty_processor"):
+                processor.process(path, test_batch_id)
+
+        assert processor.unmatched_liberty_names == {"000834430 | 98-NO COLOUR Total": 6}
+        assert [record.getMessage() for record in caplog.records] == [
+            "Liberty names not found in products table - Total unmatched: 6, Unique unmatched: 1\n"
+            "  - 000834430 | 98-NO COLOUR Total"
+        ]
+
+    @patch("app.services.bibbi.processors.base.BibbiBseProcessor._get_reseller_sales_channel", return_value="B2B")
+    def test_unmatched_names_reported_per_run(self, _mock_channel, supabase, test_reseller_id, test_batch_id, caplog):
+        """Test a reused processor reports only the current file's unmatched names"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            first_path = str(Path(tmp_dir) / "27_04_2025.xlsx")
+            second_path = str(Path(tmp_dir) / "04_05_2025.xlsx")
+            _write_liberty_workbook(first_path, self.PRODUCTS[1:2])
+            _write_liberty_workbook(second_path, [("Other", "000834431 | 98-NO COLOUR Total", (1, 10.0), (1, 10.0))])
+
+            processor = LibertyProcessor(test_reseller_id, supabase)
+            with caplog.at_level("WARNING", logger="app.services.bibbi.processors.liberty_processor"):
+                processor.process(first_path, test_batch_id)
+                caplog.clear()
+                processor.process(second_path, test_batch_id)
+
+        assert processor.unmatched_liberty_names == {"000834431 | 98-NO COLOUR Total": 2}
+        assert [record.getMessage() for record in caplog.records] == [
+            "Liberty names not found in products table - Total unmatched: 2, Unique unmatched: 1\n"
+            "  - 000834431 | 98-NO COLOUR Total"
+        ]
+
+    def test_missing_columns_and_file_date_warned_once(self, supabase, test_reseller_id, caplog):
+        """Test per-file warnings are logged once, not once per product row"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = str(Path(tmp_dir) / "report.xlsx")
+            _write_liberty_workbook(path, self.PRODUCTS * 2)
+            wb = openpyxl.load_workbook(path)
+            wb.active.cell(row=3, column=13).value = None  # Internet "Actual" quantity header
+            wb.save(path)
+            wb.close()
+
+            with caplog.at_level("WARNING", logger="app.services.bibbi.processors.liberty_processor"):
+                rows = list(LibertyProcessor(test_reseller_id, supabase).extract_rows(path))
+
+        assert {row["store_identifier"] for row in rows} == {"flagship"}
+        messages = [record.getMessage() for record in caplog.records]
+        assert messages == [
+            f"Could not extract date from filename: {path}",
+            "No file date found, using current date",
+            "Store 'internet' missing columns (qty_col: None, sales_col: 13) - skipping",
+        ]
+
+    def test_products_queried_for_file_names_only(self, supabase, liberty_file, test_reseller_id):
+        """Test products are looked up for the file's Liberty names, once across processors until invalidated"""
+        products = supabase.table.return_value.select.return_value
+
+        first = LibertyProcessor(test_reseller_id, supabase)
+        list(first.extract_rows(liberty_file))
+        products.in_.assert_called_once_with(
+            "liberty_name", ["000834429 | 98-NO COLOUR Total", "000834430 | 98-NO COLOUR Total"]
+        )
+        assert first.liberty_products == {
+            "000834429 | 98-NO COLOUR Total": {"ean": "1234567890123", "functional_name": "ROSE EDP"}
+        }
+
+        # Matches and misses are both cached: a second processor queries nothing
+        second = LibertyProcessor(test_reseller_id, supabase)
+        list(second.extract_rows(liberty_file))
+        assert products.in_.call_count == 1
+        assert second.liberty_products == first.liberty_products
+
+        LibertyProcessor.invalidate_product_cache(test_reseller_id)
+        list(LibertyProcessor(test_reseller_id, supabase).extract_rows(liberty_file))
+        assert products.in_.call_count == 2
+
+    def test_failed_products_query_not_cached(self, supabase, liberty_file, test_reseller_id):
+        """Test a failed lookup leaves names unmatched without caching them, so the next file retries"""
+        query = supabase.table.return_value.select.return_value.in_.return_value
+        query.execute.side_effect = [Exception("timeout"), query.execute.return_value]
+
+        processor = LibertyProcessor(test_reseller_id, supabase)
+        list(processor.extract_rows(liberty_file))
+        assert processor.liberty_products == {}
+
+        list(processor.extract_rows(liberty_file))
+        assert len(processor.liberty_products) == 1
+
+    def test_calamine_rows_match_openpyxl_rows(self, supabase, liberty_file, test_reseller_id):
+        """Test python-calamine and openpyxl read the same records, with an empty first column kept in place"""
+        pytest.importorskip("python_calamine")
+        wb = openpyxl.load_workbook(liberty_file)
+        for (cell,) in wb.active.iter_rows(max_col=1):
+            cell.value = None
+        wb.save(liberty_file)
+        wb.close()
+
+        with patch("app.services.bibbi.processors.liberty_processor.CalamineWorkbook", None):
+            expected = list(LibertyProcessor(test_reseller_id, supabase).extract_rows(liberty_file))
+        rows = list(LibertyProcessor(test_reseller_id, supabase).extract_rows(liberty_file))
+
+        assert len(expected) == 3
+        assert rows == expected
+
+    def test_extract_stores_from_store_column(self, supabase, test_reseller_id):
+        """Test a Store column yields each store once, in order of first appearance"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = str(Path(tmp_dir) / "stores.xlsx")
+            wb = openpyxl.Workbook()
+            wb.active.append(["Item", None, " Store ", "Shop"])
+            for row in (["A", 1, "Flagship", "x"], [], ["B", 2, " flagship ", "y"], ["C", 3, "Online Shop", None], ["D", 4, 0, None]):
+                wb.active.append(row)
+            wb.save(path)
+            wb.close()
+
+            stores = LibertyProcessor(test_reseller_id, supabase).extract_stores(path)
+
+        assert [(s["store_identifier"], s["store_name"], s["store_type"]) for s in stores] == [
+            ("flagship", "Liberty Flagship", "physical"),
+            ("online shop", "Liberty Online Shop", "online"),
+        ]
+
+    def test_extract_stores_defaults_without_store_column(self, supabase, liberty_file, test_reseller_id):
+        """Test multi-store-column reports get the Flagship and Internet stores"""
+        stores = LibertyProcessor(test_reseller_id, supabase).extract_stores(liberty_file)
+
+        assert [s["store_identifier"] for s in stores] == ["flagship", "internet"]
+
+    @patch("app.services.bibbi.processors.base.BibbiBseProcessor._get_reseller_sales_channel", return_value="B2B")
+    def test_process_opens_workbook_once(self, _mock_channel, supabase, liberty_file, test_reseller_id, test_batch_id):
+        """Test rows and stores of one process() run share a single workbook read"""
+        processor = LibertyProcessor(test_reseller_id, supabase)
+        with patch.object(processor, "_sheet_rows", wraps=processor._sheet_rows) as sheet_rows:
+            result = processor.process(liberty_file, test_batch_id)
+
+        assert sheet_rows.call_count == 1
+        assert [s["store_identifier"] for s in result.stores] == ["flagship", "internet"]
+
+    def test_parse_once_shares_workbook_between_extract_calls(self, supabase, liberty_file, test_reseller_id):
+        """Test extract_stores() and extract_rows() called directly share one read inside parse_once()"""
+        processor = LibertyProcessor(test_reseller_id, supabase)
+        with patch.object(processor, "_sheet_rows", wraps=processor._sheet_rows) as sheet_rows:
+            with processor.parse_once():
+                stores = processor.extract_stores(liberty_file)
+                rows = list(processor.extract_rows(liberty_file))
+            assert sheet_rows.call_count == 1
+
+            # Outside the block every call reads the file again
+            processor.extract_stores(liberty_file)
+            assert sheet_rows.call_count == 2
+
+        assert [s["store_identifier"] for s in stores] == ["flagship", "internet"]
+        assert len(rows) == 3
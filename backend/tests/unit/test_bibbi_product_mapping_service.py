@@ -0,0 +1,185 @@
+"""
+Unit tests for BIBBI Product Mapping Service
+
+Tests product code → EAN matching:
+- Exact matching before fuzzy matching
+- Bulk mapping with exact matches queried by code and one paged mappings load
+
+Tests: backend/app/services/bibbi/product_mapping_service.py
+"""
+
+import pytest
+from unittest.mock import Mock
+
+from app.services.bibbi.product_mapping_service import BibbιProductMappingService
+
+
+# ============================================
+# FIXTURES
+# ============================================
+
+MAPPINGS = [
+    {"reseller_product_code": "rose body lotion", "product_id": "1111111111111"},
+    {"reseller_product_code": "rose hand cream", "product_id": "2222222222222"},
+]
+
+
+@pytest.fixture
+def mock_bibbi_db():
+    """Mock BIBBI database client returning MAPPINGS for every query"""
+    mock_db = Mock()
+    mock_db.table = Mock(return_value=mock_db)
+    mock_db.select = Mock(return_value=mock_db)
+    mock_db.eq = Mock(return_value=mock_db)
+    mock_db.in_ = Mock(return_value=mock_db)
+    mock_db.order = Mock(return_value=mock_db)
+    mock_db.range = Mock(return_value=mock_db)
+    mock_db.execute = Mock(return_value=Mock(data=MAPPINGS))
+    return mock_db
+
+
+@pytest.fixture
+def mapping_service(mock_bibbi_db):
+    """Product mapping service instance"""
+    return BibbιProductMappingService(mock_bibbi_db)
+
+
+# ============================================
+# BULK MAPPING TESTS
+# ============================================
+
+class TestBulkGetEanMappings:
+    """Test bulk_get_ean_mappings()"""
+
+    def test_loads_mappings_once(self, mapping_service, mock_bibbi_db):
+        """Test exact, fuzzy and missing codes resolve from one exact query and one mappings load"""
+        result = mapping_service.bulk_get_ean_mappings(
+            "reseller-1",
+            ["Rose Body Lotion", "ROSE  BODY LOTION", "Rose Hand Creme", "Unknown"]
+        )
+
+        assert result == {
+            "Rose Body Lotion": "1111111111111",
+            "ROSE  BODY LOTION": "1111111111111",
+            "Rose Hand Creme": "2222222222222",
+            "Unknown": None,
+        }
+        assert mock_bibbi_db.execute.call_count == 2
+        mock_bibbi_db.in_.assert_called_once_with(
+            "reseller_product_code", ["rose body lotion", "rose hand creme", "unknown"]
+        )
+
+    def test_exact_match_skips_fuzzy(self, mapping_service, mock_bibbi_db):
+        """Test codes with an exact mapping never reach similarity scoring or the full mappings load"""
+        mapping_service._calculate_similarity = Mock(side_effect=AssertionError("fuzzy matching used"))
+
+        assert mapping_service.bulk_get_ean_mappings("reseller-1", ["rose hand cream"]) == {
+            "rose hand cream": "2222222222222"
+        }
+        mock_bibbi_db.range.assert_not_called()
+
+    def test_exact_matches_queried_in_chunks(self, mapping_service, mock_bibbi_db):
+        """Test exact lookups send at most EXACT_LOOKUP_CHUNK codes per query"""
+        mapping_service.EXACT_LOOKUP_CHUNK = 1
+        mock_bibbi_db.execute = Mock(side_effect=lambda: Mock(
+            data=[m for m in MAPPINGS if m["reseller_product_code"] == mock_bibbi_db.in_.call_args[0][1][0]]
+        ))
+
+        assert mapping_service.bulk_get_ean_mappings("reseller-1", ["Rose Body Lotion", "Rose Hand Cream"]) == {
+            "Rose Body Lotion": "1111111111111",
+            "Rose Hand Cream": "2222222222222",
+        }
+        assert mock_bibbi_db.in_.call_count == 2
+
+    def test_active_mappings_read_in_pages(self, mapping_service, mock_bibbi_db):
+        """Test mappings past the first page are loaded for fuzzy matching"""
+        mapping_service.MAPPINGS_PAGE_SIZE = 1
+        pages = iter([[], MAPPINGS[:1], MAPPINGS[1:], []])
+        mock_bibbi_db.execute = Mock(side_effect=lambda: Mock(data=next(pages)))
+
+        assert mapping_service.bulk_get_ean_mappings("reseller-1", ["Rose Hand Creme"]) == {
+            "Rose Hand Creme": "2222222222222"
+        }
+        assert [c.args for c in mock_bibbi_db.range.call_args_list] == [(0, 0), (1, 1), (2, 2)]
+
+
+
+# ============================================
+# SIMILARITY TESTS
+# ============================================
+
+class TestSimilarity:
+    """Test fuzzy scoring (rapidfuzz Indel ratio)"""
+
+    def test_similarity_bounds(self, mapping_service):
+        """Test identical strings score 1.0 (case-insensitive) and disjoint ones 0.0"""
+        assert mapping_service._calculate_similarity("Rose Lotion", "rose lotion") == 1.0
+        assert mapping_service._calculate_similarity("abc", "xyz") == 0.0
+
+    def test_fuzzy_threshold(self, mapping_service):
+        """Test near spellings pass FUZZY_MATCH_THRESHOLD and unrelated names do not"""
+        assert mapping_service._best_fuzzy_match("rose hand creme", MAPPINGS) is MAPPINGS[1]
+        assert mapping_service._best_fuzzy_match("violet soap", MAPPINGS) is None
+
+    def test_indel_scoring(self, mapping_service):
+        """Test scores are 2 * LCS / total length, so a swapped word pair can still reach the threshold"""
+        # Common subsequence of 17 chars: 2 * 17 / 40 (difflib's block matching gave 0.80)
+        assert mapping_service._calculate_similarity("Rose Oud Body Lotion", "rose body oud lotion") == pytest.approx(0.85)
+
+        swapped = [{"reseller_product_code": "rose body oud lotion", "product_id": "3333333333333"}]
+        assert mapping_service._best_fuzzy_match("rose oud body lotion", swapped) is swapped[0]
+
+
+# ============================================
+# PERSISTENT CACHE TESTS
+# ============================================
+
+class TestPersistentCache:
+    """Test matches kept on disk across service instances"""
+
+    def test_matches_survive_new_service(self, mock_bibbi_db, tmp_path):
+        """Test a second service reads earlier matches from disk without querying"""
+        cache_path = str(tmp_path / "mappings.sqlite")
+        BibbιProductMappingService(mock_bibbi_db, cache_path=cache_path).bulk_get_ean_mappings(
+            "reseller-1", ["Rose Body Lotion", "Unknown"]
+        )
+
+        empty_db = Mock()
+        empty_db.table = Mock(return_value=empty_db)
+        empty_db.select = Mock(return_value=empty_db)
+        empty_db.eq = Mock(return_value=empty_db)
+        empty_db.in_ = Mock(return_value=empty_db)
+        empty_db.order = Mock(return_value=empty_db)
+        empty_db.range = Mock(return_value=empty_db)
+        empty_db.execute = Mock(return_value=Mock(data=[]))
+        service = BibbιProductMappingService(empty_db, cache_path=cache_path)
+
+        assert service.get_ean_by_product_code("reseller-1", "rose body lotion") == "1111111111111"
+        empty_db.execute.assert_not_called()
+        # Misses are not persisted
+        assert service.get_ean_by_product_code("reseller-1", "Unknown") is None
+        assert empty_db.execute.called
+
+    def test_clear_cache_empties_disk(self, mock_bibbi_db, tmp_path):
+        """Test clear_cache() also drops the on-disk entries"""
+        cache_path = str(tmp_path / "mappings.sqlite")
+        service = BibbιProductMappingService(mock_bibbi_db, cache_path=cache_path)
+        service.bulk_get_ean_mappings("reseller-1", ["Rose Body Lotion"])
+        service.clear_cache()
+
+        assert BibbιProductMappingService(mock_bibbi_db, cache_path=cache_path)._cached_ean(
+            "reseller-1:rose body lotion"
+        ) is None
+
+    def test_eviction_keeps_most_recent(self, tmp_path):
+        """Test the cache trims to max_entries, dropping least recently used keys"""
+        from app.services.bibbi.product_mapping_service import PersistentMappingCache
+
+        cache = PersistentMappingCache(str(tmp_path / "mappings.sqlite"), max_entries=2)
+        cache.EVICT_EVERY = 1
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+
+        assert (cache.get("a"), cache.get("b"), cache.get("c")) == ("1", None, "3")
@@ -530,3 +530,80 @@ class TestStoreCaching:
         # Verify store lookup only called ONCE (second call used cache)
         assert mock_bibbi_db.client.execute.call_count == 1
         assert "store-uuid-persistent" in insertion_service._store_cache
+
+
+# ============================================
+# DUPLICATE ISOLATION TESTS
+# ============================================
+
+class TestDuplicateIsolation:
+    """Test batches with duplicates are split instead of inserted row by row"""
+
+    def test_duplicate_batch_is_bisected(self, insertion_service, mock_bibbi_db):
+        """Test one duplicate costs a few bulk inserts, not one request per row"""
+        duplicate_ean = "0000000000042"
+        insert_sizes = []
+
+        def insert(payload):
+            rows = payload if isinstance(payload, list) else [payload]
+            insert_sizes.append(len(rows))
+
+            def execute():
+                if any(row["product_ean"] == duplicate_ean for row in rows):
+                    raise Exception("duplicate key value violates unique constraint")
+                return Mock(data=rows)
+
+            return Mock(execute=execute)
+
+        mock_bibbi_db.insert = Mock(side_effect=insert)
+
+        validated_data = [
+            {"product_ean": f"{i:013d}", "sale_date": "2025-01-10", "quantity": 1}
+            for i in range(100)
+        ]
+
+        result = insertion_service.insert_validated_sales(validated_data=validated_data)
+
+        assert result.inserted_rows == 99
+        assert result.duplicate_rows == 1
+        assert result.failed_rows == 0
+        assert len(insert_sizes) < 40  # Row-by-row fallback would issue 101 inserts
+
+
+# ============================================
+# STREAMED BATCH TESTS
+# ============================================
+
+class TestInsertSalesBatches:
+    """Test insert_sales_batches() consumes chunks lazily, one insert each"""
+
+    def test_one_insert_per_chunk(self, insertion_service, mock_bibbi_db):
+        """Test each chunk is one bulk insert and row numbers continue across chunks"""
+        insert_sizes = []
+
+        def insert(payload):
+            insert_sizes.append(len(payload))
+
+            def execute():
+                if any(row["product_ean"] == "0000000000004" for row in payload):
+                    raise Exception("connection reset")
+                return Mock(data=payload)
+
+            return Mock(execute=execute)
+
+        mock_bibbi_db.insert = Mock(side_effect=insert)
+
+        def chunks():
+            for start in range(0, 9, 3):
+                yield [
+                    {"product_ean": f"{i:013d}", "sale_date": "2025-01-10", "quantity": 1}
+                    for i in range(start, start + 3)
+                ]
+
+        result = insertion_service.insert_sales_batches(chunks())
+
+        assert insert_sizes == [3, 3, 3]
+        assert result.total_rows == 9
+        assert result.inserted_rows == 6
+        assert result.failed_rows == 3
+        assert [error["row_number"] for error in result.errors] == [4, 5, 6]
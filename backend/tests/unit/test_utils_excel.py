@@ -14,6 +14,7 @@ from app.utils.excel import (
     extract_rows_from_sheet,
     safe_load_workbook,
     find_sheet_by_name,
+    match_sheet_name,
     get_sheet_headers,
     validate_required_headers,
     count_data_rows
@@ -158,6 +159,19 @@ class TestFindSheetByName:
         with pytest.raises(ValueError):
             find_sheet_by_name(multi_sheet_workbook, "sales data", fallback_to_first=False)
 
+    def test_case_insensitive_matching(self, multi_sheet_workbook):
+        """Test case_insensitive=True finds sheets whose name differs only by case"""
+        sheet = find_sheet_by_name(multi_sheet_workbook, "sales DATA", case_insensitive=True)
+        assert sheet.title == "Sales Data"
+
+    def test_match_sheet_name(self):
+        """Test match_sheet_name() prefers exact matches and returns the workbook's spelling"""
+        names = ["Summary", "Sell Out by EAN", "SELL OUT BY EAN"]
+        assert match_sheet_name(names, "SELL OUT BY EAN") == "SELL OUT BY EAN"
+        assert match_sheet_name(names, "sell out by ean") == "Sell Out by EAN"
+        assert match_sheet_name(names, "sell out by ean", case_insensitive=False) is None
+        assert match_sheet_name(names, "Missing") is None
+
 
 # ============================================
 # GET SHEET HEADERS TESTS
@@ -0,0 +1,87 @@
+"""
+Unit tests for app/utils/frames.py
+
+Tests the column-wise counterparts of the shared validation utilities.
+"""
+
+import pandas as pd
+
+from app.utils.frames import (
+    RowErrors,
+    first_truthy,
+    is_ean13,
+    month_start,
+    normalize_ean,
+    normalize_store,
+    quarter,
+    to_number,
+    truncate_to_int,
+    truthy
+)
+from app.utils.validation import validate_ean, to_int, QUARTER_BY_MONTH
+
+
+# ============================================
+# CONVERSION TESTS
+# ============================================
+
+class TestColumnConversions:
+    """Test column helpers match their row-level counterparts"""
+
+    def test_first_truthy_matches_or_chain(self):
+        """Test first_truthy() picks values like `row.get(a) or row.get(b)`"""
+        df = pd.DataFrame({"a": [None, "", 0, "x"], "b": [1, None, "", 2]}, dtype=object)
+        expected = [row["a"] or row["b"] for row in df.to_dict("records")]
+        assert first_truthy(df, "a", "b").tolist() == expected
+
+    def test_truthy_mask(self):
+        """Test truthy() treats None, empty string and 0 as missing"""
+        assert truthy(pd.Series(["a", "", None, 0, 5], dtype=object)).tolist() == [True, False, False, False, True]
+
+    def test_to_number_handles_accounting_notation(self):
+        """Test to_number() parses "(12)" as -12 and flags non-numeric cells"""
+        numbers = to_number(pd.Series(["(12)", " 3 ", "abc", None, 2.5], dtype=object))
+        assert numbers[:2].tolist() == [-12.0, 3.0]
+        assert numbers[2:4].isna().all()
+        assert numbers[4] == 2.5
+
+    def test_truncate_to_int_matches_to_int(self):
+        """Test truncate_to_int() truncates toward zero like int(float(x))"""
+        values = [2.9, -2.9, "7", "(3)"]
+        expected = [to_int(v if v != "(3)" else "-3", "Quantity") for v in values]
+        assert truncate_to_int(to_number(pd.Series(values, dtype=object))).tolist() == expected
+
+    def test_ean_normalization_matches_validate_ean(self):
+        """Test normalize_ean()/is_ean13() agree with validate_ean()"""
+        values = ["1234567890123", 1234567890123.0, " 9876543210987 ", "123", "abc"]
+        expected = [validate_ean(v, strict=False) for v in values]
+        eans = normalize_ean(pd.Series(values, dtype=object))
+        assert eans.where(is_ean13(eans), None).tolist() == expected
+
+    def test_month_start_and_store_normalization(self):
+        """Test month_start() ISO dates and normalize_store() identifiers"""
+        assert month_start(pd.Series([2024, 999]), pd.Series([3, 12])).tolist() == ["2024-03-01", "0999-12-01"]
+        stores = normalize_store(pd.Series([" Riga Mall ", None, ""], dtype=object), "main")
+        assert stores.tolist() == ["riga_mall", "main", "main"]
+
+
+    def test_quarter_matches_lookup_table(self):
+        """Test quarter() agrees with QUARTER_BY_MONTH for every month"""
+        months = pd.Series(range(1, 13))
+        assert quarter(months).tolist() == list(QUARTER_BY_MONTH[1:])
+
+# ============================================
+# ROW ERROR TESTS
+# ============================================
+
+class TestRowErrors:
+    """Test RowErrors keeps the first failing check per row"""
+
+    def test_first_error_wins(self):
+        """Test later checks do not overwrite earlier messages"""
+        errors = RowErrors(pd.RangeIndex(3))
+        errors.add(pd.Series([True, False, False]), "first")
+        errors.add(pd.Series([True, True, False]), pd.Series(["a", "b", "c"]))
+
+        assert errors.messages.tolist()[:2] == ["first", "b"]
+        assert errors.ok.tolist() == [False, False, True]
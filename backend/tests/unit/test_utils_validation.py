@@ -11,8 +11,10 @@ from app.utils.validation import (
     validate_year,
     to_int,
     to_float,
-    to_string
+    to_string,
+    parse_date
 )
+from datetime import datetime
 
 
 # ============================================
@@ -369,6 +371,32 @@ class TestToString:
         assert to_string("\thello\n") == "hello"
 
 
+# ============================================
+# DATE PARSING TESTS
+# ============================================
+
+class TestParseDate:
+    """Test date string parsing utility"""
+
+    def test_supported_formats(self):
+        """Test each supported format parses"""
+        assert parse_date("2024-03-15") == datetime(2024, 3, 15)
+        assert parse_date("15/03/2024") == datetime(2024, 3, 15)
+        assert parse_date("15-03-2024") == datetime(2024, 3, 15)
+        assert parse_date("2024-3-5") == datetime(2024, 3, 5)
+
+    def test_day_first_preferred(self):
+        """Test ambiguous slash dates are day-first, falling back to month-first"""
+        assert parse_date("01/02/2024") == datetime(2024, 2, 1)
+        assert parse_date("12/31/2024") == datetime(2024, 12, 31)
+
+    def test_invalid_dates_raise(self):
+        """Test unsupported or impossible dates raise ValueError"""
+        for value in ["March 2024", "2024/03/15", "2024-02-30", "31/31/2024", ""]:
+            with pytest.raises(ValueError, match="Invalid date format"):
+                parse_date(value)
+
+
 # ============================================
 # EDGE CASES & INTEGRATION TESTS
 # ============================================